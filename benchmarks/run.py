@@ -0,0 +1,331 @@
+"""Headless microbenchmarks for LightRunner's hot paths.
+
+Each benchmark builds its fixture from a fixed seed, then times one unit of
+work per sample (untimed setup between samples keeps entity counts steady).
+Results are written as JSON to benchmarks/results/ (not tracked) and compared
+against benchmarks/baseline.json (tracked, so every checkout has the same
+reference) so a slowdown shows up as a ratio instead of a feeling.
+
+    python benchmarks/run.py                      # run all, compare to the baseline
+    python benchmarks/run.py --save-baseline      # record this run as the new baseline
+    python benchmarks/run.py -k particles --rounds 3
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import numpy as np
+import pygame
+import headless
+
+WIDTH, HEIGHT = headless.WIDTH, headless.HEIGHT
+SEED = 1234
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_OUT = os.path.join(RESULTS_DIR, "latest.json")
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# name -> (factory, samples per round); factory() returns (timed_fn, untimed_between_fn or None)
+BENCHMARKS = {}
+
+
+def benchmark(name, samples=200):
+    def register(factory):
+        BENCHMARKS[name] = (factory, samples)
+        return factory
+    return register
+
+
+def _seed():
+    random.seed(SEED)
+    np.random.seed(SEED)
+
+
+def _new_game():
+    """A Game in the playing state that never writes the real high-score file."""
+    from game import Game, STATE_PLAYING
+    game = Game(pygame.display.get_surface())
+    game.finish_loading()
+    game.scores.path = None
+    game.reset()
+    game.game_state = STATE_PLAYING
+    return game
+
+
+# --- particles -----------------------------------------------------------------
+
+def _particle_factory(n):
+    def factory():
+        from particle import ParticleSystem, WARM_BAND
+        _seed()
+        ps = ParticleSystem(capacity=n, seed=SEED)
+        rng = np.random.default_rng(SEED)
+        ps.count = n
+        ps.x[:n] = rng.uniform(0, WIDTH, n)
+        ps.y[:n] = rng.uniform(0, HEIGHT, n)
+        ps.vx[:n] = rng.uniform(-2, 2, n)
+        ps.vy[:n] = rng.uniform(-2, 2, n)
+        ps.life[:n] = 30000
+        ps.color[:n] = rng.integers(WARM_BAND[0], WARM_BAND[0] + WARM_BAND[1], n)
+        surface = pygame.display.get_surface()
+        return (lambda: ps.update(surface, WIDTH, HEIGHT)), None
+    return factory
+
+
+benchmark("particles_update[1k]", samples=200)(_particle_factory(1000))
+benchmark("particles_update[10k]", samples=100)(_particle_factory(10000))
+
+
+# --- player ----------------------------------------------------------------------
+
+@benchmark("player_draw[trail=40]", samples=500)
+def _player_draw():
+    from player import Player
+    _seed()
+    player = Player(WIDTH // 2, HEIGHT // 2)
+    for i in range(player.MAX_TRAIL_LENGTH):
+        player.x = 200 + 8 * i
+        player.y = 300 + int(40 * math.sin(i / 5.0))
+        player.update_trail()
+    surface = pygame.Surface((WIDTH, HEIGHT), 0, pygame.display.get_surface())
+    return (lambda: player.draw(surface, 0.5)), None
+
+
+# --- HUD ---------------------------------------------------------------------------
+
+@benchmark("hud_draw[all buffs]", samples=500)
+def _hud_draw():
+    from powerup import PowerUp, registry
+    _seed()
+    game = _new_game()
+    for kind in registry:
+        if kind.duration:
+            game.apply_powerup(PowerUp(0, 0, kind.name))
+    surface = game.screen
+
+    def tick():
+        # buffs count down one tick per frame, as in play, and wrap around instead of expiring
+        for kind, rem in game.active_buffs.items():
+            game.active_buffs[kind] = rem - 1 if rem > 1 else game.active_buff_totals[kind]
+        game.player.energy = 50 + (game.player.energy + 0.1) % 50
+    return (lambda: game.draw_hud(surface)), tick
+
+
+# --- projectiles vs obstacles --------------------------------------------------------
+
+def _projectile_factory(n, mode):
+    def factory():
+        _seed()
+        game = _new_game()
+        game.collision_mode = mode
+        for _ in range(n):
+            ob = game.obstacle_pool.acquire(screen_width=WIDTH, screen_height=HEIGHT, speed=0,
+                                            hp=10 ** 6, store=game.entities)
+            ob.rect.topleft = (random.randint(80, WIDTH - 60), random.randint(80, HEIGHT - 60))
+            ob._push_position()
+            game.obstacles.append(ob)
+
+        def top_up():
+            # keep n projectiles in flight: replace the ones that hit or left the screen
+            while len(game.projectiles) < n:
+                x, y = random.randint(0, WIDTH), random.randint(0, HEIGHT)
+                ang = random.uniform(0, 2 * math.pi)
+                game.projectiles.append(game.projectile_pool.acquire(
+                    x, y, x + math.cos(ang), y + math.sin(ang), speed=4, life=10 ** 6))
+
+        def collide():
+            # only the broadphase rebuild and the projectile x obstacle pass, not the whole tick
+            game.rebuild_broadphase()
+            game.update_projectiles(set())
+        return collide, top_up
+    return factory
+
+
+for _n in (10, 50, 200):
+    for _mode in ('grid', 'array', 'brute'):
+        benchmark(f"projectiles_vs_obstacles[{_mode},n={_n}]", samples=200)(_projectile_factory(_n, _mode))
+
+
+# --- chasing enemies ---------------------------------------------------------------
+
+def _enemy_factory(n, batched):
+    def factory():
+        from obstacle import Enemy
+        from player import Player
+        from entity_store import EntityStore
+        _seed()
+        player = Player(WIDTH // 2, HEIGHT // 2)
+        store = EntityStore() if batched else None
+        enemies = [Enemy(WIDTH, HEIGHT, player=player, store=store) for _ in range(n)]
+        spawn = [e.rect.topleft for e in enemies]
+        target = (player.x + player.width / 2, player.y + player.height / 2)
+        state = {'ticks': 0}
+
+        def respawn():
+            # chasers converge on the player; restart them from the edges every 120 ticks
+            state['ticks'] += 1
+            if state['ticks'] % 120 == 0:
+                for e, pos in zip(enemies, spawn):
+                    e.rect.topleft = pos
+                    e._push_position()
+        if batched:
+            return (lambda: store.advance(target)), respawn
+
+        def update_all():
+            for e in enemies:
+                e.update()
+        return update_all, respawn
+    return factory
+
+
+for _n in (50, 500):
+    benchmark(f"enemy_update[n={_n}]", samples=200)(_enemy_factory(_n, False))
+    benchmark(f"entity_store_advance[chasers={_n}]", samples=200)(_enemy_factory(_n, True))
+
+
+# --- whole frame ---------------------------------------------------------------------
+
+@benchmark("frame[step+draw]", samples=600)
+def _frame():
+    from game import STATE_PLAYING
+    _seed()
+    game = _new_game()
+    state = {'tick': 0}
+
+    def frame():
+        game.step(headless.demo_inputs(state['tick']))
+        game.draw()
+
+    def between():
+        state['tick'] += 1
+        if game.game_state != STATE_PLAYING:
+            game.reset()
+            game.game_state = STATE_PLAYING
+    return frame, between
+
+
+# --- harness ---------------------------------------------------------------------------
+
+def run_one(name, rounds):
+    factory, samples = BENCHMARKS[name]
+    fn, between = factory()
+    # one untimed warm-up pass fills sprite / text caches
+    for _ in range(min(samples, 20)):
+        if between is not None:
+            between()
+        fn()
+    times = []
+    perf = time.perf_counter
+    for _ in range(rounds):
+        for _ in range(samples):
+            if between is not None:
+                between()
+            t0 = perf()
+            fn()
+            times.append(perf() - t0)
+    us = sorted(t * 1e6 for t in times)
+    return {
+        'samples': len(us),
+        'median_us': round(statistics.median(us), 3),
+        'mean_us': round(statistics.fmean(us), 3),
+        'min_us': round(us[0], 3),
+        'p95_us': round(us[int(len(us) * 0.95) - 1], 3),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print current vs baseline medians; returns the names that got slower than threshold."""
+    regressions = []
+    print(f"\n{'benchmark':<42}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, res in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<42}{'-':>12}{res['median_us']:>12.1f}{'new':>8}")
+            continue
+        ratio = res['median_us'] / base['median_us'] if base['median_us'] else float('inf')
+        flag = ''
+        if ratio > 1.0 + threshold:
+            flag = '  SLOWER'
+            regressions.append(name)
+        elif ratio < 1.0 - threshold:
+            flag = '  faster'
+        print(f"{name:<42}{base['median_us']:>12.1f}{res['median_us']:>12.1f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LightRunner microbenchmarks (headless)")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds per benchmark")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="where to write this run's JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="also write this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative median change reported as slower / faster (default 0.10)")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="exit with status 1 if any benchmark is slower than the threshold "
+                             "(2 if there is no baseline)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    names = [n for n in BENCHMARKS if args.filter in n]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    headless.init_headless((WIDTH, HEIGHT))
+    results = {}
+    for name in names:
+        results[name] = run_one(name, args.rounds)
+        r = results[name]
+        print(f"{name:<42} median {r['median_us']:>10.1f} us   p95 {r['p95_us']:>10.1f} us")
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'seed': SEED,
+            'rounds': args.rounds,
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nwrote {args.out}")
+
+    regressions = []
+    if not args.save_baseline:
+        if not os.path.exists(args.baseline):
+            print(f"\nno baseline at {args.baseline}: nothing to compare against "
+                  f"(record one with --save-baseline)")
+            pygame.quit()
+            # a regression check that can't run must not pass silently
+            return 2 if args.fail_on_regression else 0
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get('results', {})
+        regressions = compare(results, baseline, args.threshold)
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"saved baseline {args.baseline}")
+    pygame.quit()
+    if regressions and args.fail_on_regression:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Sound-effect voice manager.
+
+Effects play on reserved mixer channels grouped by category, so a burst of
+kill sounds can only ever occupy the gameplay channels and never cuts off the
+orb chime or a menu click. play() only queues a trigger; flush() (once per
+tick) turns every group of identical triggers into a single playback whose
+volume grows with the group size, and respects each sound's polyphony limit.
+Music (pygame.mixer.music) and the master mute are handled here as well.
+"""
+import math
+import pygame
+
+# category -> reserved channels
+CHANNELS = {'ui': 1, 'orb': 1, 'gameplay': 3}
+# category -> volume multiplier (gameplay leaves headroom for coalesced bursts)
+CATEGORY_GAIN = {'ui': 1.0, 'orb': 1.0, 'gameplay': 0.6}
+
+
+class AudioManager:
+    def __init__(self, music_volume=0.3):
+        self.music_volume = music_volume
+        self.muted = False
+        self.music_playing = False
+        # name -> (Sound, volume, max simultaneous voices)
+        self._sounds = {}
+        # (name, category) -> trigger count since the last flush
+        self._pending = {}
+        # category -> [Channel]
+        self._channels = {}
+        # Channel -> playback serial number, to find the oldest voice to steal
+        self._started = {}
+        self._serial = 0
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def setup(self):
+        """Reserve the category channels (no-op without an initialised mixer)."""
+        if pygame.mixer.get_init() is None or self._channels:
+            return
+        total = sum(CHANNELS.values())
+        if pygame.mixer.get_num_channels() < total + 2:
+            pygame.mixer.set_num_channels(total + 2)
+        # reserved channels are never picked by Sound.play()'s automatic allocation
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for category, count in CHANNELS.items():
+            self._channels[category] = [pygame.mixer.Channel(i) for i in range(index, index + count)]
+            index += count
+
+    def register(self, name, sound, volume=1.0, polyphony=1):
+        """Make `sound` playable as `name`, at most `polyphony` voices at once."""
+        if sound is not None:
+            self._sounds[name] = (sound, volume, polyphony)
+
+    def play(self, name, category='ui'):
+        """Queue one trigger of `name` on `category`'s channels (unknown names are ignored)."""
+        if name in self._sounds:
+            key = (name, category)
+            self._pending[key] = self._pending.get(key, 0) + 1
+
+    def flush(self):
+        """Start this tick's queued sounds: one voice per (sound, category)."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        if self.muted or not self._channels:
+            return
+        for (name, category), count in pending.items():
+            sound, volume, polyphony = self._sounds[name]
+            self.coalesced += count - 1
+            channels = self._channels.get(category)
+            if not channels:
+                continue
+            voices = sum(1 for chans in self._channels.values() for ch in chans
+                         if ch.get_busy() and ch.get_sound() is sound)
+            if voices >= polyphony:
+                self.dropped += 1
+                continue
+            channel = next((ch for ch in channels if not ch.get_busy()), None)
+            if channel is None:
+                # category full: the oldest voice in it gives way
+                channel = min(channels, key=lambda ch: self._started.get(ch, 0))
+            # n identical hits sound about sqrt(n) times as loud as one
+            channel.set_volume(min(1.0, volume * CATEGORY_GAIN.get(category, 1.0) * math.sqrt(count)))
+            channel.play(sound)
+            self._serial += 1
+            self._started[channel] = self._serial
+            self.played += 1
+
+    def start_music(self):
+        """Loop the loaded music track at the current volume (silent while muted)."""
+        try:
+            pygame.mixer.music.play(-1)
+            self.music_playing = True
+            self._apply_music_volume()
+        except pygame.error as e:
+            print("⚠️ Music issue:", e)
+
+    def set_music_volume(self, volume):
+        self.music_volume = volume
+        self._apply_music_volume()
+
+    def set_muted(self, muted):
+        """Master mute for music and effects; volumes come back unchanged on unmute."""
+        self.muted = muted
+        self._apply_music_volume()
+        if muted:
+            for chans in self._channels.values():
+                for ch in chans:
+                    ch.stop()
+
+    def _apply_music_volume(self):
+        if self.music_playing:
+            pygame.mixer.music.set_volume(0 if self.muted else self.music_volume)
+
+    def stats(self):
+        return {'played': self.played, 'coalesced': self.coalesced, 'dropped': self.dropped}
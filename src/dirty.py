@@ -0,0 +1,98 @@
+"""Dirty-region bookkeeping for the dirty-rect renderer.
+
+Rects are rasterised onto a coarse tile grid and read back as disjoint runs of
+tiles, so heavily overlapping bounds (an entity's previous and current
+position, the trail glow, particle clusters) are cleared and presented once
+instead of once per rect.
+"""
+import numpy as np
+import pygame
+
+
+class DirtyTiles:
+    def __init__(self, width, height, tile=32):
+        self.width = width
+        self.height = height
+        self.tile = tile
+        self.cols = -(-width // tile)
+        self.rows = -(-height // tile)
+        self.grid = np.zeros((self.rows, self.cols), dtype=np.bool_)
+
+    def clear(self):
+        self.grid.fill(False)
+
+    def _span(self, rect):
+        """Tile columns / rows [x0, x1) x [y0, y1) under the on-screen part of
+        rect; empty when none of it is on screen."""
+        t = self.tile
+        # clip in pixels first: the last tile row / column may extend past the
+        # screen edge, and a rect beyond the edge must not mark it
+        left, right = max(0, rect.left), min(self.width, rect.right)
+        top, bottom = max(0, rect.top), min(self.height, rect.bottom)
+        if left >= right or top >= bottom:
+            return 0, 0, 0, 0
+        return left // t, (right - 1) // t + 1, top // t, (bottom - 1) // t + 1
+
+    def add(self, rect):
+        """Mark every tile the on-screen part of rect overlaps."""
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        x0, x1, y0, y1 = self._span(rect)
+        if x0 < x1 and y0 < y1:
+            self.grid[y0:y1, x0:x1] = True
+
+    def add_all(self, rects):
+        """add() for a batch of rects, with the tile spans computed in one go."""
+        if not rects:
+            return
+        t = self.tile
+        box = np.array([(r.left, r.top, r.right, r.bottom) for r in rects if r.width > 0 and r.height > 0],
+                       dtype=np.intp).reshape(-1, 4)
+        np.clip(box[:, 0::2], 0, self.width, out=box[:, 0::2])
+        np.clip(box[:, 1::2], 0, self.height, out=box[:, 1::2])
+        box = box[(box[:, 0] < box[:, 2]) & (box[:, 1] < box[:, 3])]
+        x0 = box[:, 0] // t
+        y0 = box[:, 1] // t
+        x1 = (box[:, 2] - 1) // t + 1
+        y1 = (box[:, 3] - 1) // t + 1
+        grid = self.grid
+        for a, b, c, d in zip(x0.tolist(), x1.tolist(), y0.tolist(), y1.tolist()):
+            grid[c:d, a:b] = True
+
+    def touches(self, rect):
+        """True if rect overlaps any marked tile."""
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        x0, x1, y0, y1 = self._span(rect)
+        return x0 < x1 and y0 < y1 and bool(self.grid[y0:y1, x0:x1].any())
+
+    def coverage(self):
+        """Marked share of the screen (0..1)."""
+        return np.count_nonzero(self.grid) / self.grid.size
+
+    def rects(self):
+        """Disjoint screen rects covering the marked tiles: horizontal runs per
+        tile row, with identical runs on consecutive rows merged."""
+        t = self.tile
+        padded = np.zeros((self.rows, self.cols + 2), dtype=np.int8)
+        padded[:, 1:-1] = self.grid
+        rows, cols = np.nonzero(np.diff(padded, axis=1))
+        out = []
+        open_runs = {}
+        runs = {}
+        row_now = -1
+        # nonzero() walks row-major, so run starts and ends alternate per row
+        for row, x0, x1 in zip(rows[0::2].tolist(), cols[0::2].tolist(), cols[1::2].tolist()):
+            if row != row_now:
+                open_runs = runs if row == row_now + 1 else {}
+                runs = {}
+                row_now = row
+            rect = open_runs.get((x0, x1))
+            if rect is None:
+                rect = pygame.Rect(x0 * t, row * t, (x1 - x0) * t, t)
+                out.append(rect)
+            else:
+                rect.height += t
+            runs[(x0, x1)] = rect
+        screen = pygame.Rect(0, 0, self.width, self.height)
+        return [r.clip(screen) for r in out]
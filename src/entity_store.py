@@ -0,0 +1,338 @@
+"""Contiguous NumPy storage for obstacle and enemy state.
+
+Obstacle / Enemy objects attached to an EntityStore become thin views: their
+position, size, speed and hp live in the store's arrays, the whole population
+is advanced with one vectorised step per tick, and "which boxes overlap this
+box" is answered with a single vectorised AABB test. Each view keeps one
+persistent pygame.Rect that the store syncs after every step for drawing and
+colliderect.
+
+Chasers keep sub-pixel float positions (the Rect gets them rounded down), so
+slow enemies still move every tick and along both axes, and a separation term
+pushes neighbouring chasers apart so they don't collapse into one blob.
+"""
+import math
+import numpy as np
+
+# chasers whose centres are closer than this (the largest enemy size) push each other apart
+SEPARATION_RADIUS = 40.0
+# strength of the push relative to the pull towards the target
+SEPARATION_WEIGHT = 1.2
+# ticks between separation updates; in between chasers reuse the last push, which
+# changes slowly (a few pixels of movement per tick against a 40 px radius)
+SEPARATION_INTERVAL = 4
+# above this many chasers separation switches from exact pairs to the O(k) crowd
+# estimate (the measured crossover where both cost about the same)
+PAIRWISE_MAX = 40
+
+
+class EntityStore:
+    def __init__(self, capacity=128):
+        self.capacity = 0
+        self.size = 0          # high-water mark: slots [0, size) may be in use
+        self.views = []
+        self._free = []
+        self._next_seq = 0
+        # live slots and their Rects, rebuilt when entities come or go
+        self._live = None
+        # live chaser slots and their separation push, rebuilt when chasers come or go
+        self._chasers = None
+        self._push = None
+        self._push_age = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        old = self.capacity
+        fields = (
+            ('x', np.float64), ('y', np.float64),
+            ('prev_x', np.float64), ('prev_y', np.float64),
+            ('w', np.int32), ('h', np.int32),
+            # half sizes, so chaser centres take one add
+            ('half_w', np.float64), ('half_h', np.float64),
+            ('speed', np.float64), ('hp', np.int32),
+            # whole pixels scrolled left per tick (0 for chasers)
+            ('drift', np.float64),
+            ('chase', np.bool_), ('alive', np.bool_),
+            # spawn order, so queries report hits in the same order as the obstacle list
+            ('seq', np.int64),
+        )
+        for name, dtype in fields:
+            arr = np.zeros(capacity, dtype=dtype)
+            if old:
+                arr[:old] = getattr(self, name)
+            setattr(self, name, arr)
+        self.views.extend([None] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.size]))
+
+    def add(self, view, rect, speed, hp, chase):
+        """Register view with its spawn rect; returns the slot index."""
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self.x[slot] = self.prev_x[slot] = rect.x
+        self.y[slot] = self.prev_y[slot] = rect.y
+        self.w[slot] = rect.width
+        self.h[slot] = rect.height
+        self.half_w[slot] = rect.width / 2
+        self.half_h[slot] = rect.height / 2
+        self.speed[slot] = speed
+        self.drift[slot] = 0 if chase else math.trunc(speed)
+        self.hp[slot] = hp
+        self.chase[slot] = chase
+        if chase:
+            self._chasers = None
+        self.alive[slot] = True
+        self._live = None
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+        self.views[slot] = view
+        self.size = max(self.size, slot + 1)
+        return slot
+
+    def remove(self, slot):
+        if slot is None or not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self._live = None
+        if self.chase[slot]:
+            self._chasers = None
+        self.views[slot] = None
+        self._free.append(slot)
+        while self.size and not self.alive[self.size - 1]:
+            self.size -= 1
+
+    def advance(self, target=None):
+        """Move every live entity one tick. Chasers steer towards target (the
+        player's centre, computed once by the caller) while keeping clear of each
+        other, never faster than their speed; everything else scrolls left.
+        Free slots move too; add() overwrites their position on reuse.
+        """
+        n = self.size
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        if target is None:
+            # no player to chase: chasers fall back to moving left as well
+            x -= np.trunc(self.speed[:n])
+            self.sync_rects()
+            return
+        x -= self.drift[:n]
+        idx = self._chasers
+        if idx is None:
+            idx = self._chasers = np.flatnonzero(self.chase[:n] & self.alive[:n])
+            self._push_age = SEPARATION_INTERVAL
+        if len(idx):
+            s = self.speed[idx]
+            cx = x[idx] + self.half_w[idx]
+            cy = y[idx] + self.half_h[idx]
+            dx = target[0] - cx
+            dy = target[1] - cy
+            dist = np.maximum(np.hypot(dx, dy), 1e-9)
+            vx = dx / dist
+            vy = dy / dist
+            if self._push_age >= SEPARATION_INTERVAL:
+                self._push = separation(cx, cy)
+                self._push_age = 0
+            self._push_age += 1
+            if self._push is not None:
+                vx += self._push[0]
+                vy += self._push[1]
+                # unit pull plus push, capped at one speed's worth of movement
+                s = s / np.maximum(np.hypot(vx, vy), 1.0)
+            x[idx] += vx * s
+            y[idx] += vy * s
+        self.sync_rects()
+
+    def sync_rects(self):
+        """Copy array positions, rounded down to whole pixels, into each view's persistent Rect."""
+        if self._live is None:
+            live = np.flatnonzero(self.alive[:self.size])
+            self._live = live, [self.views[slot].rect for slot in live.tolist()]
+        live, rects = self._live
+        xs = np.floor(self.x[live]).astype(np.int64).tolist()
+        ys = np.floor(self.y[live]).astype(np.int64).tolist()
+        for rect, x, y in zip(rects, xs, ys):
+            rect.topleft = (x, y)
+
+    def _ordered(self, slots):
+        if len(slots) > 1:
+            slots = slots[np.argsort(self.seq[slots], kind='stable')]
+        views = self.views
+        return [views[s] for s in slots.tolist()]
+
+    def overlapping(self, rect):
+        """Views whose box overlaps rect (pygame.Rect semantics), in spawn order."""
+        n = self.size
+        if n == 0:
+            return []
+        x, y = np.floor(self.x[:n]), np.floor(self.y[:n])
+        hit = (self.alive[:n]
+               & (x < rect.right) & (x + self.w[:n] > rect.left)
+               & (y < rect.bottom) & (y + self.h[:n] > rect.top))
+        return self._ordered(np.flatnonzero(hit))
+
+    def outside(self, left, top, right, bottom):
+        """Views lying entirely beyond the given bounds, in spawn order."""
+        n = self.size
+        if n == 0:
+            return []
+        x, y = np.floor(self.x[:n]), np.floor(self.y[:n])
+        out = self.alive[:n] & ((x + self.w[:n] < left) | (x > right)
+                                | (y > bottom) | (y + self.h[:n] < top))
+        return self._ordered(np.flatnonzero(out))
+
+
+def separation(cx, cy, radius=SEPARATION_RADIUS):
+    """Push (already times SEPARATION_WEIGHT) on each of the given centres away
+    from its neighbours closer than `radius`, or None when no two are that
+    close. A neighbour at distance d adds (1 - d/radius) along the line between
+    them.
+
+    Up to PAIRWISE_MAX centres this is exact (every pair at once by
+    broadcasting). Larger crowds go through crowd_push(), whose cost stays flat
+    however tightly they bunch up.
+    """
+    k = len(cx)
+    if k < 2:
+        return None
+    if k <= PAIRWISE_MAX:
+        ddx = cx[:, None] - cx
+        # cheap rejection: no two centres within radius along x means no close
+        # pair (the k diagonal zeros always count)
+        if (np.abs(ddx) < radius).sum() <= k:
+            return None
+        ddy = cy[:, None] - cy
+        d = np.hypot(ddx, ddy)
+        np.fill_diagonal(d, np.inf)
+        w = 1.0 / radius - 1.0 / np.maximum(d, 1e-9)
+        np.minimum(w, 0.0, out=w)
+        if not w.any():
+            return None
+        # coincident centres get no push from each other
+        w *= -SEPARATION_WEIGHT
+        return (ddx * w).sum(axis=1), (ddy * w).sum(axis=1)
+    return crowd_push(cx, cy, radius)
+
+
+def crowd_push(cx, cy, radius=SEPARATION_RADIUS):
+    """Approximate separation for large crowds in O(k): centres are binned into
+    radius-sized grid cells, and each one is pushed away from the centroid m of
+    the others in its 3x3 block of cells, by (count - 1) * (1 - |c - m|/radius).
+    For an isolated pair that is exactly the pairwise push.
+    """
+    c = np.array((cx, cy))
+    g = (c // radius).astype(np.intp)
+    g -= g.min(axis=1, keepdims=True)
+    # one empty ring of cells around the occupied ones keeps the 3x3 sums in range
+    cols, rows = (g.max(axis=1) + 3).tolist()
+    cell = g[1] * cols + g[0] + (cols + 1)
+    size = rows * cols
+    grid = np.array((np.bincount(cell, minlength=size),
+                     np.bincount(cell, cx, minlength=size),
+                     np.bincount(cell, cy, minlength=size))).reshape(3, rows, cols)
+    # separable 3x3 box sum; trimming the ring lines it up with the unshifted cells
+    grid = grid[:, :, :-2] + grid[:, :, 1:-1] + grid[:, :, 2:]
+    grid = grid[:, :-2] + grid[:, 1:-1] + grid[:, 2:]
+    block = grid[:, g[1], g[0]]
+    others = block[0] - 1
+    if not others.any():
+        return None
+    # (c - m) times the number of others
+    o = others * c - (block[1:] - c)
+    d = np.maximum(np.hypot(o[0], o[1]), 1e-9)
+    scale = np.maximum(1.0 / d - 1.0 / (radius * np.maximum(others, 1)), 0.0)
+    scale *= others * SEPARATION_WEIGHT
+    return o * scale
+
+
+class StoreView:
+    """Mixin for entities that can live in an EntityStore. While attached, hp and
+    the previous-tick position are read from / written to the store arrays; the
+    class' own update() still works and writes its result back.
+    """
+    store = None
+    slot = None
+    _pos = (0.0, 0.0)
+
+    def attach(self, store, chase=False):
+        self.slot = store.add(self, self.rect, self.speed, self._hp, chase)
+        self.store = store
+
+    def detach(self):
+        if self.store is not None:
+            self._hp = int(self.store.hp[self.slot])
+            self._prev = (float(self.store.prev_x[self.slot]), float(self.store.prev_y[self.slot]))
+            self._pos = (float(self.store.x[self.slot]), float(self.store.y[self.slot]))
+            self.store.remove(self.slot)
+        self.store = None
+        self.slot = None
+
+    def _push_position(self):
+        """Take the Rect's position as the exact one (after moving the Rect directly)."""
+        if self.store is not None:
+            self.store.x[self.slot] = self.rect.x
+            self.store.y[self.slot] = self.rect.y
+        else:
+            self._pos = (float(self.rect.x), float(self.rect.y))
+
+    @property
+    def position(self):
+        """Exact (sub-pixel) top-left; the Rect holds it rounded down."""
+        if self.store is not None:
+            return float(self.store.x[self.slot]), float(self.store.y[self.slot])
+        return self._pos
+
+    @position.setter
+    def position(self, value):
+        x, y = value
+        if self.store is not None:
+            self.store.x[self.slot] = x
+            self.store.y[self.slot] = y
+        else:
+            self._pos = (x, y)
+        self.rect.topleft = (math.floor(x), math.floor(y))
+
+    @property
+    def hp(self):
+        if self.store is not None:
+            return int(self.store.hp[self.slot])
+        return self._hp
+
+    @hp.setter
+    def hp(self, value):
+        if self.store is not None:
+            self.store.hp[self.slot] = value
+        else:
+            self._hp = value
+
+    @property
+    def prev_x(self):
+        if self.store is not None:
+            return float(self.store.prev_x[self.slot])
+        return self._prev[0]
+
+    @prev_x.setter
+    def prev_x(self, value):
+        if self.store is not None:
+            self.store.prev_x[self.slot] = value
+        else:
+            self._prev = (value, self._prev[1])
+
+    @property
+    def prev_y(self):
+        if self.store is not None:
+            return float(self.store.prev_y[self.slot])
+        return self._prev[1]
+
+    @prev_y.setter
+    def prev_y(self, value):
+        if self.store is not None:
+            self.store.prev_y[self.slot] = value
+        else:
+            self._prev = (self._prev[0], value)
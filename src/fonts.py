@@ -0,0 +1,70 @@
+"""Process-wide font registry and an LRU cache of rendered text surfaces.
+
+Fonts are created once per (name, size) and reused; render_text() returns a
+cached surface for repeated (font, text, antialias, colour) combinations so
+steady-state frames neither construct fonts nor rasterise glyphs.
+Returned surfaces are shared: blit them, never draw onto them.
+"""
+import pygame
+from collections import OrderedDict
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """Return the shared pygame Font for (name, size); name=None is pygame's default font."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+# every size the menus, HUD and overlays use
+UI_SIZES = (18, 20, 22, 24, 28, 40, 84)
+
+
+def preload(sizes=UI_SIZES, name=None):
+    """Create the fonts up front (startup) so the first menu frame doesn't."""
+    for size in sizes:
+        get_font(size, name)
+
+
+class TextCache:
+    """LRU cache of rendered text keyed by (font, text, antialias, colour)."""
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, tuple(color))
+        surf = self._entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color):
+    """Drop-in for font.render(text, antialias, color) that goes through the shared cache."""
+    return text_cache.render(font, text, antialias, color)
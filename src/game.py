@@ -2,38 +2,95 @@ import pygame
 import random
 import os
 import math
-import json
 from player import Player
 from orb import Orb
-from obstacle import Obstacle
+from obstacle import Obstacle, Enemy
 from particle import ParticleSystem
 from projectile import Projectile  # added
+from inputs import InputState
+from fonts import get_font, render_text
+from hud import HudLayer
+from spatial import SpatialHash
+from entity_store import EntityStore
+from pools import ObjectPool, GcPolicy
+from dirty import DirtyTiles
+from powerup import PowerUp, registry as powerup_registry
+from profiler import FrameProfiler
+from loader import AssetLoader
+from audio import AudioManager
+from persistence import ScoreStore
+from telemetry import RunStats
 
 ASSETS_PATH = os.path.join(os.path.dirname(__file__), "../assets")
+HIGHSCORE_PATH = os.path.join(os.path.dirname(__file__), "../highscore.json")
 
 WIDTH, HEIGHT = 800, 600
 STATE_START = 0
 STATE_PLAYING = 1
 STATE_GAMEOVER = 2
 
+# fixed simulation rate; every frame-counted timer assumes this many ticks per second
+SIM_HZ = 60
+# dirty-rect mode falls back to a full repaint when more than this share of the screen changed
+DIRTY_FULL_FRACTION = 0.5
+# effect name -> (file in assets/, volume, max simultaneous voices); missing files are skipped
+SOUND_EFFECTS = {
+    'orb': ("orb.wav", 1.0, 1),
+    'navigate': ("menu_nav.wav", 1.0, 1),
+    'confirm': ("menu_confirm.wav", 1.0, 2),
+}
+
 class Game:
     def __init__(self, screen):
         self.screen = screen
         self.clock = pygame.time.Clock()
         # slightly larger fonts for improved readability
-        self.font = pygame.font.Font(None, 40)
-        self.large_font = pygame.font.Font(None, 84)
+        self.font = get_font(40)
+        self.large_font = get_font(84)
+        self.hud = HudLayer(WIDTH, HEIGHT, self.font)
+
+        # Recycling for short-lived entities, and the optional play-time GC policy
+        # (enable with gc_policy.enable(); game_state changes drive it)
+        self.projectile_pool = ObjectPool(Projectile)
+        self.obstacle_pool = ObjectPool(Obstacle)
+        self.enemy_pool = ObjectPool(Enemy)
+        self._pools_by_type = {Projectile: self.projectile_pool, Obstacle: self.obstacle_pool,
+                               Enemy: self.enemy_pool}
+        self._pending_release = []
+        self.gc_policy = GcPolicy()
+
+        # Every gameplay random draw goes through self.rng, reseeded by reset(), so a
+        # run is reproducible from its seed and inputs (see replay.py); cosmetic
+        # randomness that must not disturb it (screen shake) uses render_rng
+        self.seed = None
+        self.rng = random.Random()
+        self.render_rng = random.Random()
+        # optional replay.ReplayRecorder fed by reset() / step()
+        self.recorder = None
+        # optional telemetry.TelemetryWriter; run_stats are kept either way
+        self.telemetry = None
+        self.run_stats = RunStats()
 
         self.game_state = STATE_START
         self.player = Player(WIDTH//2, HEIGHT//2)
-        self.orb = Orb(screen_width=WIDTH, screen_height=HEIGHT)
+        self.orb = Orb(screen_width=WIDTH, screen_height=HEIGHT, rng=self.rng)
         self.obstacles = []
         self.particles = ParticleSystem()
         self.spawn_timer = 0
         self.spawn_interval = 60
+
+        # obstacle / enemy state lives in contiguous arrays (see entity_store.py)
+        self.entities = EntityStore()
+
+        # collision broadphase: 'grid' (spatial hash), 'array' (vectorised AABB on the
+        # entity store) or 'brute' (check every pair, for verification)
+        self.grid = SpatialHash(cell_size=64)
+        self.collision_mode = 'grid'
         self.score = 0
         self.orbs_collected = 0
-        self.start_ticks = 0
+        self.kills = 0
+        # ticks simulated in the current run (drives score, independent of frame rate)
+        self.run_ticks = 0
 
         # projectile / shooting
         self.projectiles = []
@@ -42,37 +99,20 @@ class Game:
         self.projectile_damage = 1
 
         # Power-ups
-        from powerup import PowerUp
         self.powerups = []                 # active pickups on the map
         self.active_buffs = {}             # buff_name -> remaining frames
         self.base_shoot_cooldown = self.SHOOT_COOLDOWN
         self.base_projectile_damage = self.projectile_damage
         self.player_invulnerable = False
 
-        # Sound
-        try:
-            music_path = os.path.join(ASSETS_PATH, "music.mp3")
-            if os.path.exists(music_path):
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.play(-1)
-                pygame.mixer.music.set_volume(0.3)
-
-            orb_sound_path = os.path.join(ASSETS_PATH, "orb.wav")
-            self.orb_sound = pygame.mixer.Sound(orb_sound_path) if os.path.exists(orb_sound_path) else None
-
-            # Optional menu sounds (place files in assets/ to enable)
-            nav_path = os.path.join(ASSETS_PATH, "menu_nav.wav")
-            confirm_path = os.path.join(ASSETS_PATH, "menu_confirm.wav")
-            self.navigate_sound = pygame.mixer.Sound(nav_path) if os.path.exists(nav_path) else None
-            self.confirm_sound = pygame.mixer.Sound(confirm_path) if os.path.exists(confirm_path) else None
-        except Exception as e:
-            print("⚠️ Sound loading issue:", e)
-            self.orb_sound = None
-            self.navigate_sound = None
-            self.confirm_sound = None
+        # Sound: effects play through the AudioManager's reserved channels as soon as
+        # the asset loader delivers them (see start_loading); music starts once decoded
+        self.audio = AudioManager()
+        self.audio.setup()
+        self.music_path = os.path.join(ASSETS_PATH, "music.mp3")
 
         # Menu / UI state
-        self.music_enabled = pygame.mixer.music.get_busy()
+        self.music_enabled = pygame.mixer.get_init() is not None and os.path.exists(self.music_path)
         # Simplified menu: Credits removed; music is controlled via clickable icon
         self.menu_options = ["Start Game", "Settings", "Quit"]
         self.selected_menu = 0
@@ -101,16 +141,12 @@ class Game:
         self.gameover_options = ["Restart", "Main Menu", "Quit"]
         self.selected_menu_gameover = 0
 
-        # High score persistence
-        self.high_score_file = os.path.join(os.path.dirname(__file__), "../highscore.json")
+        # High score / leaderboard persistence: read by the asset loader, written in
+        # the background when a run ends (scores.path = None keeps it in memory)
+        self.scores = ScoreStore(HIGHSCORE_PATH)
         self.high_score = 0
-        try:
-            if os.path.exists(self.high_score_file):
-                with open(self.high_score_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.high_score = int(data.get("high_score", 0))
-        except Exception as e:
-            print("⚠️ High score load issue:", e)
+        # leaderboard rank of the last finished run (None = outside the top N)
+        self.last_rank = None
 
         # New-high animation state
         self.new_high = False
@@ -120,12 +156,24 @@ class Game:
         self.shake_timer = 0
         self.shake_magnitude = 0
 
+        # Optional dirty-rect rendering: draw() repaints only what moved and
+        # returns the rects for pygame.display.update() (None = flip everything)
+        self.dirty_rects_enabled = False
+        self.dirty_tiles = DirtyTiles(WIDTH, HEIGHT)
+
+        # Off-screen world layer in the display's pixel format, allocated once;
+        # the whole PLAYING scene is drawn here and blitted (with the shake offset)
+        self.world = pygame.Surface(screen.get_size(), 0, screen)
+        self._prev_bounds = None
+
         # Difficulty affects obstacle speed/spawn
         self.base_obstacle_speed = 4
         self.apply_difficulty_settings()
 
         self.vel_x = 0
         self.vel_y = 0
+        # simulation ticks advanced via step()
+        self.ticks = 0
 
         # UI overlay/fade state
         self.overlay_alpha = 0
@@ -135,6 +183,20 @@ class Game:
 
         # Animated cursor
         self.cursor_pulse_speed = 180.0
+        # cosmetic ticks outside gameplay (advanced by step_idle); drive the cursor pulse
+        self.menu_ticks = 0
+
+        # Pre-rendered Start / Game Over screen, recomposed when menu_screen_key() changes
+        self._menu_surface = None
+        self._menu_key = None
+        self._menu_cursor = None
+        self._cursor_sprites = {}
+        self.menu_redraws = 0
+        # sound icon sprites keyed by (size, music enabled)
+        self._sound_icons = {}
+
+        # per-phase frame profiler (F3 / --profile / LIGHTRUNNER_PROFILE=1)
+        self.profiler = FrameProfiler.from_env()
 
         # Tooltip/help text
         self.tooltip_text = ""
@@ -152,6 +214,104 @@ class Game:
             self.cursor_hand = None
             self.cursor_arrow = None
 
+        # high score, sounds and music load in the background; the loading
+        # screen shows until everything but the music is in
+        self.loader = AssetLoader()
+        self.start_loading()
+
+    @property
+    def game_state(self):
+        return self._game_state
+
+    @game_state.setter
+    def game_state(self, value):
+        old = getattr(self, '_game_state', None)
+        self._game_state = value
+        if old != value:
+            self.on_state_change(old, value)
+
+    def on_state_change(self, old, new):
+        """Single hook for every game_state transition."""
+        self._menu_key = None
+        if new == STATE_PLAYING:
+            self.gc_policy.enter_play()
+        elif old == STATE_PLAYING:
+            self.gc_policy.leave_play()
+
+    def start_loading(self):
+        """Queue the startup assets on the loader thread, quickest first."""
+        loader = self.loader
+        # the menu shows 0 until the scores are in rather than waiting on file I/O
+        loader.add('scores', self.scores.load, blocking=False)
+        # menu sounds are optional (place the files in assets/ to enable)
+        for name, (filename, _, _) in SOUND_EFFECTS.items():
+            loader.add(f'{name}_sound', lambda filename=filename: self.load_sound(filename))
+        # the menu doesn't wait for the music
+        loader.add('music', self.load_music, blocking=False)
+        loader.start()
+
+    @staticmethod
+    def load_sound(filename):
+        """Sound from assets/, or None when the file (or the mixer) is missing."""
+        path = os.path.join(ASSETS_PATH, filename)
+        if not os.path.exists(path) or pygame.mixer.get_init() is None:
+            return None
+        return pygame.mixer.Sound(path)
+
+    def load_music(self):
+        if not os.path.exists(self.music_path) or pygame.mixer.get_init() is None:
+            return False
+        pygame.mixer.music.load(self.music_path)
+        return True
+
+    @property
+    def loading(self):
+        """True until every asset the menus need has been installed."""
+        return not self.loader.ready
+
+    def poll_assets(self):
+        """Install whatever the loader finished since the last call (main thread, once per frame)."""
+        if self.loader.finished:
+            return
+        for name, value in self.loader.poll():
+            try:
+                if name == 'scores':
+                    self.high_score = max(self.high_score, self.scores.high_score)
+                elif name == 'music':
+                    if value:
+                        # silent if muted before the music was ready
+                        self.audio.start_music()
+                elif name.endswith('_sound'):
+                    effect = name[:-len('_sound')]
+                    _, volume, polyphony = SOUND_EFFECTS[effect]
+                    self.audio.register(effect, value, volume, polyphony)
+            except Exception as e:
+                print("⚠️ Sound loading issue:", e)
+
+    def finish_loading(self):
+        """Wait for the loader and install everything (headless runs, tools)."""
+        self.loader.wait()
+        self.poll_assets()
+
+    def draw_loading_screen(self):
+        """Title, progress bar and the asset being read, shown until `loading` clears."""
+        self.screen.fill((10, 10, 30))
+        try:
+            title = render_text(self.large_font, "LightRunner", True, (255, 220, 40))
+            self.screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//3)))
+            bar = pygame.Rect(0, 0, 320, 14)
+            bar.center = (WIDTH//2, HEIGHT//2 + 20)
+            pygame.draw.rect(self.screen, (40, 40, 60), bar, border_radius=7)
+            fill = bar.copy()
+            fill.width = max(bar.height, int(bar.width * self.loader.progress))
+            pygame.draw.rect(self.screen, (255, 220, 40), fill, border_radius=7)
+            current = self.loader.current
+            label = render_text(get_font(22), f"Loading {current.replace('_', ' ')}..." if current else "Loading...",
+                                True, (200, 200, 200))
+            self.screen.blit(label, label.get_rect(midtop=(WIDTH//2, bar.bottom + 12)))
+        except Exception:
+            pass
+
     def apply_difficulty_settings(self):
         level = self.difficulty_levels[self.difficulty_index]
         if level == "Easy":
@@ -164,7 +324,17 @@ class Game:
             self.spawn_interval = 40
             self.base_obstacle_speed = 5
 
-    def reset(self):
+    def reset(self, seed=None):
+        """Start a fresh run. `seed` fixes every gameplay random draw of the run;
+        None picks a new one (kept in self.seed, and recorded when a recorder is attached).
+        """
+        if self.recorder is not None:
+            # a run abandoned from the menu is saved here
+            self.recorder.finish(self)
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self.rng.seed(self.seed)
+        if self.recorder is not None:
+            self.recorder.begin(self.seed, self.difficulty_index)
         self.player = Player(WIDTH//2, HEIGHT//2)
         # apply selected player color so changes in Settings persist across restarts
         try:
@@ -177,30 +347,172 @@ class Game:
         self.player_invulnerable = False
         self.projectile_damage = self.base_projectile_damage
         self.SHOOT_COOLDOWN = self.base_shoot_cooldown
-        self.orb = Orb(screen_width=WIDTH, screen_height=HEIGHT)
+        self.orb = Orb(screen_width=WIDTH, screen_height=HEIGHT, rng=self.rng)
+        for ob in self.obstacles:
+            self.release_later(ob)
+        # shots still in flight and the shot cooldown would leak into the new run
+        for proj in self.projectiles:
+            self.release_later(proj)
+        self.flush_releases()
         self.obstacles = []
-        self.particles = ParticleSystem()
+        self.projectiles = []
+        self.shoot_cooldown = 0
+        self.entities = EntityStore()
+        self.particles = ParticleSystem(seed=self.seed)
         self.spawn_timer = 0
         self.score = 0
         self.orbs_collected = 0
-        self.start_ticks = pygame.time.get_ticks()
+        self.kills = 0
+        self.run_ticks = 0
+        # no rank until record_run() ranks this run
+        self.last_rank = None
+        self.run_stats = RunStats()
+        if self.telemetry is not None:
+            self.telemetry.emit('run_start', seed=self.seed,
+                                difficulty=self.difficulty_levels[self.difficulty_index])
 
     def spawn_obstacle(self):
         # pass difficulty-based speed into obstacle
-        ob = Obstacle(screen_width=WIDTH, screen_height=HEIGHT, speed=self.base_obstacle_speed, hp=1)
+        ob = self.obstacle_pool.acquire(screen_width=WIDTH, screen_height=HEIGHT, speed=self.base_obstacle_speed, hp=1, store=self.entities, rng=self.rng)
         self.obstacles.append(ob)
+        self.run_stats.spawns['obstacle'] += 1
         # occasionally spawn smarter enemies on Normal/Hard
-        if self.difficulty_index >= 1 and random.random() < 0.2:
-            from obstacle import Enemy
-            en = Enemy(screen_width=WIDTH, screen_height=HEIGHT, speed=2.0 + self.difficulty_index, player=self.player, hp=3)
+        if self.difficulty_index >= 1 and self.rng.random() < 0.2:
+            en = self.enemy_pool.acquire(screen_width=WIDTH, screen_height=HEIGHT, speed=2.0 + self.difficulty_index, player=self.player, hp=3, store=self.entities, rng=self.rng)
             self.obstacles.append(en)
+            self.run_stats.spawns['enemy'] += 1
+
+    def rebuild_broadphase(self):
+        """Re-bucket the moving entities into the uniform grid for this tick."""
+        grid = self.grid
+        grid.clear()
+        if self.collision_mode == 'grid':
+            for ob in self.obstacles:
+                grid.insert(ob, ob.rect, 'obstacle')
+        for pu in self.powerups:
+            grid.insert(pu, pu.rect, 'powerup')
+        grid.insert(self.orb, self.orb.rect, 'orb')
+
+    def collision_candidates(self, rect, kind, entities):
+        """Entities of `kind` that may overlap rect, according to collision_mode:
+        'grid' queries the spatial hash, 'array' answers obstacle queries with the
+        entity store's vectorised AABB test (grid for the rest), and 'brute' scans
+        the whole list (for verification).
+        """
+        if self.collision_mode == 'brute':
+            return entities[:]
+        if self.collision_mode == 'array' and kind == 'obstacle':
+            return self.entities.overlapping(rect)
+        return self.grid.query(rect, kind)
+
+    def update_projectiles(self, gone):
+        """Move every projectile and resolve its hits against obstacles / enemies,
+        using this tick's broadphase (rebuild_broadphase() first). Obstacles
+        destroyed here are added to `gone`."""
+        for proj in self.projectiles[:]:
+            proj.update()
+            # remove if expired or offscreen
+            if proj.life <= 0 or proj.x < -50 or proj.x > WIDTH + 50 or proj.y < -50 or proj.y > HEIGHT + 50:
+                self.remove_projectile(proj)
+                continue
+            proj_rect = proj.rect
+            self.grid.insert(proj, proj_rect, 'projectile')
 
-    def save_high_score(self):
+            hit_any = False
+            for ob in self.collision_candidates(proj_rect, 'obstacle', self.obstacles):
+                if id(ob) in gone:
+                    continue
+                if proj_rect.colliderect(ob.rect):
+                    # apply damage; if dead remove and spawn particles/score
+                    dead = False
+                    try:
+                        dead = ob.take_damage(proj.damage)
+                    except Exception:
+                        # fallback: remove obstacle if it doesn't implement take_damage
+                        dead = True
+                    if dead:
+                        gone.add(id(ob))
+                        self.remove_obstacle(ob)
+                        self.kills += 1
+                        # reward points for kills
+                        self.score += 150
+                        # small confetti / particles
+                        self.particles.burst_confetti(ob.rect.centerx, ob.rect.centery, count=12)
+                        # small chance to spawn a power-up where the obstacle died
+                        if self.rng.random() < 0.15:
+                            try:
+                                pu = PowerUp(ob.rect.centerx, ob.rect.centery, rng=self.rng)
+                                self.powerups.append(pu)
+                                self.grid.insert(pu, pu.rect, 'powerup')
+                            except Exception:
+                                pass
+                        self.audio.play('confirm', 'gameplay')
+                    # remove projectile on hit
+                    self.remove_projectile(proj)
+                    hit_any = True
+                    break
+            if hit_any:
+                continue
+
+    def remove_obstacle(self, ob):
+        """Drop an obstacle / enemy from the play field and free its store slot."""
         try:
-            with open(self.high_score_file, "w", encoding="utf-8") as f:
-                json.dump({"high_score": self.high_score}, f)
-        except Exception as e:
-            print("⚠️ High score save issue:", e)
+            self.obstacles.remove(ob)
+        except ValueError:
+            pass
+        try:
+            ob.detach()
+        except Exception:
+            pass
+        self.release_later(ob)
+
+    def remove_projectile(self, proj):
+        try:
+            self.projectiles.remove(proj)
+        except ValueError:
+            pass
+        self.release_later(proj)
+
+    def release_later(self, obj):
+        """Queue obj for its pool. Released at the end of the tick, so code still
+        holding it this tick (or keyed on its id) never sees it re-acquired."""
+        self._pending_release.append(obj)
+
+    def flush_releases(self):
+        for obj in self._pending_release:
+            pool = self._pools_by_type.get(type(obj))
+            if pool is not None:
+                pool.release(obj)
+        self._pending_release.clear()
+
+    def entity_counts(self):
+        """Live entity counts, for the profiler."""
+        return {'obstacles': len(self.obstacles), 'projectiles': len(self.projectiles),
+                'particles': self.particles.count, 'powerups': len(self.powerups)}
+
+    def pool_stats(self):
+        return {'projectile': self.projectile_pool.stats(),
+                'obstacle': self.obstacle_pool.stats(),
+                'enemy': self.enemy_pool.stats(),
+                'gc': self.gc_policy.stats(),
+                'audio': self.audio.stats()}
+
+    def run_summary(self):
+        """Outcome and counters of the current (or just finished) run."""
+        summary = {'seed': self.seed, 'difficulty': self.difficulty_levels[self.difficulty_index],
+                   'score': self.score, 'ticks': self.run_ticks, 'orbs': self.orbs_collected,
+                   'kills': self.kills, 'rank': self.last_rank}
+        summary.update(self.run_stats.summary())
+        return summary
+
+    def record_run(self):
+        """Add the run that just ended to its difficulty's leaderboard (saved in
+        the background) and return its rank, or None outside the top N."""
+        self.last_rank = self.scores.record(self.difficulty_levels[self.difficulty_index], self.score,
+                                            orbs=self.orbs_collected, kills=self.kills,
+                                            duration=self.run_ticks / SIM_HZ)
+        self.high_score = max(self.high_score, self.score)
+        return self.last_rank
 
     def get_current_cooldown(self):
         """Return the current shoot cooldown in frames, accounting for active buffs.
@@ -245,14 +557,9 @@ class Game:
                 self.active_buffs[kind] = frames
                 self.active_buff_totals[kind] = frames
                 note_text = kind.replace('_', ' ').title()
-                # simple icons / colors mapping
-                mapping = {
-                    'rapid_fire': ('R', (255,180,50)),
-                    'shield': ('S', (100,200,255)),
-                    'speed': ('V', (200,120,255)),
-                    'damage': ('D', (255,100,120))
-                }
-                note_icon, note_color = mapping.get(kind, ('?', (200,200,200)))
+                # icon / colour come from the shared power-up registry
+                spec = powerup_registry.get(kind)
+                note_icon, note_color = (spec.icon, spec.color) if spec is not None else ('?', (200,200,200))
                 note_dur = frames
                 # immediate effects
                 if kind == 'shield':
@@ -288,121 +595,84 @@ class Game:
             pass
 
     def draw_hud(self, surface=None):
+        """Blit the retained HUD overlay (see hud.py); widgets re-render only when
+        the value they display changes."""
         try:
             surf = surface if surface is not None else self.screen
-            # Energy bar (top-left)
-            eb_w, eb_h = 220, 14
-            ex, ey = 16, 12
-            try:
-                pygame.draw.rect(surf, (22,22,24), (ex, ey, eb_w, eb_h), border_radius=6)
-                fill_w = int(((getattr(self.player, 'energy', 100) or 0) / 100.0) * (eb_w - 4))
-                pygame.draw.rect(surf, (80,200,120), (ex + 2, ey + 2, max(0, fill_w), eb_h - 4), border_radius=6)
-                e_txt = self.font.render(f"Energy: {int(getattr(self.player, 'energy', 0))}", True, (230,230,230))
-                surf.blit(e_txt, (ex + 6, ey + eb_h + 6))
-            except Exception:
-                pass
+            self.hud.draw(surf, self)
+        except Exception:
+            pass
 
-            # Score / Orbs (top-right)
-            try:
-                score_s = self.font.render(f"Score: {self.score}", True, (240,240,220))
-                orbs_s = self.font.render(f"Orbs: {self.orbs_collected}", True, (180,220,255))
-                sx = WIDTH - score_s.get_width() - 18
-                surf.blit(score_s, (sx, 12))
-                surf.blit(orbs_s, (sx, 12 + score_s.get_height() + 6))
-            except Exception:
-                pass
+    def sound_icon_sprite(self, size, enabled):
+        """Pre-rendered sound icon of the given (w, h); muted (enabled=False) adds a red X.
+        Built once per (size, state) and reused every frame.
+        """
+        key = (tuple(size), bool(enabled))
+        icon_s = self._sound_icons.get(key)
+        if icon_s is not None:
+            return icon_s
+        rect = pygame.Rect((0, 0), size)
+        icon_s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        # solid, high-contrast background
+        bg_col = (28, 32, 40, 240)
+        pygame.draw.rect(icon_s, bg_col, (0, 0, rect.width, rect.height), border_radius=12)
+        # subtle inner border
+        try:
+            pygame.draw.rect(icon_s, (255,255,255,14), (2,2,rect.width-4,rect.height-4), border_radius=10)
+        except Exception:
+            pass
 
-            # Active buffs (bottom-left) with progress bars
-            try:
-                bx = 16
-                by = HEIGHT - 120
-                line_h = 28
-                small_font = pygame.font.Font(None, 20)
-                i = 0
-                for k, rem in list(getattr(self, 'active_buffs', {}).items()):
-                    total = getattr(self, 'active_buff_totals', {}).get(k, max(1, rem))
-                    icon_w = 36
-                    label_w = 120
-                    padding = 10
-                    # compute bar width so row fits on screen
-                    max_row_w = WIDTH - 32 - bx
-                    bar_w = max(60, min(160, max_row_w - (icon_w + label_w + padding)))
-                    ix = bx
-                    iy = by + i * line_h
-                    row_w = min(max_row_w, icon_w + label_w + bar_w + padding*2)
-                    # background row
-                    pygame.draw.rect(surf, (18,18,22), (ix, iy, row_w, 22), border_radius=6)
-                    # icon
-                    mapping = {
-                        'rapid_fire': ('R', (255,180,50)),
-                        'shield': ('S', (100,200,255)),
-                        'speed': ('V', (200,120,255)),
-                        'damage': ('D', (255,100,120))
-                    }
-                    icon_letter, icon_col = mapping.get(k, (k[0].upper() if k else '?', (200,200,200)))
-                    try:
-                        pygame.draw.circle(surf, icon_col, (ix+14, iy+11), 8)
-                    except Exception:
-                        pass
-                    # label
-                    lbl = small_font.render(k.replace('_',' ').title(), True, (240,240,240))
-                    surf.blit(lbl, (ix+32, iy+2))
-                    # progress bar
-                    bar_x = ix + icon_w + label_w - 12
-                    max_bar_w = max(48, min(bar_w, WIDTH - (bar_x + 80)))
-                    pygame.draw.rect(surf, (40,40,48), (bar_x, iy+4, max_bar_w, 14), border_radius=6)
-                    ratio = max(0.0, min(1.0, rem / float(total))) if total > 0 else 0.0
-                    pygame.draw.rect(surf, (120,200,255), (bar_x+2, iy+6, int((max_bar_w-4)*ratio), 10), border_radius=6)
-                    # time label clamped
-                    seconds = rem / 60.0
-                    time_lbl = small_font.render(f"{seconds:.1f}s", True, (220,220,220))
-                    time_x = bar_x + max_bar_w + 8
-                    if time_x + time_lbl.get_width() > WIDTH - 12:
-                        time_x = WIDTH - 12 - time_lbl.get_width()
-                    surf.blit(time_lbl, (time_x, iy+2))
-                    i += 1
-            except Exception:
-                pass
+        # speaker glyph (white)
+        sx = int(rect.width * 0.14)
+        sy = rect.height // 2
+        speaker_pts = [
+            (sx, sy - int(rect.height * 0.18)),
+            (sx + int(rect.width * 0.22), sy - int(rect.height * 0.28)),
+            (sx + int(rect.width * 0.22), sy + int(rect.height * 0.28)),
+            (sx, sy + int(rect.height * 0.18))
+        ]
+        pygame.draw.polygon(icon_s, (245,245,245), speaker_pts)
+
+        # waves (bright cyan) - compute rects relative to icon size so they always fit
+        wave_col_outer = (100, 200, 255)
+        wave_col_inner = (160, 230, 255)
+        # outer wave
+        try:
+            w1_x = int(rect.width * 0.48)
+            w1_y = int(rect.height * 0.18)
+            w1_w = max(10, int(rect.width * 0.40))
+            w1_h = max(10, int(rect.height * 0.64))
+            pygame.draw.arc(icon_s, wave_col_outer, (w1_x, w1_y, w1_w, w1_h), math.radians(-45), math.radians(45), max(2, int(rect.width * 0.06)))
+            # inner wave
+            w2_x = int(rect.width * 0.56)
+            w2_y = int(rect.height * 0.24)
+            w2_w = max(8, int(rect.width * 0.32))
+            w2_h = max(8, int(rect.height * 0.56))
+            pygame.draw.arc(icon_s, wave_col_inner, (w2_x, w2_y, w2_w, w2_h), math.radians(-45), math.radians(45), max(2, int(rect.width * 0.045)))
+        except Exception:
+            pass
 
-            # Top-Center notifications (recent pickups) - clamped fully on screen
+        # muted state -> draw clear red X on top
+        if not enabled:
             try:
-                if not hasattr(self, 'powerup_notifications'):
-                    return
-                max_w = min(420, WIDTH - 40)
-                notif_font = pygame.font.Font(None, 24)
-                spacing = 6
-                for idx, n in enumerate(list(self.powerup_notifications)):
-                    t = n.get('timer', 0)
-                    alpha = int(255 * (min(1.0, t / 180.0)))
-                    target_y = 12 + idx * (34 + spacing)
-                    n['y'] = int(n.get('y', -36) + (target_y - n.get('y', -36)) * 0.22)
-                    box_h = 34
-                    box_w = max(160, max_w)
-                    box = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-                    box.fill((12,12,16, int(220 * (alpha/255.0))))
-                    try:
-                        pygame.draw.rect(box, n.get('color',(200,200,200)), (8, 6, 22, 22), border_radius=6)
-                        ic = notif_font.render(str(n.get('icon','?')), True, (18,18,20))
-                        box.blit(ic, (12, 6))
-                    except Exception:
-                        pass
-                    # text with ellipsis if too wide
-                    raw_text = n.get('text','')
-                    txt = notif_font.render(raw_text, True, (240,240,240))
-                    max_text_w = box_w - 64
-                    if txt.get_width() > max_text_w:
-                        text_str = raw_text
-                        while notif_font.size(text_str + '...')[0] > max_text_w and len(text_str) > 0:
-                            text_str = text_str[:-1]
-                        txt = notif_font.render(text_str + '...', True, (240,240,240))
-                    box.blit(txt, (44, 6))
-                    sx = max(12, min(WIDTH - box_w - 12, WIDTH//2 - box_w//2))
-                    surf.blit(box, (sx, n['y']))
+                lx = 8
+                ly = 8
+                rx = rect.width - 8
+                ry = rect.height - 8
+                pygame.draw.line(icon_s, (255, 90, 90), (lx, ly), (rx, ry), max(3, int(rect.width * 0.08)))
+                pygame.draw.line(icon_s, (255, 90, 90), (rx, ly), (lx, ry), max(3, int(rect.width * 0.08)))
             except Exception:
                 pass
+
+        # final small border to help contrast on light backgrounds
+        try:
+            pygame.draw.rect(icon_s, (0,0,0,120), (0,0,rect.width,rect.height), width=1, border_radius=12)
         except Exception:
             pass
 
+        self._sound_icons[key] = icon_s
+        return icon_s
+
     def draw_sound_icon(self):
         """Draw a high-contrast sound icon in the top-right. Always blitted on the main screen.
         Uses self.sound_icon_rect for position so clicks still work.
@@ -412,71 +682,9 @@ class Game:
             rect = getattr(self, 'sound_icon_rect', None)
             if rect is None:
                 return
-            # surface for icon
             try:
-                icon_s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                # solid, high-contrast background
-                bg_col = (28, 32, 40, 240)
-                pygame.draw.rect(icon_s, bg_col, (0, 0, rect.width, rect.height), border_radius=12)
-                # subtle inner border
-                try:
-                    pygame.draw.rect(icon_s, (255,255,255,14), (2,2,rect.width-4,rect.height-4), border_radius=10)
-                except Exception:
-                    pass
-
-                # speaker glyph (white)
-                sx = int(rect.width * 0.14)
-                sy = rect.height // 2
-                speaker_pts = [
-                    (sx, sy - int(rect.height * 0.18)),
-                    (sx + int(rect.width * 0.22), sy - int(rect.height * 0.28)),
-                    (sx + int(rect.width * 0.22), sy + int(rect.height * 0.28)),
-                    (sx, sy + int(rect.height * 0.18))
-                ]
-                pygame.draw.polygon(icon_s, (245,245,245), speaker_pts)
-
-                # waves (bright cyan) - compute rects relative to icon size so they always fit
-                wave_col_outer = (100, 200, 255)
-                wave_col_inner = (160, 230, 255)
-                # outer wave
-                try:
-                    w1_x = int(rect.width * 0.48)
-                    w1_y = int(rect.height * 0.18)
-                    w1_w = max(10, int(rect.width * 0.40))
-                    w1_h = max(10, int(rect.height * 0.64))
-                    pygame.draw.arc(icon_s, wave_col_outer, (w1_x, w1_y, w1_w, w1_h), math.radians(-45), math.radians(45), max(2, int(rect.width * 0.06)))
-                    # inner wave
-                    w2_x = int(rect.width * 0.56)
-                    w2_y = int(rect.height * 0.24)
-                    w2_w = max(8, int(rect.width * 0.32))
-                    w2_h = max(8, int(rect.height * 0.56))
-                    pygame.draw.arc(icon_s, wave_col_inner, (w2_x, w2_y, w2_w, w2_h), math.radians(-45), math.radians(45), max(2, int(rect.width * 0.045)))
-                except Exception:
-                    pass
-
-                # muted state -> draw clear red X on top
-                if not getattr(self, 'music_enabled', True):
-                    try:
-                        lx = 8
-                        ly = 8
-                        rx = rect.width - 8
-                        ry = rect.height - 8
-                        pygame.draw.line(icon_s, (255, 90, 90), (lx, ly), (rx, ry), max(3, int(rect.width * 0.08)))
-                        pygame.draw.line(icon_s, (255, 90, 90), (rx, ly), (lx, ry), max(3, int(rect.width * 0.08)))
-                    except Exception:
-                        pass
-
-                # final small border to help contrast on light backgrounds
-                try:
-                    pygame.draw.rect(icon_s, (0,0,0,120), (0,0,rect.width,rect.height), width=1, border_radius=12)
-                except Exception:
-                    pass
-
-                # draw icon surface to main screen
-                try:
-                    self.screen.blit(icon_s, (rect.x, rect.y))
-                except Exception:
-                    pass
+                icon_s = self.sound_icon_sprite(rect.size, getattr(self, 'music_enabled', True))
+                self.screen.blit(icon_s, (rect.x, rect.y))
             except Exception:
                 try:
                     pygame.draw.rect(self.screen, (60,64,76), rect, border_radius=8)
@@ -488,223 +696,333 @@ class Game:
         except Exception:
             pass
 
-    def draw(self):
-        """Main render entry. Keeps drawing simple and defensive so the game
-        always has a draw implementation even if other parts are incomplete.
-        This version renders the world to an offscreen surface when needed so
-        we can blit it with a small offset for a screen-shake effect while
-        keeping HUD and overlays stable on the screen.
-        """
+    def shake_offset(self):
+        """(dx, dy) to blit the world at: a random jitter that decays with the shake timer."""
+        if getattr(self, 'shake_timer', 0) <= 0:
+            return 0, 0
+        try:
+            base = max(1.0, 18.0)
+            factor = min(1.0, float(self.shake_timer) / base)
+            mag = int(round(getattr(self, 'shake_magnitude', 0) * factor))
+            if mag < 1:
+                return 0, 0
+            return self.render_rng.randint(-mag, mag), self.render_rng.randint(-mag, mag)
+        except Exception:
+            return 0, 0
+
+    def draw_world(self, surface, alpha=1.0):
+        """Orb, pickups, obstacles, projectiles, player and particles, interpolated by alpha."""
         try:
-            # clear main screen
-            self.screen.fill((10, 10, 30))
+            self.orb.draw(surface)
+        except Exception:
+            pass
+        for pu in self.powerups:
+            try:
+                pu.draw(surface)
+            except Exception:
+                pass
+        for ob in list(getattr(self, 'obstacles', [])):
+            try:
+                ob.draw(surface, alpha)
+            except Exception:
+                pass
+        for p in list(getattr(self, 'projectiles', [])):
+            try:
+                p.draw(surface, alpha)
+            except Exception:
+                pass
+        try:
+            self.player.draw(surface, alpha)
+        except Exception:
+            pass
+        try:
+            self.particles.render(surface)
+        except Exception:
+            pass
 
-            # --- START: handle non-shaken states (Start / GameOver) as before ---
+    def draw_bounds(self, alpha=1.0):
+        """Screen rects a PLAYING frame draws moving things into at this alpha:
+        world entities, trail, pickup toasts and particle clusters."""
+        rects = [self.orb.bounds()]
+        rects.extend(pu.bounds() for pu in self.powerups)
+        rects.extend(ob.bounds(alpha) for ob in self.obstacles)
+        rects.extend(p.bounds(alpha) for p in self.projectiles)
+        rects.extend(self.player.bounds(alpha))
+        rects.extend(self.hud.notification_rects(self))
+        rects.extend(self.particles.cluster_rects(WIDTH, HEIGHT))
+        if self.profiler.enabled:
+            # the overlay is redrawn every frame
+            rects.append(self.profiler.overlay_rect)
+        return [r.inflate(2, 2) for r in rects]
+
+    def invalidate_frame(self):
+        """Make the next dirty-rect frame repaint the whole screen."""
+        self._prev_bounds = None
+
+    def draw_dirty(self, alpha=1.0):
+        """Dirty-rect PLAYING frame: clear and redraw only the tiles that held
+        something last frame or hold something now. Returns the changed rects,
+        or None when a full repaint is due (first frame after a full one, or
+        more than DIRTY_FULL_FRACTION of the screen changed).
+        """
+        screen = self.screen
+        cur = self.draw_bounds(alpha)
+        prev = self._prev_bounds
+        self._prev_bounds = cur
+        changed = self.hud.refresh(self)
+        if prev is None:
+            return None
+        tiles = self.dirty_tiles
+        tiles.clear()
+        tiles.add_all(prev + cur + changed)
+        # translucent HUD widgets and the sound icon inside a dirty tile are
+        # redrawn whole, once; their area may spill into further tiles
+        static = [self.sound_icon_rect] + self.hud.areas
+        touched = []
+        grew = True
+        while grew:
+            grew = False
+            for area in static:
+                if area not in touched and tiles.touches(area):
+                    touched.append(area)
+                    tiles.add(area)
+                    grew = True
+        if tiles.coverage() > DIRTY_FULL_FRACTION:
+            return None
+        dirty = tiles.rects()
+        world = self.world
+        for r in dirty:
+            world.fill((10, 10, 30), r)
+        self.draw_world(world, alpha)
+        screen.blits([(world, r.topleft, r) for r in dirty], doreturn=False)
+        self.profiler.lap('world_draw')
+        self.hud.blit(screen, [area for area in touched if area != self.sound_icon_rect])
+        self.hud.draw_notifications(screen, self)
+        if self.sound_icon_rect in touched:
+            self.draw_sound_icon()
+        self.profiler.draw(screen)
+        self.profiler.lap('hud_draw')
+        return dirty
+
+    def menu_screen_key(self):
+        """Everything the Start / Game Over screens display; the cached screen
+        is recomposed only when this changes."""
+        return (self.game_state, self.selected_menu, self.selected_menu_gameover,
+                bool(getattr(self, 'show_overlay', False) or getattr(self, 'show_settings', False)),
+                self.settings_selected, self.music_volume, self.difficulty_index,
+                self.player_color_index, self.high_score, self.score)
+
+    def draw_menu_screen(self):
+        """Blit the pre-rendered Start / Game Over screen (recomposed on state,
+        selection or setting changes) and the pulsing cursor on top of it."""
+        key = self.menu_screen_key()
+        if self._menu_surface is None or key != self._menu_key:
+            if self._menu_surface is None:
+                self._menu_surface = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            surface = self._menu_surface
+            surface.fill((10, 10, 30))
+            self._menu_cursor = None
             if self.game_state == STATE_START:
-                try:
-                    # title & menu draw onto main screen (no shake for menus)
-                    title_surf = self.large_font.render("LightRunner", True, (255, 220, 40))
-                    tr = title_surf.get_rect(center=(WIDTH//2, HEIGHT//6))
-                    self.screen.blit(title_surf, tr)
-                    # high score
-                    hs = self.font.render(f"High Score: {self.high_score}", True, (220,220,200))
-                    self.screen.blit(hs, (WIDTH//2 - hs.get_width()//2, tr.bottom + 8))
-                    # menu
-                    start_y = HEIGHT//3
-                    for i, opt in enumerate(getattr(self, 'menu_options', [])):
-                        is_sel = (i == getattr(self, 'selected_menu', 0))
-                        col = (255,255,255) if is_sel else (180,180,180)
-                        txt = self.font.render(opt, True, col)
-                        tx = WIDTH//2 - txt.get_width()//2
-                        ty = start_y + i * 48
-                        if is_sel:
-                            try:
-                                pygame.draw.rect(self.screen, (22,22,26), (tx-12, ty-6, txt.get_width()+24, txt.get_height()+12), border_radius=8)
-                            except Exception:
-                                pass
-                        self.screen.blit(txt, (tx, ty))
-                    # simple hint
-                    try:
-                        hint_font = pygame.font.Font(None, 22)
-                        h1 = hint_font.render("Use Up/Down to navigate", True, (200,200,200))
-                        h2 = hint_font.render("Use the mouse to attack enemies", True, (200,200,200))
-                        self.screen.blit(h1, (WIDTH//2 - h1.get_width()//2, HEIGHT - 64))
-                        self.screen.blit(h2, (WIDTH//2 - h2.get_width()//2, HEIGHT - 44))
-                    except Exception:
-                        pass
+                self.compose_start_screen(surface)
+            else:
+                self.compose_gameover_screen(surface)
+            self._menu_key = key
+            self.menu_redraws += 1
+        self.screen.blit(self._menu_surface, (0, 0))
+        self.draw_menu_cursor()
+
+    def draw_menu_cursor(self):
+        """Pulsing outline around the selected option, cursor_pulse_speed degrees per second."""
+        rect = self._menu_cursor
+        if rect is None:
+            return
+        try:
+            key = rect.size
+            sprite = self._cursor_sprites.get(key)
+            if sprite is None:
+                sprite = pygame.Surface((rect.width + 8, rect.height + 8), pygame.SRCALPHA)
+                pygame.draw.rect(sprite, (255, 220, 40), sprite.get_rect(), width=2, border_radius=10)
+                self._cursor_sprites[key] = sprite
+            phase = math.radians(self.menu_ticks * self.cursor_pulse_speed / SIM_HZ)
+            sprite.set_alpha(int(150 + 100 * math.sin(phase)))
+            self.screen.blit(sprite, (rect.x - 4, rect.y - 4))
+        except Exception:
+            pass
 
-                    # draw settings overlay/panel if requested
+    def compose_start_screen(self, surface):
+        """Draw the title, menu and (if open) settings panel onto surface."""
+        try:
+            # title & menu (composed once into the cached menu screen)
+            title_surf = render_text(self.large_font, "LightRunner", True, (255, 220, 40))
+            tr = title_surf.get_rect(center=(WIDTH//2, HEIGHT//6))
+            surface.blit(title_surf, tr)
+            # high score
+            hs = render_text(self.font, f"High Score: {self.high_score}", True, (220,220,200))
+            surface.blit(hs, (WIDTH//2 - hs.get_width()//2, tr.bottom + 8))
+            # menu
+            start_y = HEIGHT//3
+            for i, opt in enumerate(getattr(self, 'menu_options', [])):
+                is_sel = (i == getattr(self, 'selected_menu', 0))
+                col = (255,255,255) if is_sel else (180,180,180)
+                txt = render_text(self.font, opt, True, col)
+                tx = WIDTH//2 - txt.get_width()//2
+                ty = start_y + i * 48
+                if is_sel:
+                    self._menu_cursor = pygame.Rect(tx-12, ty-6, txt.get_width()+24, txt.get_height()+12)
                     try:
-                        if getattr(self, 'show_overlay', False) or getattr(self, 'show_settings', False):
-                            panel_w, panel_h = 480, 320
-                            panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-                            panel.fill((16,16,20,220))
-                            # title
-                            title = self.font.render("Settings", True, (240,240,240))
-                            panel.blit(title, (20, 18))
-                            # options
-                            opt_font = pygame.font.Font(None, 28)
-                            opt_y = 64
-                            for i, sopt in enumerate(getattr(self, 'settings_options', [])):
-                                col = (255,255,255) if i == getattr(self, 'settings_selected', 0) else (180,180,180)
-                                txt = opt_font.render(sopt, True, col)
-                                panel.blit(txt, (36, opt_y + i * 38))
-                                try:
-                                    if sopt.lower().startswith('music'):
-                                        val = f"{getattr(self, 'music_volume', 0.3):.1f}"
-                                    elif sopt.lower().startswith('difficulty'):
-                                        val = getattr(self, 'difficulty_levels', [])[getattr(self, 'difficulty_index', 0)]
-                                    elif sopt.lower().startswith('player color'):
-                                        col_idx = getattr(self, 'player_color_index', 0)
-                                        cols = getattr(self, 'player_colors', [])
-                                        if 0 <= col_idx < len(cols):
-                                            sw = pygame.Surface((24,18))
-                                            sw.fill(cols[col_idx])
-                                            panel.blit(sw, (panel_w - 84, opt_y + i * 38))
-                                            val = ""
-                                        else:
-                                            val = ""
-                                    else:
-                                        val = ""
-                                    val_txt = pygame.font.Font(None, 22).render(str(val), True, (200,200,200))
-                                    panel.blit(val_txt, (panel_w - 60 - val_txt.get_width(), opt_y + i * 38))
-                                except Exception:
-                                    pass
-                            try:
-                                sub = pygame.font.Font(None, 20).render("Click an option to cycle it, or Back to return", True, (200,200,200))
-                                panel.blit(sub, (36, panel_h - 40))
-                            except Exception:
-                                pass
-                            sx = WIDTH//2 - panel_w//2
-                            sy = HEIGHT//2 - panel_h//2
-                            self.screen.blit(panel, (sx, sy))
+                        pygame.draw.rect(surface, (22,22,26), self._menu_cursor, border_radius=8)
                     except Exception:
                         pass
-                except Exception:
-                    pass
+                surface.blit(txt, (tx, ty))
+            # simple hint
+            try:
+                hint_font = get_font(22)
+                h1 = render_text(hint_font, "Use Up/Down to navigate", True, (200,200,200))
+                h2 = render_text(hint_font, "Use the mouse to attack enemies", True, (200,200,200))
+                surface.blit(h1, (WIDTH//2 - h1.get_width()//2, HEIGHT - 64))
+                surface.blit(h2, (WIDTH//2 - h2.get_width()//2, HEIGHT - 44))
+            except Exception:
+                pass
 
-            # --- PLAYING: draw the world; apply shake transform if active ---
-            elif self.game_state == STATE_PLAYING:
-                try:
-                    # If shaking, render the world to an offscreen surface and blit with an offset
-                    if getattr(self, 'shake_timer', 0) > 0:
-                        world = pygame.Surface((WIDTH, HEIGHT))
-                        # use same background clear as main screen
-                        world.fill((10, 10, 30))
-                        # draw orb
-                        try:
-                            self.orb.draw(world)
-                        except Exception:
-                            pass
-                        # draw obstacles
-                        for ob in list(getattr(self, 'obstacles', [])):
-                            try:
-                                ob.draw(world)
-                            except Exception:
-                                pass
-                        # draw projectiles
-                        for p in list(getattr(self, 'projectiles', [])):
-                            try:
-                                p.draw(world)
-                            except Exception:
-                                pass
-                        # draw player
-                        try:
-                            self.player.draw(world)
-                        except Exception:
-                            pass
-                        # draw particles into the world so they shake with the scene
+            # draw settings overlay/panel if requested
+            try:
+                if getattr(self, 'show_overlay', False) or getattr(self, 'show_settings', False):
+                    panel_w, panel_h = 480, 320
+                    panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+                    panel.fill((16,16,20,220))
+                    # title
+                    title = render_text(self.font, "Settings", True, (240,240,240))
+                    panel.blit(title, (20, 18))
+                    # options
+                    opt_font = get_font(28)
+                    opt_y = 64
+                    for i, sopt in enumerate(getattr(self, 'settings_options', [])):
+                        col = (255,255,255) if i == getattr(self, 'settings_selected', 0) else (180,180,180)
+                        txt = render_text(opt_font, sopt, True, col)
+                        panel.blit(txt, (36, opt_y + i * 38))
                         try:
-                            self.particles.update(world, WIDTH, HEIGHT)
+                            if sopt.lower().startswith('music'):
+                                val = f"{getattr(self, 'music_volume', 0.3):.1f}"
+                            elif sopt.lower().startswith('difficulty'):
+                                val = getattr(self, 'difficulty_levels', [])[getattr(self, 'difficulty_index', 0)]
+                            elif sopt.lower().startswith('player color'):
+                                col_idx = getattr(self, 'player_color_index', 0)
+                                cols = getattr(self, 'player_colors', [])
+                                if 0 <= col_idx < len(cols):
+                                    sw = pygame.Surface((24,18))
+                                    sw.fill(cols[col_idx])
+                                    panel.blit(sw, (panel_w - 84, opt_y + i * 38))
+                                    val = ""
+                                else:
+                                    val = ""
+                            else:
+                                val = ""
+                            val_txt = render_text(get_font(22), str(val), True, (200,200,200))
+                            panel.blit(val_txt, (panel_w - 60 - val_txt.get_width(), opt_y + i * 38))
                         except Exception:
                             pass
+                    try:
+                        sub = render_text(get_font(20), "Click an option to cycle it, or Back to return", True, (200,200,200))
+                        panel.blit(sub, (36, panel_h - 40))
+                    except Exception:
+                        pass
+                    sx = WIDTH//2 - panel_w//2
+                    sy = HEIGHT//2 - panel_h//2
+                    surface.blit(panel, (sx, sy))
+                    # the cursor follows the settings selection while the panel is open
+                    self._menu_cursor = pygame.Rect(sx + 24, sy + 60 + getattr(self, 'settings_selected', 0) * 38,
+                                                    panel_w - 48, 34)
+            except Exception:
+                pass
+        except Exception:
+            pass
 
-                        # compute offset: decay magnitude as timer decreases for smoother feel
-                        try:
-                            base = max(1.0, 18.0)
-                            factor = min(1.0, float(self.shake_timer) / base)
-                            mag = int(round(getattr(self, 'shake_magnitude', 0) * factor))
-                            if mag < 1:
-                                off_x = off_y = 0
-                            else:
-                                off_x = random.randint(-mag, mag)
-                                off_y = random.randint(-mag, mag)
-                        except Exception:
-                            off_x = off_y = 0
+    def compose_gameover_screen(self, surface):
+        """Draw the Game Over text, options and the final HUD onto surface."""
+        try:
+            go = render_text(self.large_font, "Game Over", True, (255,80,80))
+            surface.blit(go, (WIDTH//2 - go.get_width()//2, HEIGHT//4))
+            sc = render_text(self.font, f"Score: {self.score}", True, (255,255,255))
+            surface.blit(sc, (WIDTH//2 - sc.get_width()//2, HEIGHT//4 + 80))
+            # options
+            start_y = HEIGHT//2
+            for i, opt in enumerate(getattr(self, 'gameover_options', [])):
+                is_sel = (i == getattr(self, 'selected_menu_gameover', 0))
+                col = (255,255,255) if is_sel else (180,180,180)
+                txt = render_text(self.font, opt, True, col)
+                tx = WIDTH//2 - txt.get_width()//2
+                ty = start_y + i * 48
+                if is_sel:
+                    self._menu_cursor = pygame.Rect(tx-12, ty-6, txt.get_width()+24, txt.get_height()+12)
+                    try:
+                        pygame.draw.rect(surface, (22,22,26), self._menu_cursor, border_radius=8)
+                    except Exception:
+                        pass
+                surface.blit(txt, (tx, ty))
+            # show HUD overlay too
+            try:
+                self.draw_hud(surface)
+            except Exception:
+                pass
+        except Exception:
+            pass
 
-                        # blit shaken world to main screen
-                        try:
-                            self.screen.blit(world, (off_x, off_y))
-                        except Exception:
-                            # fallback: draw world normally
-                            try:
-                                self.screen.blit(world, (0,0))
-                            except Exception:
-                                pass
-                    else:
-                        # normal non-shaken drawing (draw directly to main screen)
-                        try:
-                            self.orb.draw(self.screen)
-                        except Exception:
-                            pass
-                        for ob in list(getattr(self, 'obstacles', [])):
-                            try:
-                                ob.draw(self.screen)
-                            except Exception:
-                                pass
-                        for p in list(getattr(self, 'projectiles', [])):
-                            try:
-                                p.draw(self.screen)
-                            except Exception:
-                                pass
-                        try:
-                            self.player.draw(self.screen)
-                        except Exception:
-                            pass
-                        # particles will be drawn below for the non-shake case
-                except Exception:
-                    pass
+    def draw(self, alpha=1.0):
+        """Main render entry. Keeps drawing simple and defensive so the game
+        always has a draw implementation even if other parts are incomplete.
+        While playing, the world is always rendered into the persistent
+        self.world buffer and blitted with a small offset for a screen-shake
+        effect, keeping HUD and overlays stable on the screen.
+        alpha (0..1) is how far the renderer is between the last two simulation
+        ticks; moving entities are drawn interpolated by that amount.
+        Returns the list of changed rects when the dirty-rect renderer drew the
+        frame, or None when the whole screen was repainted.
+        """
+        if self.loading:
+            self.draw_loading_screen()
+            return None
+        try:
+            if (self.dirty_rects_enabled and self.game_state == STATE_PLAYING
+                    and getattr(self, 'shake_timer', 0) <= 0):
+                dirty = self.draw_dirty(alpha)
+                if dirty is not None:
+                    return dirty
+            else:
+                # shake moves the whole world, menus are static: repaint fully
+                self._prev_bounds = None
+        except Exception:
+            self._prev_bounds = None
+        try:
+            # --- START / GAME OVER: pre-rendered screen plus the cursor pulse ---
+            if self.game_state in (STATE_START, STATE_GAMEOVER):
+                self.draw_menu_screen()
+                self.profiler.lap('world_draw')
 
-                # HUD should remain stable on the screen (not shaken)
+            # --- PLAYING: render the world into the persistent buffer; shake is only a blit offset ---
+            elif self.game_state == STATE_PLAYING:
                 try:
-                    self.draw_hud(self.screen)
+                    world = self.world
+                    world.fill((10, 10, 30))
+                    self.draw_world(world, alpha)
+                    off_x, off_y = self.shake_offset()
+                    if off_x or off_y:
+                        # shaking uncovers a strip along the edges
+                        self.screen.fill((10, 10, 30))
+                    self.screen.blit(world, (off_x, off_y))
                 except Exception:
                     pass
+                self.profiler.lap('world_draw')
 
-            # --- GAME OVER: draw on main screen (no shake) ---
-            elif self.game_state == STATE_GAMEOVER:
+                # HUD should remain stable on the screen (not shaken)
                 try:
-                    go = self.large_font.render("Game Over", True, (255,80,80))
-                    self.screen.blit(go, (WIDTH//2 - go.get_width()//2, HEIGHT//4))
-                    sc = self.font.render(f"Score: {self.score}", True, (255,255,255))
-                    self.screen.blit(sc, (WIDTH//2 - sc.get_width()//2, HEIGHT//4 + 80))
-                    # options
-                    start_y = HEIGHT//2
-                    for i, opt in enumerate(getattr(self, 'gameover_options', [])):
-                        is_sel = (i == getattr(self, 'selected_menu_gameover', 0))
-                        col = (255,255,255) if is_sel else (180,180,180)
-                        txt = self.font.render(opt, True, col)
-                        tx = WIDTH//2 - txt.get_width()//2
-                        ty = start_y + i * 48
-                        if is_sel:
-                            try:
-                                pygame.draw.rect(self.screen, (22,22,26), (tx-12, ty-6, txt.get_width()+24, txt.get_height()+12), border_radius=8)
-                            except Exception:
-                                pass
-                        self.screen.blit(txt, (tx, ty))
-                    # show HUD overlay too
-                    try:
-                        self.draw_hud(self.screen)
-                    except Exception:
-                        pass
+                    self.draw_hud(self.screen)
                 except Exception:
                     pass
 
-            # If not shook already in PLAYING branch, draw particles on top (for non-shake case)
+            # menus have no world buffer; their particles go on top of the screen
             try:
-                if not (self.game_state == STATE_PLAYING and getattr(self, 'shake_timer', 0) > 0):
-                    # particles are drawn here for the cases where we didn't render them into the shaken world
-                    self.particles.update(self.screen, WIDTH, HEIGHT)
+                if self.game_state != STATE_PLAYING:
+                    self.particles.render(self.screen)
             except Exception:
                 pass
 
@@ -717,33 +1035,41 @@ class Game:
                     pass
             except Exception:
                 pass
+            self.profiler.draw(self.screen)
+            self.profiler.lap('hud_draw')
         except Exception:
             pass
 
     def update(self):
-        """Per-frame housekeeping for timers, buff expiry and particle updates.
-        This augments gameplay update logic and keeps the powerup UI in sync.
+        """Advance one tick using the live keyboard / mouse state."""
+        self.step(InputState.from_devices())
+
+    def step(self, inputs):
+        """Advance the simulation by exactly one tick.
+        inputs is an InputState, so this never touches the input devices and can
+        be driven headless (see headless.py) or from recorded input.
         """
-        keys = pygame.key.get_pressed()
+        self.ticks += 1
+        self.run_ticks += 1
+        if self.recorder is not None:
+            self.recorder.record(inputs)
 
         # Shooting input: left mouse or spacebar
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
 
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        if (mouse_pressed or keys[pygame.K_SPACE]) and self.shoot_cooldown == 0 and self.game_state == STATE_PLAYING:
-            mx, my = pygame.mouse.get_pos()
+        if inputs.fire and self.shoot_cooldown == 0 and self.game_state == STATE_PLAYING:
             # spawn projectile from player's center aimed at mouse
             px = self.player.x + self.player.width//2
             py = self.player.y + self.player.height//2
-            proj = Projectile(px, py, mx, my, speed=12, damage=self.projectile_damage)
+            proj = self.projectile_pool.acquire(px, py, inputs.mouse_x, inputs.mouse_y, speed=12, damage=self.projectile_damage)
             self.projectiles.append(proj)
             # respect active rapid-fire buff
             self.shoot_cooldown = self.get_current_cooldown()
 
         # Movement
-        self.vel_x = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (keys[pygame.K_LEFT] or keys[pygame.K_a])
-        self.vel_y = (keys[pygame.K_DOWN] or keys[pygame.K_s]) - (keys[pygame.K_UP] or keys[pygame.K_w])
+        self.vel_x = inputs.move_x
+        self.vel_y = inputs.move_y
         self.player.move(self.vel_x, self.vel_y, WIDTH, HEIGHT)
         self.player.update_trail()
 
@@ -755,12 +1081,12 @@ class Game:
             # update high score if needed
             if self.score > self.high_score:
                 self.high_score = self.score
-                self.save_high_score()
                 # trigger new-high animation and sound
                 self.new_high = True
                 self.new_high_timer = 120  # frames (~2s at 60fps)
-                if self.confirm_sound:
-                    self.confirm_sound.play()
+                self.audio.play('confirm', 'gameplay')
+        prof = self.profiler
+        prof.lap('input')
 
         # Obstacles
         self.spawn_timer += 1
@@ -768,85 +1094,40 @@ class Game:
             self.spawn_timer = 0
             self.spawn_obstacle()
 
-        for ob in self.obstacles[:]:
-            ob.update()
-            # remove if offscreen
-            if ob.rect.right < -100 or ob.rect.left > WIDTH + 100 or ob.rect.top > HEIGHT + 100 or ob.rect.bottom < -100:
-                try:
-                    self.obstacles.remove(ob)
-                except ValueError:
-                    pass
+        # one vectorised step moves every obstacle / enemy (chasers steer to the player centre)
+        self.entities.advance((self.player.x + self.player.width/2, self.player.y + self.player.height/2))
+        # remove if offscreen
+        for ob in self.entities.outside(-100, -100, WIDTH + 100, HEIGHT + 100):
+            self.remove_obstacle(ob)
 
-        # Projectiles update and collisions with obstacles/enemies
-        for proj in self.projectiles[:]:
-            proj.update()
-            # remove if expired or offscreen
-            if proj.life <= 0 or proj.x < -50 or proj.x > WIDTH + 50 or proj.y < -50 or proj.y > HEIGHT + 50:
-                try:
-                    self.projectiles.remove(proj)
-                except ValueError:
-                    pass
-                continue
+        # Broadphase: bucket this tick's obstacles, pickups and orb into the grid.
+        # Obstacles removed later in the tick stay in the grid, so track them in `gone`.
+        self.rebuild_broadphase()
+        gone = set()
+        prof.lap('obstacles')
 
-            hit_any = False
-            for ob in self.obstacles[:]:
-                if proj.rect.colliderect(ob.rect):
-                    # apply damage; if dead remove and spawn particles/score
-                    dead = False
-                    try:
-                        dead = ob.take_damage(proj.damage)
-                    except Exception:
-                        # fallback: remove obstacle if it doesn't implement take_damage
-                        dead = True
-                    if dead:
-                        try:
-                            self.obstacles.remove(ob)
-                        except ValueError:
-                            pass
-                        # reward points for kills
-                        self.score += 150
-                        # small confetti / particles
-                        self.particles.burst_confetti(ob.rect.centerx, ob.rect.centery, count=12)
-                        # small chance to spawn a power-up where the obstacle died
-                        if random.random() < 0.15:
-                            try:
-                                from powerup import PowerUp
-                                pu = PowerUp(ob.rect.centerx, ob.rect.centery)
-                                self.powerups.append(pu)
-                            except Exception:
-                                pass
-                        if getattr(self, 'confirm_sound', None):
-                            try:
-                                self.confirm_sound.play()
-                            except Exception:
-                                pass
-                    # remove projectile on hit
-                    try:
-                        self.projectiles.remove(proj)
-                    except ValueError:
-                        pass
-                    hit_any = True
-                    break
-            if hit_any:
-                continue
+        # Projectiles update and collisions with obstacles/enemies
+        self.update_projectiles(gone)
+        prof.lap('projectiles')
 
         # Collision detection with orb and player collisions (unchanged)
         if self.player.rect.colliderect(self.orb.rect):
             self.orb.respawn()
             self.player.energy = min(self.player.energy + 20, 100)
             self.orbs_collected += 1
-            if self.orb_sound:
-                self.orb_sound.play()
+            self.audio.play('orb', 'orb')
 
-        for ob in self.obstacles[:]:
-            if self.player.rect.colliderect(ob.rect):
+        player_rect = self.player.rect
+        for ob in self.collision_candidates(player_rect, 'obstacle', self.obstacles):
+            if id(ob) in gone:
+                continue
+            if player_rect.colliderect(ob.rect):
                 # if shield active, ignore damage
                 if not self.player_invulnerable:
                     self.player.energy -= 20
-                try:
-                    self.obstacles.remove(ob)
-                except ValueError:
-                    pass
+                    self.run_stats.damage_taken += 20
+                gone.add(id(ob))
+                self.remove_obstacle(ob)
                 # trigger small screen shake
                 self.shake_timer = 18
                 self.shake_magnitude = 8
@@ -856,17 +1137,19 @@ class Game:
                     # update high score if needed
                     if self.score > self.high_score:
                         self.high_score = self.score
-                        self.save_high_score()
                         # confetti + new-high
                         self.particles.burst_confetti(self.player.x + self.player.width//2, self.player.y + self.player.height//2, count=60)
                         self.new_high = True
                         self.new_high_timer = 120
-                        if self.confirm_sound:
-                            self.confirm_sound.play()
+                        self.audio.play('confirm', 'gameplay')
+
+        if self.run_ticks % SIM_HZ == 0:
+            self.run_stats.energy.append(round(self.player.energy, 1))
 
         # Score
-        elapsed_seconds = (pygame.time.get_ticks() - self.start_ticks)/1000
+        elapsed_seconds = self.run_ticks / SIM_HZ
         self.score = int(elapsed_seconds*10 + self.orbs_collected*100)
+        prof.lap('collisions')
 
         # Particles
         speed_mag = abs(self.vel_x) + abs(self.vel_y)
@@ -875,9 +1158,11 @@ class Game:
                                 self.player.y+self.player.height/2,
                                 self.vel_x, self.vel_y,
                                 self.player.energy/100)
-        self.particles.update(self.screen, WIDTH, HEIGHT)
+        self.particles.simulate(WIDTH, HEIGHT)
+        prof.lap('particles')
 
         # Power-ups: update on-ground pickups and check for pickup by player
+        near = set(id(pu) for pu in self.collision_candidates(player_rect, 'powerup', self.powerups))
         for pu in self.powerups[:]:
             try:
                 pu.update()
@@ -891,7 +1176,8 @@ class Game:
                     pass
                 continue
             # pickup check
-            if self.player.rect.colliderect(pu.rect):
+            if id(pu) in near and player_rect.colliderect(pu.rect):
+                self.run_stats.pickups[pu.kind] += 1
                 # apply effect
                 try:
                     self.apply_powerup(pu)
@@ -903,11 +1189,7 @@ class Game:
                     pass
                 # confetti/audio on pickup
                 self.particles.burst_confetti(self.player.x + self.player.width//2, self.player.y + self.player.height//2, count=12)
-                if getattr(self, 'confirm_sound', None):
-                    try:
-                        self.confirm_sound.play()
-                    except Exception:
-                        pass
+                self.audio.play('confirm', 'gameplay')
 
         # Active buffs expiration (decrement timers and cleanup)
         expired = []
@@ -974,8 +1256,11 @@ class Game:
         # --- cleanup top-center powerup notifications so they disappear when timer ends ---
         try:
             if hasattr(self, 'powerup_notifications') and isinstance(self.powerup_notifications, list):
-                for n in list(self.powerup_notifications):
+                for idx, n in enumerate(list(self.powerup_notifications)):
                     try:
+                        # slide towards the stacked slot (eased per tick, not per rendered frame)
+                        target_y = 12 + idx * (34 + 6)
+                        n['y'] = int(n.get('y', -36) + (target_y - n.get('y', -36)) * 0.22)
                         n['timer'] = n.get('timer', 0) - 1
                         if n['timer'] <= 0:
                             try:
@@ -991,6 +1276,28 @@ class Game:
         except Exception:
             pass
 
+        # hand this tick's removed entities back to their pools
+        self.flush_releases()
+        # the run ended this tick: record it with its final score
+        if self.game_state != STATE_PLAYING:
+            self.record_run()
+            if self.telemetry is not None:
+                self.telemetry.emit('run_end', **self.run_summary())
+            if self.recorder is not None:
+                self.recorder.finish(self)
+        # one voice per distinct sound triggered this tick
+        self.audio.flush()
+        prof.lap('powerups')
+
+    def step_idle(self):
+        """Advance purely cosmetic state one tick outside of gameplay (menus and
+        game over), so e.g. the game-over confetti keeps falling at the sim rate.
+        """
+        self.particles.simulate(WIDTH, HEIGHT)
+        self.menu_ticks += 1
+        self.audio.flush()
+        self.profiler.lap('particles')
+
     def handle_event(self, event):
         """Handle KEYDOWN for menu navigation and activation.
         Safe to call from the main loop.
@@ -1000,6 +1307,11 @@ class Game:
                 return
             k = event.key
             uni = getattr(event, 'unicode', '')
+            # F3 toggles the frame profiler overlay in any state
+            if k == pygame.K_F3:
+                self.profiler.toggle()
+                self.invalidate_frame()
+                return
             # Global back/escape handling
             if k == pygame.K_ESCAPE:
                 # if in settings overlay, close it; otherwise go to main menu
@@ -1007,6 +1319,8 @@ class Game:
                     self.show_overlay = False
                     self.show_settings = False
                     return
+                if self.game_state == STATE_PLAYING and self.telemetry is not None:
+                    self.telemetry.emit('run_end', abandoned=True, **self.run_summary())
                 self.game_state = STATE_START
                 return
 
@@ -1014,19 +1328,11 @@ class Game:
             if getattr(self, 'show_overlay', False) or getattr(self, 'show_settings', False):
                 if k in (pygame.K_UP, pygame.K_w):
                     self.settings_selected = (self.settings_selected - 1) % len(self.settings_options)
-                    try:
-                        if getattr(self, 'navigate_sound', None):
-                            self.navigate_sound.play()
-                    except Exception:
-                        pass
+                    self.audio.play('navigate')
                     return
                 elif k in (pygame.K_DOWN, pygame.K_s):
                     self.settings_selected = (self.settings_selected + 1) % len(self.settings_options)
-                    try:
-                        if getattr(self, 'navigate_sound', None):
-                            self.navigate_sound.play()
-                    except Exception:
-                        pass
+                    self.audio.play('navigate')
                     return
                 # accept literal '<' and '>' from shifted comma/period as quick controls
                 if uni == '<' or k in (pygame.K_LEFT, pygame.K_COMMA):
@@ -1034,10 +1340,7 @@ class Game:
                     opt = self.settings_options[idx]
                     if opt.lower().startswith('music'):
                         self.music_volume = round(max(0.0, (getattr(self, 'music_volume', 0.3) - 0.1)), 1)
-                        try:
-                            pygame.mixer.music.set_volume(self.music_volume)
-                        except Exception:
-                            pass
+                        self.audio.set_music_volume(self.music_volume)
                     elif opt.lower().startswith('difficulty'):
                         self.difficulty_index = (self.difficulty_index - 1) % len(self.difficulty_levels)
                         try:
@@ -1050,21 +1353,14 @@ class Game:
                             self.player.color = self.player_colors[self.player_color_index]
                         except Exception:
                             pass
-                    try:
-                        if getattr(self, 'navigate_sound', None):
-                            self.navigate_sound.play()
-                    except Exception:
-                        pass
+                    self.audio.play('navigate')
                     return
                 if uni == '>' or k in (pygame.K_RIGHT, pygame.K_PERIOD):
                     idx = getattr(self, 'settings_selected', 0)
                     opt = self.settings_options[idx]
                     if opt.lower().startswith('music'):
                         self.music_volume = round(min(1.0, (getattr(self, 'music_volume', 0.3) + 0.1)), 1)
-                        try:
-                            pygame.mixer.music.set_volume(self.music_volume)
-                        except Exception:
-                            pass
+                        self.audio.set_music_volume(self.music_volume)
                     elif opt.lower().startswith('difficulty'):
                         self.difficulty_index = (self.difficulty_index + 1) % len(self.difficulty_levels)
                         try:
@@ -1080,11 +1376,7 @@ class Game:
                     elif opt.lower().startswith('back'):
                         self.show_overlay = False
                         self.show_settings = False
-                    try:
-                        if getattr(self, 'confirm_sound', None):
-                            self.confirm_sound.play()
-                    except Exception:
-                        pass
+                    self.audio.play('confirm')
                     return
                 elif k in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
                     idx = getattr(self, 'settings_selected', 0)
@@ -1093,10 +1385,7 @@ class Game:
                     if opt.lower().startswith('music'):
                         # step volume by 0.1
                         self.music_volume = round(min(1.0, (getattr(self, 'music_volume', 0.3) + 0.1)), 1)
-                        try:
-                            pygame.mixer.music.set_volume(self.music_volume)
-                        except Exception:
-                            pass
+                        self.audio.set_music_volume(self.music_volume)
                     elif opt.lower().startswith('difficulty'):
                         self.difficulty_index = (self.difficulty_index + 1) % len(self.difficulty_levels)
                         try:
@@ -1112,11 +1401,7 @@ class Game:
                     elif opt.lower().startswith('back'):
                         self.show_overlay = False
                         self.show_settings = False
-                    try:
-                        if getattr(self, 'confirm_sound', None):
-                            self.confirm_sound.play()
-                    except Exception:
-                        pass
+                    self.audio.play('confirm')
                     return
 
             # fallthrough to other states
@@ -1135,7 +1420,6 @@ class Game:
                         try:
                             self.reset()
                             self.game_state = STATE_PLAYING
-                            self.start_ticks = pygame.time.get_ticks()
                         except Exception:
                             pass
                     elif opt.lower().startswith('settings'):
@@ -1156,7 +1440,6 @@ class Game:
                         try:
                             self.reset()
                             self.game_state = STATE_PLAYING
-                            self.start_ticks = pygame.time.get_ticks()
                         except Exception:
                             pass
                     elif opt.lower().startswith('main'):
@@ -1210,10 +1493,7 @@ class Game:
                             opt = self.settings_options[idx]
                             if opt.lower().startswith('music'):
                                 self.music_volume = round(min(1.0, (getattr(self, 'music_volume', 0.3) + 0.1)), 1)
-                                try:
-                                    pygame.mixer.music.set_volume(self.music_volume)
-                                except Exception:
-                                    pass
+                                self.audio.set_music_volume(self.music_volume)
                             elif opt.lower().startswith('difficulty'):
                                 self.difficulty_index = (self.difficulty_index + 1) % len(self.difficulty_levels)
                                 try:
@@ -1229,11 +1509,7 @@ class Game:
                             elif opt.lower().startswith('back'):
                                 self.show_overlay = False
                                 self.show_settings = False
-                            try:
-                                if getattr(self, 'confirm_sound', None):
-                                    self.confirm_sound.play()
-                            except Exception:
-                                pass
+                            self.audio.play('confirm')
                             return
                 except Exception:
                     pass
@@ -1243,7 +1519,7 @@ class Game:
                 try:
                     start_y = HEIGHT // 3
                     for i, opt in enumerate(getattr(self, 'menu_options', [])):
-                        txt = self.font.render(opt, True, (255, 255, 255))
+                        txt = render_text(self.font, opt, True, (255, 255, 255))
                         x = WIDTH // 2 - txt.get_width() // 2
                         y = start_y + i * 48
                         rect = pygame.Rect(x - 12, y - 6, txt.get_width() + 24, txt.get_height() + 12)
@@ -1253,7 +1529,6 @@ class Game:
                                 try:
                                     self.reset()
                                     self.game_state = STATE_PLAYING
-                                    self.start_ticks = pygame.time.get_ticks()
                                 except Exception:
                                     pass
                             elif opt.lower().startswith('settings'):
@@ -1270,7 +1545,7 @@ class Game:
                 try:
                     start_y = HEIGHT // 2
                     for i, opt in enumerate(getattr(self, 'gameover_options', [])):
-                        txt = self.font.render(opt, True, (255, 255, 255))
+                        txt = render_text(self.font, opt, True, (255, 255, 255))
                         x = WIDTH // 2 - txt.get_width() // 2
                         y = start_y + i * 48
                         rect = pygame.Rect(x - 12, y - 6, txt.get_width() + 24, txt.get_height() + 12)
@@ -1280,7 +1555,6 @@ class Game:
                                 try:
                                     self.reset()
                                     self.game_state = STATE_PLAYING
-                                    self.start_ticks = pygame.time.get_ticks()
                                 except Exception:
                                     pass
                             elif opt.lower().startswith('main'):
@@ -1294,55 +1568,14 @@ class Game:
             pass
 
     def toggle_music(self):
-        """Toggle master audio (music + sfx). Saves/restores previous volumes for a smooth mute/unmute.
+        """Toggle master audio (music + sfx); the AudioManager keeps the volumes for unmute.
         handle_mouse already calls this when the sound_icon_rect is clicked.
         """
         try:
             # flip state
             self.music_enabled = not getattr(self, 'music_enabled', True)
-            if not hasattr(self, '_saved_volumes'):
-                self._saved_volumes = {}
-            # music
-            try:
-                if not self.music_enabled:
-                    # save current music volume then mute
-                    try:
-                        self._saved_volumes['music'] = pygame.mixer.music.get_volume()
-                    except Exception:
-                        self._saved_volumes['music'] = getattr(self, 'music_volume', 0.3)
-                    try:
-                        pygame.mixer.music.set_volume(0)
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        pygame.mixer.music.set_volume(self._saved_volumes.get('music', getattr(self, 'music_volume', 0.3)))
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            # sound effects: orb_sound, navigate_sound, confirm_sound
-            for name in ('orb_sound', 'navigate_sound', 'confirm_sound'):
-                try:
-                    snd = getattr(self, name, None)
-                    if snd is None:
-                        continue
-                    key = f'sfx_{name}'
-                    if not self.music_enabled:
-                        try:
-                            self._saved_volumes[key] = snd.get_volume()
-                        except Exception:
-                            self._saved_volumes[key] = 1.0
-                        try:
-                            snd.set_volume(0)
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            snd.set_volume(self._saved_volumes.get(key, 1.0))
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
+            # the sound icon changes look; dirty-rect frames only redraw it when touched
+            self.invalidate_frame()
+            self.audio.set_muted(not self.music_enabled)
         except Exception:
             pass
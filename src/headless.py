@@ -0,0 +1,70 @@
+"""Run the game without a window or audio device.
+
+Uses SDL's dummy video/audio drivers and never calls pygame.display.flip, so the
+simulation can be stepped as fast as the CPU allows (CI boxes, profiling).
+"""
+import os
+import math
+import time
+import pygame
+import fonts
+from game import Game, STATE_PLAYING
+from inputs import InputState
+from startup import init_subsystems, StartupTimer
+
+WIDTH, HEIGHT = 800, 600
+
+
+def init_headless(size=(WIDTH, HEIGHT)):
+    """Initialise pygame on the dummy drivers and return an off-screen display surface.
+    Must be called before any other pygame.display / pygame.mixer call.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    init_subsystems()
+    return pygame.display.set_mode(size)
+
+
+def create_game(size=(WIDTH, HEIGHT), timer=None):
+    """Return a Game bound to a headless display, already in the playing state.
+    `timer` (a startup.StartupTimer) gets one phase per startup step."""
+    timer = timer or StartupTimer()
+    screen = init_headless(size)
+    timer.phase('init')
+    fonts.preload()
+    timer.phase('fonts')
+    game = Game(screen)
+    timer.phase('game')
+    game.finish_loading()
+    timer.phase('assets')
+    # scripted runs stay off the real leaderboard
+    game.scores.path = None
+    game.reset()
+    game.game_state = STATE_PLAYING
+    return game
+
+
+def demo_inputs(tick):
+    """Deterministic scripted input: circle around the screen while firing at the center."""
+    ang = tick / 45.0
+    return InputState(move_x=int(round(math.cos(ang))), move_y=int(round(math.sin(ang))),
+                      fire=True, mouse_x=WIDTH // 2, mouse_y=HEIGHT // 2)
+
+
+def run(game, frames, input_fn=demo_inputs, draw=True):
+    """Step (and optionally draw) `frames` ticks as fast as possible.
+    Restarts the run whenever the player dies so every frame is a gameplay frame.
+    Returns elapsed wall-clock seconds.
+    """
+    prof = game.profiler
+    start = time.perf_counter()
+    prof.begin_frame()
+    for tick in range(frames):
+        if game.game_state != STATE_PLAYING:
+            game.reset()
+            game.game_state = STATE_PLAYING
+        game.step(input_fn(tick))
+        if draw:
+            game.draw()
+        prof.end_frame(game.entity_counts())
+    return time.perf_counter() - start
@@ -0,0 +1,219 @@
+"""Retained-mode HUD.
+
+Every widget (energy bar, score/orbs, one row per active buff) is drawn into a
+persistent transparent overlay and only redrawn when the value it displays
+changes at display precision. Each frame the widget areas of the overlay are
+copied to the screen with one Surface.blits call. The dirty-rect renderer uses
+refresh() / blit() / notification_rects() separately to repaint only what
+changed.
+"""
+import pygame
+from fonts import get_font, render_text
+from powerup import registry
+
+# buff -> (icon letter, colour) for the HUD rows: every timed power-up kind
+BUFF_ICONS = {k.name: (k.icon, k.color) for k in registry if k.duration}
+
+
+class HudLayer:
+    def __init__(self, width, height, font):
+        self.width = width
+        self.height = height
+        self.font = font
+        self.small_font = get_font(20)
+        self.notif_font = get_font(24)
+        self.overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._keys = {}     # widget name -> value it currently shows
+        self._areas = {}    # widget name -> overlay Rect it occupies
+        self._notif_boxes = {}
+        # screen areas touched by widget redraws since the last refresh()
+        self._changed = []
+        # widget redraws since start, for profiling
+        self.redraws = 0
+
+    def invalidate(self):
+        """Force every widget to redraw on the next frame."""
+        self._keys.clear()
+        self._areas.clear()
+        self.overlay.fill((0, 0, 0, 0))
+
+    def _refresh(self, name, key, area, draw_fn, *args):
+        if self._keys.get(name) == key and name in self._areas:
+            return
+        old = self._areas.get(name)
+        if old is not None:
+            self.overlay.fill((0, 0, 0, 0), old)
+            self._changed.append(old)
+        self._changed.append(area)
+        self.overlay.fill((0, 0, 0, 0), area)
+        draw_fn(*args)
+        self._keys[name] = key
+        self._areas[name] = area
+        self.redraws += 1
+
+    def _drop(self, name):
+        area = self._areas.pop(name, None)
+        self._keys.pop(name, None)
+        if area is not None:
+            self.overlay.fill((0, 0, 0, 0), area)
+            self._changed.append(area)
+
+    @property
+    def areas(self):
+        """Screen rects currently covered by HUD widgets."""
+        return list(self._areas.values())
+
+    def draw(self, surface, game):
+        self.refresh(game)
+        self.blit(surface)
+        self.draw_notifications(surface, game)
+
+    def draw_notifications(self, surface, game):
+        # Top-center notifications slide and fade every tick, so they are composited per frame
+        self._draw_notifications(surface, getattr(game, 'powerup_notifications', None))
+
+    def refresh(self, game):
+        """Bring every widget up to date; returns the screen areas that changed."""
+        self._changed = []
+        # Energy bar (top-left)
+        eb_w, eb_h = 220, 14
+        ex, ey = 16, 12
+        energy = getattr(game.player, 'energy', 100) or 0
+        fill_w = max(0, int((energy / 100.0) * (eb_w - 4)))
+        self._refresh('energy', (fill_w, int(energy)),
+                      pygame.Rect(0, 0, ex + eb_w + 8, ey + eb_h + 6 + self.font.get_height() + 4),
+                      self._draw_energy, ex, ey, eb_w, eb_h, fill_w, int(energy))
+
+        # Score / Orbs (top-right)
+        score, orbs = game.score, game.orbs_collected
+        self._refresh('score', (score, orbs),
+                      pygame.Rect(self.width // 2, 0, self.width - self.width // 2, 18 + self.font.get_height() * 2 + 6),
+                      self._draw_score, score, orbs)
+
+        # Active buffs (bottom-left) with progress bars
+        by = self.height - 120
+        line_h = 28
+        rows = 0
+        totals = getattr(game, 'active_buff_totals', {})
+        for k, rem in list(getattr(game, 'active_buffs', {}).items()):
+            total = totals.get(k, max(1, rem))
+            ratio = max(0.0, min(1.0, rem / float(total))) if total > 0 else 0.0
+            iy = by + rows * line_h
+            # tenths of a second and whole pixels of bar are what the row shows
+            self._refresh(f'buff{rows}', (k, int(rem / 6), self._bar_fill(ratio)),
+                          pygame.Rect(0, iy, self.width, line_h),
+                          self._draw_buff_row, k, rem, ratio, iy)
+            rows += 1
+        while f'buff{rows}' in self._areas:
+            self._drop(f'buff{rows}')
+            rows += 1
+        return self._changed
+
+    def blit(self, surface, areas=None):
+        """Copy widget areas of the overlay to surface: all of them, or only
+        those listed in `areas` (e.g. the widgets a dirty-rect frame touched)."""
+        if areas is None:
+            areas = self._areas.values()
+        surface.blits([(self.overlay, area.topleft, area) for area in areas], doreturn=False)
+
+    def notification_layout(self):
+        """(x, box width, box height) of the top-center pickup toasts."""
+        box_w = max(160, min(420, self.width - 40))
+        box_h = 34
+        sx = max(12, min(self.width - box_w - 12, self.width//2 - box_w//2))
+        return sx, box_w, box_h
+
+    def notification_rects(self, game):
+        """Screen rects of the visible pickup toasts."""
+        sx, box_w, box_h = self.notification_layout()
+        return [pygame.Rect(sx, int(n.get('y', 0)), box_w, box_h)
+                for n in getattr(game, 'powerup_notifications', None) or ()]
+
+    def _draw_energy(self, ex, ey, eb_w, eb_h, fill_w, energy):
+        surf = self.overlay
+        pygame.draw.rect(surf, (22,22,24), (ex, ey, eb_w, eb_h), border_radius=6)
+        pygame.draw.rect(surf, (80,200,120), (ex + 2, ey + 2, fill_w, eb_h - 4), border_radius=6)
+        e_txt = render_text(self.font, f"Energy: {energy}", True, (230,230,230))
+        surf.blit(e_txt, (ex + 6, ey + eb_h + 6))
+
+    def _draw_score(self, score, orbs):
+        score_s = render_text(self.font, f"Score: {score}", True, (240,240,220))
+        orbs_s = render_text(self.font, f"Orbs: {orbs}", True, (180,220,255))
+        sx = self.width - score_s.get_width() - 18
+        self.overlay.blit(score_s, (sx, 12))
+        self.overlay.blit(orbs_s, (sx, 12 + score_s.get_height() + 6))
+
+    def _row_layout(self):
+        bx = 16
+        icon_w = 36
+        label_w = 120
+        padding = 10
+        # compute bar width so row fits on screen
+        max_row_w = self.width - 32 - bx
+        bar_w = max(60, min(160, max_row_w - (icon_w + label_w + padding)))
+        row_w = min(max_row_w, icon_w + label_w + bar_w + padding*2)
+        bar_x = bx + icon_w + label_w - 12
+        max_bar_w = max(48, min(bar_w, self.width - (bar_x + 80)))
+        return bx, row_w, bar_x, max_bar_w
+
+    def _bar_fill(self, ratio):
+        max_bar_w = self._row_layout()[3]
+        return int((max_bar_w-4)*ratio)
+
+    def _draw_buff_row(self, k, rem, ratio, iy):
+        surf = self.overlay
+        ix, row_w, bar_x, max_bar_w = self._row_layout()
+        # background row
+        pygame.draw.rect(surf, (18,18,22), (ix, iy, row_w, 22), border_radius=6)
+        # icon
+        icon_letter, icon_col = BUFF_ICONS.get(k, (k[0].upper() if k else '?', (200,200,200)))
+        pygame.draw.circle(surf, icon_col, (ix+14, iy+11), 8)
+        # label
+        lbl = render_text(self.small_font, k.replace('_',' ').title(), True, (240,240,240))
+        surf.blit(lbl, (ix+32, iy+2))
+        # progress bar
+        pygame.draw.rect(surf, (40,40,48), (bar_x, iy+4, max_bar_w, 14), border_radius=6)
+        pygame.draw.rect(surf, (120,200,255), (bar_x+2, iy+6, int((max_bar_w-4)*ratio), 10), border_radius=6)
+        # time label clamped
+        seconds = rem / 60.0
+        time_lbl = render_text(self.small_font, f"{seconds:.1f}s", True, (220,220,220))
+        time_x = bar_x + max_bar_w + 8
+        if time_x + time_lbl.get_width() > self.width - 12:
+            time_x = self.width - 12 - time_lbl.get_width()
+        surf.blit(time_lbl, (time_x, iy+2))
+
+    def _notification_box(self, text, icon, color, box_w, box_h):
+        """Composed pickup toast, cached per (text, icon, colour); faded with set_alpha."""
+        key = (text, icon, color, box_w)
+        box = self._notif_boxes.get(key)
+        if box is not None:
+            return box
+        font = self.notif_font
+        box = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        box.fill((12,12,16,220))
+        pygame.draw.rect(box, color, (8, 6, 22, 22), border_radius=6)
+        box.blit(render_text(font, str(icon), True, (18,18,20)), (12, 6))
+        # text with ellipsis if too wide
+        txt = render_text(font, text, True, (240,240,240))
+        max_text_w = box_w - 64
+        if txt.get_width() > max_text_w:
+            text_str = text
+            while font.size(text_str + '...')[0] > max_text_w and len(text_str) > 0:
+                text_str = text_str[:-1]
+            txt = render_text(font, text_str + '...', True, (240,240,240))
+        box.blit(txt, (44, 6))
+        self._notif_boxes[key] = box
+        return box
+
+    def _draw_notifications(self, surface, notifications):
+        if not notifications:
+            return
+        sx, box_w, box_h = self.notification_layout()
+        for n in list(notifications):
+            try:
+                box = self._notification_box(n.get('text', ''), n.get('icon', '?'),
+                                             tuple(n.get('color', (200,200,200))), box_w, box_h)
+                box.set_alpha(int(255 * (min(1.0, n.get('timer', 0) / 180.0))))
+                surface.blit(box, (sx, n['y']))
+            except Exception:
+                pass
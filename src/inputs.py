@@ -0,0 +1,24 @@
+import pygame
+
+
+class InputState:
+    """Player controls for a single simulation tick.
+    move_x / move_y are -1, 0 or 1; fire is True while the shoot button is held;
+    mouse_x / mouse_y is the aim point in screen coordinates.
+    """
+    def __init__(self, move_x=0, move_y=0, fire=False, mouse_x=0, mouse_y=0):
+        self.move_x = move_x
+        self.move_y = move_y
+        self.fire = fire
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+
+    @classmethod
+    def from_devices(cls):
+        """Sample the live keyboard and mouse state (left mouse or space fires)."""
+        keys = pygame.key.get_pressed()
+        mx, my = pygame.mouse.get_pos()
+        move_x = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (keys[pygame.K_LEFT] or keys[pygame.K_a])
+        move_y = (keys[pygame.K_DOWN] or keys[pygame.K_s]) - (keys[pygame.K_UP] or keys[pygame.K_w])
+        fire = bool(pygame.mouse.get_pressed()[0] or keys[pygame.K_SPACE])
+        return cls(move_x, move_y, fire, mx, my)
@@ -0,0 +1,76 @@
+"""Background asset loading.
+
+AssetLoader runs a list of named load functions on a daemon thread and hands
+the results back through a queue. The main thread polls it once per frame and
+installs each asset as it arrives, so the window paints (and menus respond)
+while slow storage is still being read. Tasks marked non-blocking (music)
+don't hold up `ready`, which gates the loading screen.
+"""
+import queue
+import threading
+
+
+class AssetLoader:
+    def __init__(self):
+        self._tasks = []
+        self._results = queue.Queue()
+        self._thread = None
+        self.total = 0
+        self.done = 0
+        self._blocking_left = 0
+        # name of the task the worker is on (for the progress screen)
+        self.current = None
+
+    def add(self, name, fn, blocking=True):
+        """Queue fn() as task `name`; its return value (None on error) is delivered by poll()."""
+        self._tasks.append((name, fn, blocking))
+        self.total += 1
+        if blocking:
+            self._blocking_left += 1
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        for name, fn, blocking in self._tasks:
+            self.current = name
+            try:
+                value = fn()
+            except Exception as e:
+                print(f"⚠️ Asset loading issue ({name}):", e)
+                value = None
+            self._results.put((name, value, blocking))
+        self.current = None
+
+    def poll(self):
+        """(name, value) for every task finished since the last call, in load order."""
+        out = []
+        while True:
+            try:
+                name, value, blocking = self._results.get_nowait()
+            except queue.Empty:
+                return out
+            self.done += 1
+            if blocking:
+                self._blocking_left -= 1
+            out.append((name, value))
+
+    def wait(self):
+        """Block until the worker has finished every task (results still go through poll)."""
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def ready(self):
+        """Every blocking task has been delivered."""
+        return self._blocking_left <= 0
+
+    @property
+    def finished(self):
+        return self.done >= self.total
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
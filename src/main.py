@@ -1,43 +1,234 @@
+import time
+# reference point for --startup-report, taken before the heavy imports
+LAUNCH = time.perf_counter()
 import pygame
 import sys
-from game import Game, STATE_PLAYING, STATE_START, STATE_GAMEOVER
-
-pygame.init()
-pygame.mixer.init()
+import argparse
+import fonts
+from game import Game, STATE_PLAYING, STATE_START, STATE_GAMEOVER, SIM_HZ
+from inputs import InputState
+from startup import init_subsystems, StartupTimer, STARTUP_BUDGET_MS
 
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("LightRunner")
-
-game = Game(screen)
-
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            
-            pygame.quit()
-            sys.exit()
-        # delegate most key handling to the Game (menus / gameover)
-        elif event.type == pygame.KEYDOWN:
-            game.handle_event(event)
-            if getattr(game, 'request_quit', False):
-                pygame.quit()
-                sys.exit()
-        # forward mouse motion for hover effects
-        elif event.type == pygame.MOUSEMOTION:
-            if hasattr(game, 'handle_mouse_motion'):
-                game.handle_mouse_motion(event)
-        # forward mouse clicks to the game (e.g. sound icon in main menu)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if hasattr(game, 'handle_mouse'):
-                game.handle_mouse(event)
+
+# gameplay advances in fixed SIM_HZ ticks; rendering runs as fast as MAX_RENDER_FPS allows
+SIM_STEP_MS = 1000.0 / SIM_HZ
+MAX_CATCHUP_STEPS = 5
+MAX_FRAME_MS = 250
+MAX_RENDER_FPS = 144
+
+
+def run_windowed(max_fps=MAX_RENDER_FPS, gc_control=False, dirty_rects=False, profile_csv=None,
+                 record_dir=None, telemetry_dir=None, startup_report=False, budget_ms=STARTUP_BUDGET_MS):
+    timer = StartupTimer(LAUNCH)
+    timer.phase('imports')
+    init_subsystems()
+    timer.phase('init')
+
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("LightRunner")
+    timer.phase('display')
+    fonts.preload()
+    timer.phase('fonts')
+
+    game = Game(screen)
+    timer.phase('game')
+    game.dirty_rects_enabled = dirty_rects
+    if gc_control:
+        game.gc_policy.enable()
+    prof = game.profiler
+    if profile_csv is not None:
+        prof.enabled = True
+        prof.csv_path = profile_csv or None
+    if record_dir:
+        from replay import ReplayRecorder
+        game.recorder = ReplayRecorder(record_dir)
+    if telemetry_dir:
+        from telemetry import TelemetryWriter
+        game.telemetry = TelemetryWriter(telemetry_dir)
+    prof.begin_frame()
+    accumulator = 0.0
+    first_frame = True
+
+    def shutdown(status=0):
+        if game.recorder is not None:
+            game.recorder.finish(game)
+        # let a pending leaderboard write and queued telemetry reach the disk
+        game.scores.flush()
+        if game.telemetry is not None:
+            # a run cut short by closing the window still counts in the fleet data
+            if game.game_state == STATE_PLAYING:
+                game.telemetry.emit('run_end', abandoned=True, **game.run_summary())
+            game.telemetry.close()
+        prof.close()
+        pygame.quit()
+        sys.exit(status)
+
+    while True:
+        # sounds / music / high score arrive from the loader thread
+        game.poll_assets()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                shutdown()
+            # nothing to interact with until the loading screen is gone
+            elif game.loading:
+                continue
+            # the window contents may be lost; repaint everything next frame
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                game.invalidate_frame()
+            # delegate most key handling to the Game (menus / gameover)
+            elif event.type == pygame.KEYDOWN:
+                game.handle_event(event)
                 if getattr(game, 'request_quit', False):
-                    pygame.quit()
-                    sys.exit()
+                    shutdown()
+            # forward mouse motion for hover effects
+            elif event.type == pygame.MOUSEMOTION:
+                if hasattr(game, 'handle_mouse_motion'):
+                    game.handle_mouse_motion(event)
+            # forward mouse clicks to the game (e.g. sound icon in main menu)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if hasattr(game, 'handle_mouse'):
+                    game.handle_mouse(event)
+                    if getattr(game, 'request_quit', False):
+                        shutdown()
+
+        # run as many fixed ticks as the elapsed time calls for, but never more
+        # than MAX_CATCHUP_STEPS; beyond that the backlog is dropped so a slow
+        # machine loses rendered frames instead of spiralling
+        prof.lap('events')
+        inputs = InputState.from_devices() if game.game_state == STATE_PLAYING else None
+        steps = 0
+        while accumulator >= SIM_STEP_MS and steps < MAX_CATCHUP_STEPS:
+            if game.game_state == STATE_PLAYING:
+                game.step(inputs)
+            else:
+                game.step_idle()
+            accumulator -= SIM_STEP_MS
+            steps += 1
+        if steps >= MAX_CATCHUP_STEPS:
+            accumulator = min(accumulator, SIM_STEP_MS)
+
+        dirty = game.draw(min(1.0, accumulator / SIM_STEP_MS))
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        # tick() returns the real frame time which feeds the accumulator; clamp
+        # long stalls (window drag, breakpoints) so they don't fast-forward the game
+        frame_ms = game.clock.tick(max_fps)
+        accumulator += min(frame_ms, MAX_FRAME_MS)
+        if game.game_state == STATE_PLAYING:
+            game.run_stats.add_frame(frame_ms)
+        prof.lap('present')
+        prof.end_frame(game.entity_counts())
+
+        if first_frame:
+            first_frame = False
+            timer.phase('first frame')
+        if startup_report:
+            # background loading overlaps the phases above: report when it landed
+            if not game.loading:
+                timer.mark('menu ready')
+            if game.loader.finished:
+                timer.mark('assets loaded')
+                print(timer.report(budget_ms))
+                shutdown(0 if timer.total_ms <= budget_ms else 1)
+
+
+def run_headless(frames, draw=True, gc_control=False, dirty_rects=False, profile_csv=None,
+                 telemetry_dir=None, startup_report=False, budget_ms=STARTUP_BUDGET_MS):
+    """Step the game with scripted input and report simulation throughput."""
+    import headless
+    timer = StartupTimer(LAUNCH)
+    timer.phase('imports')
+    game = headless.create_game((WIDTH, HEIGHT), timer)
+    if startup_report:
+        game.step(headless.demo_inputs(0))
+        game.draw()
+        timer.phase('first frame')
+        print(timer.report(budget_ms))
+        pygame.quit()
+        return 0 if timer.total_ms <= budget_ms else 1
+    game.dirty_rects_enabled = dirty_rects
+    if profile_csv is not None:
+        game.profiler.enabled = True
+        game.profiler.csv_path = profile_csv or None
+    if gc_control:
+        game.gc_policy.enable()
+    if telemetry_dir:
+        from telemetry import TelemetryWriter
+        game.telemetry = TelemetryWriter(telemetry_dir)
+    elapsed = headless.run(game, frames, draw=draw)
+    if game.telemetry is not None:
+        game.telemetry.close()
+    fps = frames / elapsed if elapsed > 0 else float('inf')
+    print(f"{frames} frames in {elapsed:.3f}s ({fps:.0f} frames/s, draw={'on' if draw else 'off'})")
+    for name, stats in game.pool_stats().items():
+        print(f"  {name}: {stats}")
+    if game.profiler.enabled:
+        print(f"  {'phase':<12}{'mean':>8}{'p95':>8}{'p99':>8}  (ms, last {game.profiler.window} frames)")
+        for name, (mean, p95, p99) in game.profiler.stats().items():
+            print(f"  {name:<12}{mean:8.3f}{p95:8.3f}{p99:8.3f}")
+        game.profiler.close()
+    pygame.quit()
+    return 0
+
+
+def run_replay(path, draw=True):
+    """Play a recorded run back headless at full speed; exit status 1 if it diverged,
+    2 if the file can't be read."""
+    import headless
+    from replay import Replay, play
+    try:
+        rep = Replay.load(path)
+    except (OSError, ValueError) as e:
+        # e.g. recorded before the last simulation change (replay.VERSION)
+        print(f"⚠️ Replay load issue: {path}: {e}")
+        return 2
+    game = Game(headless.init_headless((WIDTH, HEIGHT)))
+    elapsed, ticks, matched = play(game, rep, draw=draw)
+    rate = ticks / elapsed if elapsed > 0 else float('inf')
+    print(f"{path}: {ticks}/{len(rep)} ticks in {elapsed:.3f}s ({rate:.0f} ticks/s, draw={'on' if draw else 'off'})")
+    print(f"  seed {rep.seed}, difficulty {game.difficulty_levels[rep.difficulty]}, "
+          f"score {game.score} (recorded {rep.score}): {'identical' if matched else 'DIVERGED'}")
+    pygame.quit()
+    return 0 if matched else 1
 
-    if game.game_state == STATE_PLAYING:
-        game.update()
 
-    game.draw()
-    pygame.display.flip()
-    game.clock.tick(60)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LightRunner")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window or audio device and report frames/s")
+    parser.add_argument("--frames", type=int, default=3000, help="ticks to run in headless mode")
+    parser.add_argument("--no-draw", action="store_true", help="headless / replay: skip Game.draw, simulate only")
+    parser.add_argument("--fps", type=int, default=MAX_RENDER_FPS, help="render frame cap (0 = uncapped)")
+    parser.add_argument("--gc-control", action="store_true",
+                        help="freeze startup objects and only run the cyclic GC between runs")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="repaint and present only the changed screen areas (low-power displays)")
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="CSV",
+                        help="enable the per-phase frame profiler (F3 toggles it in game); "
+                             "optionally stream per-frame rows to CSV")
+    parser.add_argument("--record", metavar="DIR",
+                        help="save every run as a replay file in DIR (run-<date>-<time>-<pid>-<n>.lrr)")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play a recorded run back headless at full speed and check the outcome")
+    parser.add_argument("--telemetry", metavar="DIR",
+                        help="write per-run telemetry to DIR as rotating compressed JSONL "
+                             "(summarise with tools/telemetry_summary.py)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print a cold-start time breakdown up to the first frame and loaded assets, "
+                             "then exit (status 1 if over budget)")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS, metavar="MS",
+                        help=f"cold-start budget for --startup-report (default {STARTUP_BUDGET_MS:.0f} ms)")
+    args = parser.parse_args()
+    if args.replay:
+        sys.exit(run_replay(args.replay, draw=not args.no_draw))
+    elif args.headless:
+        sys.exit(run_headless(args.frames, draw=not args.no_draw, gc_control=args.gc_control,
+                              dirty_rects=args.dirty_rects, profile_csv=args.profile,
+                              telemetry_dir=args.telemetry, startup_report=args.startup_report, budget_ms=args.startup_budget))
+    else:
+        run_windowed(max_fps=args.fps, gc_control=args.gc_control, dirty_rects=args.dirty_rects,
+                     profile_csv=args.profile, record_dir=args.record, telemetry_dir=args.telemetry,
+                     startup_report=args.startup_report, budget_ms=args.startup_budget)
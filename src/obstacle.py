@@ -1,110 +1,176 @@
 import pygame
 import random
 import math
+from entity_store import StoreView
+from sprites import atlas, HEALTH_BAR_H, HEALTH_BAR_GAP
 
-class Obstacle:
-    def __init__(self, screen_width=800, screen_height=600, color=(255,50,50), speed=4, hp=1):
+class Obstacle(StoreView):
+    def __init__(self, screen_width=800, screen_height=600, color=(255,50,50), speed=4, hp=1, store=None, rng=None):
+        self.rect = None
+        self.reset(screen_width, screen_height, color, speed, hp, store, rng)
+
+    def reset(self, screen_width=800, screen_height=600, color=(255,50,50), speed=4, hp=1, store=None, rng=None):
+        """(Re)initialise in place, reusing the Rect; lets ObjectPool recycle obstacles."""
+        self.detach()
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.color = color
         self.speed = speed
-        self.hp = hp
+        self._hp = hp
         self.max_hp = max(1, hp)
-        self.rect = self.spawn_rect()
+        self.rect = self.spawn_rect(self.rect, rng)
+        self._prev = (self.rect.x, self.rect.y)
+        # when given an EntityStore, state lives in its arrays and it moves us in bulk
+        if store is not None:
+            self.attach(store)
 
-    def spawn_rect(self):
-        width = random.randint(20,60)
-        height = random.randint(20,60)
-        y = random.randint(0, self.screen_height - height)
-        return pygame.Rect(self.screen_width, y, width, height)
+    def spawn_rect(self, rect=None, rng=None):
+        """Random spawn box at the right edge; fills `rect` in place when given.
+        Draws from `rng` (a random.Random) or the global generator."""
+        rng = rng or random
+        width = rng.randint(20,60)
+        height = rng.randint(20,60)
+        y = rng.randint(0, self.screen_height - height)
+        if rect is None:
+            return pygame.Rect(self.screen_width, y, width, height)
+        rect.update(self.screen_width, y, width, height)
+        return rect
 
     def update(self):
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
         self.rect.x -= self.speed
+        self._push_position()
 
     def take_damage(self, dmg):
         self.hp -= dmg
         return self.hp <= 0
 
-    def draw_health_bar(self, surface):
+    def interpolated_rect(self, alpha=1.0):
+        """Rect blended between the previous and current tick position."""
+        if alpha >= 1.0:
+            return self.rect
+        return self.rect.move(int((self.prev_x - self.rect.x) * (1.0 - alpha)),
+                              int((self.prev_y - self.rect.y) * (1.0 - alpha)))
+
+    def bounds(self, alpha=1.0):
+        """Screen rect draw() touches, health bar included."""
+        rect = self.interpolated_rect(alpha)
+        if self.max_hp > 1:
+            return rect.union((rect.x, rect.y - HEALTH_BAR_H - HEALTH_BAR_GAP, rect.width, HEALTH_BAR_H))
+        return rect.copy()
+
+    def draw_health_bar(self, surface, rect=None):
         if self.max_hp <= 1:
             return
-        # small bar above obstacle
-        bar_w = self.rect.width
-        bar_h = 6
-        bx = self.rect.x
-        by = self.rect.y - bar_h - 6
-        # background
-        pygame.draw.rect(surface, (30,30,30), (bx, by, bar_w, bar_h), border_radius=3)
-        # fill
-        fill_w = max(0, int((self.hp / self.max_hp) * bar_w))
-        pygame.draw.rect(surface, (200,50,50), (bx, by, fill_w, bar_h), border_radius=3)
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect)
-        self.draw_health_bar(surface)
-
-class Enemy:
+        if rect is None:
+            rect = self.rect
+        # small bar above obstacle, one cached strip per filled width
+        fill_w = max(0, int((self.hp / self.max_hp) * rect.width))
+        surface.blit(atlas.health_bar(rect.width, fill_w, (200,50,50)),
+                     (rect.x, rect.y - HEALTH_BAR_H - HEALTH_BAR_GAP))
+
+    def draw(self, surface, alpha=1.0):
+        rect = self.interpolated_rect(alpha)
+        surface.blit(atlas.body('obstacle', rect.width, rect.height, self.color), rect)
+        self.draw_health_bar(surface, rect)
+
+class Enemy(StoreView):
     """A simple enemy that can chase the player."""
-    def __init__(self, screen_width=800, screen_height=600, color=(180,50,200), speed=2.5, player=None, hp=3):
+    def __init__(self, screen_width=800, screen_height=600, color=(180,50,200), speed=2.5, player=None, hp=3, store=None, rng=None):
+        self.rect = None
+        self.reset(screen_width, screen_height, color, speed, player, hp, store, rng)
+
+    def reset(self, screen_width=800, screen_height=600, color=(180,50,200), speed=2.5, player=None, hp=3, store=None, rng=None):
+        """(Re)initialise in place, reusing the Rect; lets ObjectPool recycle enemies."""
+        self.detach()
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.color = color
         self.speed = speed
         self.player = player
-        self.hp = hp
+        self._hp = hp
         self.max_hp = max(1, hp)
-        self.rect = self.spawn_rect()
+        self.rect = self.spawn_rect(self.rect, rng)
+        self._prev = (self.rect.x, self.rect.y)
+        self._push_position()
+        if store is not None:
+            self.attach(store, chase=player is not None)
 
-    def spawn_rect(self):
-        size = random.randint(24,40)
-        side = random.choice(['left','right','top','bottom'])
+    def spawn_rect(self, rect=None, rng=None):
+        """Random spawn box just off one screen edge; fills `rect` in place when given.
+        Draws from `rng` (a random.Random) or the global generator."""
+        rng = rng or random
+        size = rng.randint(24,40)
+        side = rng.choice(['left','right','top','bottom'])
         if side == 'left':
             x = -size
-            y = random.randint(0, self.screen_height - size)
+            y = rng.randint(0, self.screen_height - size)
         elif side == 'right':
             x = self.screen_width
-            y = random.randint(0, self.screen_height - size)
+            y = rng.randint(0, self.screen_height - size)
         elif side == 'top':
-            x = random.randint(0, self.screen_width - size)
+            x = rng.randint(0, self.screen_width - size)
             y = -size
         else:
-            x = random.randint(0, self.screen_width - size)
+            x = rng.randint(0, self.screen_width - size)
             y = self.screen_height
-        return pygame.Rect(x, y, size, size)
+        if rect is None:
+            return pygame.Rect(x, y, size, size)
+        rect.update(x, y, size, size)
+        return rect
 
     def update(self):
+        """Step this enemy alone. Moves in float steps like EntityStore.advance,
+        but without the separation term (that needs the other enemies)."""
+        x, y = self.position
+        self.prev_x = x
+        self.prev_y = y
         if self.player is not None:
             # move towards player's center
             px = self.player.x + self.player.width/2
             py = self.player.y + self.player.height/2
-            dx = px - (self.rect.x + self.rect.width/2)
-            dy = py - (self.rect.y + self.rect.height/2)
+            dx = px - (x + self.rect.width/2)
+            dy = py - (y + self.rect.height/2)
             dist = math.hypot(dx, dy) or 1
-            self.rect.x += int(self.speed * (dx/dist))
-            self.rect.y += int(self.speed * (dy/dist))
+            x += self.speed * (dx/dist)
+            y += self.speed * (dy/dist)
         else:
             # fallback to moving left
-            self.rect.x -= int(self.speed)
+            x -= int(self.speed)
+        self.position = (x, y)
 
     def take_damage(self, dmg):
         self.hp -= dmg
         return self.hp <= 0
 
-    def draw_health_bar(self, surface):
+    def interpolated_rect(self, alpha=1.0):
+        """Rect blended between the previous and current (sub-pixel) tick position."""
+        if alpha >= 1.0:
+            return self.rect
+        x, y = self.position
+        return pygame.Rect(math.floor(self.prev_x + (x - self.prev_x) * alpha),
+                           math.floor(self.prev_y + (y - self.prev_y) * alpha),
+                           self.rect.width, self.rect.height)
+
+    def bounds(self, alpha=1.0):
+        """Screen rect draw() touches, health bar included."""
+        rect = self.interpolated_rect(alpha)
+        if self.max_hp > 1:
+            return rect.union((rect.x, rect.y - HEALTH_BAR_H - HEALTH_BAR_GAP, rect.width, HEALTH_BAR_H))
+        return rect.copy()
+
+    def draw_health_bar(self, surface, rect=None):
         if self.max_hp <= 1:
             return
-        bar_w = self.rect.width
-        bar_h = 6
-        bx = self.rect.x
-        by = self.rect.y - bar_h - 6
-        pygame.draw.rect(surface, (30,30,30), (bx, by, bar_w, bar_h), border_radius=3)
-        fill_w = max(0, int((self.hp / self.max_hp) * bar_w))
-        pygame.draw.rect(surface, (160,80,200), (bx, by, fill_w, bar_h), border_radius=3)
-
-    def draw(self, surface):
-        # draw as a rounded rect for variety
-        try:
-            pygame.draw.rect(surface, self.color, self.rect, border_radius=6)
-        except Exception:
-            pygame.draw.rect(surface, self.color, self.rect)
-        self.draw_health_bar(surface)
+        if rect is None:
+            rect = self.rect
+        fill_w = max(0, int((self.hp / self.max_hp) * rect.width))
+        surface.blit(atlas.health_bar(rect.width, fill_w, (160,80,200)),
+                     (rect.x, rect.y - HEALTH_BAR_H - HEALTH_BAR_GAP))
+
+    def draw(self, surface, alpha=1.0):
+        rect = self.interpolated_rect(alpha)
+        # drawn as a rounded rect for variety (pre-rendered in the atlas)
+        surface.blit(atlas.body('enemy', rect.width, rect.height, self.color), rect)
+        self.draw_health_bar(surface, rect)
@@ -2,21 +2,31 @@ import pygame
 import random
 
 class Orb:
-    def __init__(self, radius=15, color=(0,255,255), screen_width=800, screen_height=600):
+    __slots__ = ('radius', 'color', 'screen_width', 'screen_height', 'x', 'y', 'rect', 'rng')
+
+    def __init__(self, radius=15, color=(0,255,255), screen_width=800, screen_height=600, rng=None):
+        # placement draws from rng (a random.Random) or the global generator
+        self.rng = rng or random
         self.radius = radius
         self.color = color
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.x = random.randint(radius, screen_width-radius)
-        self.y = random.randint(radius, screen_height-radius)
+        self.x = self.rng.randint(radius, screen_width-radius)
+        self.y = self.rng.randint(radius, screen_height-radius)
+        self.rect = pygame.Rect(self.x - radius, self.y - radius, radius*2, radius*2)
 
-    @property
-    def rect(self):
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius*2, self.radius*2)
+    def sync_rect(self):
+        """Update the persistent rect after x / y change."""
+        self.rect.center = (self.x, self.y)
 
     def respawn(self):
-        self.x = random.randint(self.radius, self.screen_width-self.radius)
-        self.y = random.randint(self.radius, self.screen_height-self.radius)
+        self.x = self.rng.randint(self.radius, self.screen_width-self.radius)
+        self.y = self.rng.randint(self.radius, self.screen_height-self.radius)
+        self.sync_rect()
+
+    def bounds(self):
+        """Screen rect draw() touches."""
+        return self.rect.inflate(2, 2)
 
     def draw(self, surface):
         pygame.draw.circle(surface, self.color, (self.x, self.y), self.radius)
@@ -1,67 +1,186 @@
-import random
 import pygame
-import math
+import numpy as np
+
+# Fixed colour palette; particles store an index into it instead of a tuple.
+# The trail bands quantise the old random colour ranges so the look is unchanged.
+_WARM = [(255, g, b) for g in range(200, 256, 5) for b in range(100, 181, 10)]
+_COOL = [(150, g, 255) for g in range(100, 181, 10)]
+_LOW = [(200, 50, 200)]
+_CONFETTI = [(255, 80, 80), (80, 255, 120), (80, 200, 255), (255, 200, 80), (200, 120, 255)]
+
+PALETTE = _WARM + _COOL + _LOW + _CONFETTI
+# (first index, number of entries) for each band
+WARM_BAND = (0, len(_WARM))
+COOL_BAND = (WARM_BAND[0] + WARM_BAND[1], len(_COOL))
+LOW_BAND = (COOL_BAND[0] + COOL_BAND[1], len(_LOW))
+CONFETTI_BAND = (LOW_BAND[0] + LOW_BAND[1], len(_CONFETTI))
+
+GRAVITY = 0.06
+BOUNCE = -0.6
+# particles are drawn as QUAD x QUAD squares
+QUAD = 3
+
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    """Particle engine backed by preallocated NumPy arrays (structure of arrays).
+    Live particles occupy slots [0, count); dead ones are compacted away with a
+    boolean mask each update. Emission beyond `capacity` is dropped.
+    """
+    def __init__(self, capacity=2048, seed=None):
+        self.capacity = int(capacity)
+        self.count = 0
+        self.x = np.zeros(self.capacity, dtype=np.float32)
+        self.y = np.zeros(self.capacity, dtype=np.float32)
+        self.vx = np.zeros(self.capacity, dtype=np.float32)
+        self.vy = np.zeros(self.capacity, dtype=np.float32)
+        self.life = np.zeros(self.capacity, dtype=np.int16)
+        self.color = np.zeros(self.capacity, dtype=np.uint8)
+        self.rng = np.random.default_rng(seed)
+        # how many particles were rejected because the pool was full
+        self.dropped = 0
+        # render caches: palette mapped per pixel format, and 1-colour quads for the blit path
+        self._mapped_cache = {}
+        self._quad_cache = {}
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, n):
+        """Return the slice of free slots for n new particles (possibly shorter)."""
+        start = self.count
+        end = min(self.capacity, start + n)
+        self.dropped += n - (end - start)
+        self.count = end
+        return slice(start, end), end - start
 
     def emit(self, x, y, vel_x, vel_y, energy_ratio):
-        for _ in range(random.randint(2,5)):
-            if energy_ratio > 0.6:
-                color = (255, random.randint(200,255), random.randint(100,180))
-            elif energy_ratio > 0.3:
-                color = (150, random.randint(100,180), 255)
-            else:
-                color = (200, 50, 200)
-            self.particles.append({
-                "x": x,
-                "y": y,
-                "vx": random.uniform(-2,2) - vel_x*0.3,
-                "vy": random.uniform(-2,2) - vel_y*0.3,
-                "life": random.randint(20,35),
-                "color": color
-            })
+        if energy_ratio > 0.6:
+            first, size = WARM_BAND
+        elif energy_ratio > 0.3:
+            first, size = COOL_BAND
+        else:
+            first, size = LOW_BAND
+        sl, n = self._reserve(int(self.rng.integers(2, 6)))
+        if n <= 0:
+            return
+        rng = self.rng
+        self.x[sl] = x
+        self.y[sl] = y
+        self.vx[sl] = rng.uniform(-2, 2, n) - vel_x*0.3
+        self.vy[sl] = rng.uniform(-2, 2, n) - vel_y*0.3
+        self.life[sl] = rng.integers(20, 36, n)
+        self.color[sl] = first + rng.integers(0, size, n)
 
     def burst_confetti(self, x, y, count=40):
         """Create a celebratory confetti burst at (x,y)."""
-        colors = [
-            (255, 80, 80), (80, 255, 120), (80, 200, 255), (255, 200, 80), (200, 120, 255)
-        ]
-        for _ in range(count):
-            ang = random.uniform(0, math.pi*2)
-            speed = random.uniform(2, 6)
-            vx = math.cos(ang) * speed + random.uniform(-1,1)
-            vy = math.sin(ang) * speed + random.uniform(-2,1)
-            col = random.choice(colors)
-            self.particles.append({
-                "x": x,
-                "y": y,
-                "vx": vx,
-                "vy": vy,
-                "life": random.randint(40,80),
-                "color": col
-            })
+        sl, n = self._reserve(count)
+        if n <= 0:
+            return
+        rng = self.rng
+        ang = rng.uniform(0, np.pi*2, n)
+        speed = rng.uniform(2, 6, n)
+        self.x[sl] = x
+        self.y[sl] = y
+        self.vx[sl] = np.cos(ang) * speed + rng.uniform(-1, 1, n)
+        self.vy[sl] = np.sin(ang) * speed + rng.uniform(-2, 1, n)
+        self.life[sl] = rng.integers(40, 81, n)
+        self.color[sl] = CONFETTI_BAND[0] + rng.integers(0, CONFETTI_BAND[1], n)
+
+    def simulate(self, screen_width, screen_height):
+        """Advance every live particle one tick: integrate, apply gravity, bounce
+        off the screen edges, then compact the dead ones away. Does not draw.
+        """
+        n = self.count
+        if n == 0:
+            return
+        x, y, vx, vy, life = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.life[:n]
+        x += vx
+        y += vy
+        # confetti affected by gravity
+        vy += GRAVITY
+        life -= 1
+        vx[(x <= 0) | (x >= screen_width)] *= BOUNCE
+        vy[(y <= 0) | (y >= screen_height)] *= BOUNCE
+
+        alive = life > 0
+        live = int(np.count_nonzero(alive))
+        if live != n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.color):
+                arr[:live] = arr[:n][alive]
+            self.count = live
+
+    def render(self, surface, offset=(0, 0)):
+        """Draw every live particle as a small square. Pure drawing: calling it
+        several times per tick (e.g. render interpolation) does not age particles.
+        """
+        n = self.count
+        if n == 0:
+            return
+        xs = self.x[:n].astype(np.intp) + int(offset[0])
+        ys = self.y[:n].astype(np.intp) + int(offset[1])
+        try:
+            self._render_pixels(surface, xs, ys, self.color[:n])
+        except Exception:
+            # surfaces without direct pixel access (e.g. 24-bit) take the blit path
+            self._render_blits(surface, xs, ys, self.color[:n])
+
+    def cluster_rects(self, screen_width, screen_height, cell=64):
+        """One rect per coarse grid cell holding on-screen particles: the area
+        render() touches, for dirty-rect redraws."""
+        n = self.count
+        if n == 0:
+            return []
+        cols = -(-screen_width // cell)
+        rows = -(-screen_height // cell)
+        # off-screen particles are not drawn; park them in a border cell
+        cx = np.clip(np.floor_divide(self.x[:n].astype(np.intp), cell), -1, cols)
+        cy = np.clip(np.floor_divide(self.y[:n].astype(np.intp), cell), -1, rows)
+        occupied = np.zeros((cols + 2) * (rows + 2), dtype=np.bool_)
+        occupied[(cx + 1) * (rows + 2) + (cy + 1)] = True
+        cells = np.flatnonzero(occupied)
+        size = cell + QUAD
+        return [pygame.Rect((k // (rows + 2) - 1) * cell, (k % (rows + 2) - 1) * cell, size, size)
+                for k in cells.tolist()]
+
+    def _mapped_palette(self, surface):
+        """PALETTE converted to raw pixel values for this surface's pixel format."""
+        key = (surface.get_bitsize(), surface.get_masks())
+        mapped = self._mapped_cache.get(key)
+        if mapped is None:
+            mapped = np.array([surface.map_rgb(c) for c in PALETTE], dtype=np.int64)
+            self._mapped_cache[key] = mapped
+        return mapped
+
+    def _render_pixels(self, surface, xs, ys, colors):
+        """Batched path: write all quads straight into the pixel array, one
+        vectorised assignment per pixel of the QUAD x QUAD footprint.
+        """
+        w, h = surface.get_size()
+        cols = self._mapped_palette(surface)[colors]
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            for dx in range(QUAD):
+                px = xs + dx
+                in_x = (px >= 0) & (px < w)
+                for dy in range(QUAD):
+                    py = ys + dy
+                    m = in_x & (py >= 0) & (py < h)
+                    pixels[px[m], py[m]] = cols[m]
+        finally:
+            # release the surface lock
+            del pixels
+
+    def _render_blits(self, surface, xs, ys, colors):
+        quads = self._quad_cache
+        if not quads:
+            for i, c in enumerate(PALETTE):
+                q = pygame.Surface((QUAD, QUAD))
+                q.fill(c)
+                quads[i] = q
+        surface.blits([(quads[c], (x, y)) for x, y, c in zip(xs.tolist(), ys.tolist(), colors.tolist())],
+                      doreturn=False)
 
     def update(self, screen, screen_width, screen_height):
-        for p in self.particles[:]:
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
-            # confetti affected by gravity
-            p["vy"] += 0.06
-            p["life"] -= 1
-            if p["x"] <= 0 or p["x"] >= screen_width:
-                p["vx"] *= -0.6
-            if p["y"] <= 0 or p["y"] >= screen_height:
-                p["vy"] *= -0.6
-            if p["life"] <= 0:
-                self.particles.remove(p)
-            else:
-                alpha = max(0, int(255 * (p["life"]/80)))
-                # draw as small rectangle for confetti-like look
-                try:
-                    col = p["color"]
-                    surf_col = (*col, alpha)
-                    pygame.draw.rect(screen, surf_col, (int(p["x"]), int(p["y"]), 3, 3))
-                except Exception:
-                    pass
+        """Simulate one tick and draw (kept for callers that want both)."""
+        self.simulate(screen_width, screen_height)
+        self.render(screen)
@@ -0,0 +1,150 @@
+"""High-score and leaderboard persistence.
+
+ScoreStore keeps a top-N leaderboard per difficulty (score, orbs, kills,
+duration and a timestamp per run). Reading is lazy: the file is parsed on
+the asset loader thread, or on first use. Writes never block the frame:
+record() snapshots the data and a background worker writes it to a
+temporary file in the same directory, fsyncs it and renames it over the
+old one, so a crash mid-write leaves the previous file intact.
+
+The file stays readable by older versions, which only look at
+{"high_score": N}; such a file is also accepted as input.
+"""
+import os
+import json
+import time
+import queue
+import tempfile
+import threading
+
+FORMAT_VERSION = 2
+TOP_N = 10
+
+
+class ScoreStore:
+    def __init__(self, path, top_n=TOP_N):
+        # path None keeps everything in memory (replays, benchmarks)
+        self.path = path
+        self.top_n = top_n
+        self._boards = None
+        self._legacy_best = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._worker = None
+
+    # --- reading ---------------------------------------------------------------
+
+    def load(self):
+        """Parse the file (once; safe to call from any thread). Returns self."""
+        with self._lock:
+            if self._boards is None:
+                self._boards, self._legacy_best = self._read()
+        return self
+
+    def _read(self):
+        boards = {}
+        best = 0
+        # read once: the owner may switch to in-memory (path None) while the loader runs
+        path = self.path
+        if not path or not os.path.exists(path):
+            return boards, best
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            best = int(data.get("high_score", 0))
+            for difficulty, entries in (data.get("leaderboards") or {}).items():
+                rows = [dict(e, score=int(e["score"])) for e in entries
+                        if isinstance(e, dict) and "score" in e]
+                rows.sort(key=lambda e: e["score"], reverse=True)
+                boards[str(difficulty)] = rows[:self.top_n]
+        except Exception as e:
+            print("⚠️ High score load issue:", e)
+        return boards, best
+
+    @property
+    def high_score(self):
+        """Best score on any board (or the single score of an old-format file)."""
+        self.load()
+        with self._lock:
+            tops = [rows[0]["score"] for rows in self._boards.values() if rows]
+            return max([self._legacy_best] + tops)
+
+    def leaderboard(self, difficulty):
+        """Copy of the top runs for `difficulty`, best first."""
+        self.load()
+        with self._lock:
+            return [dict(e) for e in self._boards.get(difficulty, [])]
+
+    # --- writing ---------------------------------------------------------------
+
+    def record(self, difficulty, score, orbs=0, kills=0, duration=0.0):
+        """Add a finished run; returns its 1-based rank on the board, or None if
+        it didn't make the top N. The file is rewritten in the background."""
+        self.load()
+        entry = {"score": int(score), "orbs": int(orbs), "kills": int(kills),
+                 "duration": round(float(duration), 2),
+                 "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with self._lock:
+            rows = self._boards.setdefault(difficulty, [])
+            rank = next((i for i, e in enumerate(rows) if entry["score"] > e["score"]), len(rows))
+            if rank >= self.top_n:
+                return None
+            rows.insert(rank, entry)
+            del rows[self.top_n:]
+            snapshot = self._snapshot()
+        self._save_later(snapshot)
+        return rank + 1
+
+    def _snapshot(self):
+        tops = [rows[0]["score"] for rows in self._boards.values() if rows]
+        return json.dumps({"version": FORMAT_VERSION,
+                           "high_score": max([self._legacy_best] + tops),
+                           "leaderboards": self._boards}, indent=1)
+
+    def _save_later(self, text):
+        if not self.path:
+            return
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="score-writer", daemon=True)
+            self._worker.start()
+        self._queue.put(text)
+
+    def _run(self):
+        while True:
+            text = self._queue.get()
+            # only the newest snapshot matters
+            while True:
+                try:
+                    newer = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+                text = newer
+            try:
+                self._write(text)
+            except Exception as e:
+                print("⚠️ High score save issue:", e)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, text):
+        """Write-to-temp-then-rename, so readers see the old file or the new one."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(prefix=".highscore-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def flush(self):
+        """Block until queued writes are on disk (call before exiting)."""
+        if self._worker is not None:
+            self._queue.join()
@@ -1,41 +1,122 @@
 import pygame
+from collections import deque
+
+# glow layers of each trail point: (rgb, base alpha, alpha lost per trail index, radius divisor)
+TRAIL_GLOW = (
+    ((255, 255, 200), 120, 3, 1),
+    ((255, 240, 150), 80, 2, 2),
+    ((255, 200, 100), 40, 1, 4),
+)
+
+# (size, trail index, glow colours) -> pre-rendered glow sprite, shared by all players
+_glow_cache = {}
+
+# trail lengths share the sprites of the next multiple of this; a shorter trail uses
+# the newest end of its bucket, so only a handful of lengths are ever rendered
+TRAIL_BUCKET = 8
+
+
+def glow_sprite(size, index, colors=TRAIL_GLOW):
+    """Return the cached glow sprite for a trail point of radius `size` at `index`."""
+    key = (size, index, colors)
+    sprite = _glow_cache.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        for rgb, base_alpha, falloff, div in colors:
+            pygame.draw.circle(sprite, (*rgb, max(0, base_alpha - index*falloff)), (size, size), size//div)
+        try:
+            sprite = sprite.convert_alpha()
+        except pygame.error:
+            # no display mode set yet; the plain SRCALPHA surface still works
+            pass
+        _glow_cache[key] = sprite
+    return sprite
+
+
+def trail_sprites(length, colors=TRAIL_GLOW):
+    """(sprite, half size) for every index of a trail that currently holds `length` points."""
+    out = []
+    for i in range(length):
+        size = int(40 * (i / length) + 10)
+        out.append((glow_sprite(size, i, colors), size))
+    return out
+
 
 class Player:
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'width', 'height', 'color', 'speed', 'energy',
+                 'trail', 'MAX_TRAIL_LENGTH', 'trail_colors', '_trail_sprites', 'rect')
+
     def __init__(self, x, y, width=50, height=50, color=(255, 255, 0), speed=5, max_trail=40):
         self.x = x
         self.y = y
+        # position at the start of the last simulation tick (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
         self.width = width
         self.height = height
         self.color = color
         self.speed = speed
         self.energy = 100
-        self.trail = []
+        # persistent Rect, kept in sync by move() instead of rebuilt on every access
+        self.rect = pygame.Rect(x, y, width, height)
+        # fixed-size ring buffer of recent centre positions, oldest first
+        self.trail = deque(maxlen=max_trail)
         self.MAX_TRAIL_LENGTH = max_trail
+        self.trail_colors = TRAIL_GLOW
+        # trail length bucket -> trail_sprites(), built on first use
+        self._trail_sprites = {}
+
+    def build_trail_sprites(self, colors=None):
+        """Drop the cached glow sprites (rebuilt lazily on next draw); call on glow colour change."""
+        if colors is not None:
+            self.trail_colors = colors
+        self._trail_sprites = {}
 
-    @property
-    def rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+    def sprites_for(self, length):
+        """(sprite, half size) for each point of a trail holding `length` points."""
+        bucket = min(-(-length // TRAIL_BUCKET) * TRAIL_BUCKET, self.MAX_TRAIL_LENGTH)
+        sprites = self._trail_sprites.get(bucket)
+        if sprites is None:
+            sprites = self._trail_sprites[bucket] = trail_sprites(bucket, self.trail_colors)
+        return sprites if bucket == length else sprites[bucket - length:]
 
     def move(self, vel_x, vel_y, screen_width, screen_height):
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += vel_x * self.speed
         self.y += vel_y * self.speed
         self.x = max(0, min(screen_width - self.width, self.x))
         self.y = max(0, min(screen_height - self.height, self.y))
+        self.sync_rect()
+
+    def sync_rect(self):
+        """Update the persistent rect after x / y change."""
+        self.rect.topleft = (self.x, self.y)
 
     def update_trail(self):
         self.trail.append((self.x + self.width // 2, self.y + self.height // 2))
-        if len(self.trail) > self.MAX_TRAIL_LENGTH:
-            self.trail.pop(0)
-
-    def draw(self, surface):
-        # Draw trail
-        for i, pos in enumerate(self.trail):
-            progress = i / len(self.trail)
-            size = int(40 * progress + 10)
-            glow_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (255, 255, 200, max(0, 120 - i*3)), (size, size), size)
-            pygame.draw.circle(glow_surface, (255, 240, 150, max(0, 80 - i*2)), (size, size), size//2)
-            pygame.draw.circle(glow_surface, (255, 200, 100, max(0, 40 - i)), (size, size), size//4)
-            surface.blit(glow_surface, (pos[0]-size, pos[1]-size))
+
+    def bounds(self, alpha=1.0, chunk=8):
+        """Screen rects draw() touches: the body plus the trail glow, merged in
+        runs of `chunk` consecutive points so a long trail stays a few rects."""
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        rects = [pygame.Rect(int(x), int(y), self.width, self.height)]
+        if self.trail:
+            boxes = [pygame.Rect(pos[0]-size, pos[1]-size, size*2, size*2)
+                     for (_, size), pos in zip(self.sprites_for(len(self.trail)), self.trail)]
+            for i in range(0, len(boxes), chunk):
+                rects.append(boxes[i].unionall(boxes[i+1:i+chunk]))
+        return rects
+
+    def draw(self, surface, alpha=1.0):
+        """alpha blends between the previous and current tick position (0..1)."""
+        # Draw trail: one batched blit of the pre-rendered glow sprites
+        if self.trail:
+            sprites = self.sprites_for(len(self.trail))
+            surface.blits([(sprite, (pos[0]-size, pos[1]-size))
+                           for (sprite, size), pos in zip(sprites, self.trail)], doreturn=False)
         # Draw player
-        pygame.draw.rect(surface, self.color, self.rect)
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        pygame.draw.rect(surface, self.color, (int(x), int(y), self.width, self.height))
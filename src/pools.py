@@ -0,0 +1,88 @@
+"""Object recycling and garbage-collector control for gameplay.
+
+Projectiles, obstacles and enemies live for a few seconds at most; recycling
+them through an ObjectPool keeps allocation churn (and with it, cyclic GC
+pauses) out of the frame. GcPolicy optionally keeps the collector from running
+during play at all and collects at state transitions instead.
+"""
+import gc
+import time
+
+
+class ObjectPool:
+    """Free-list of instances of `cls`. acquire() re-initialises a recycled
+    instance in place through its reset(...) method (same arguments as the
+    constructor) or builds a new one when the pool is empty.
+    """
+    def __init__(self, cls, max_size=512):
+        self.cls = cls
+        self.max_size = max_size
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        self.released += 1
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def __len__(self):
+        return len(self._free)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'released': self.released,
+                'free': len(self._free), 'hit_rate': round(self.hit_rate, 3)}
+
+
+class GcPolicy:
+    """Optional GC policy: once enabled, everything allocated so far is moved to
+    the permanent generation (gc.freeze), automatic collection is disabled while
+    a run is being played, and a full collection happens when play ends.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.playing = False
+        self.collections = 0
+        self.collect_ms = 0.0
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        gc.collect()
+        gc.freeze()
+        if self.playing:
+            gc.disable()
+
+    def enter_play(self):
+        self.playing = True
+        if self.enabled:
+            gc.disable()
+
+    def leave_play(self):
+        self.playing = False
+        if self.enabled:
+            start = time.perf_counter()
+            gc.collect()
+            self.collect_ms += (time.perf_counter() - start) * 1000.0
+            self.collections += 1
+            gc.enable()
+
+    def stats(self):
+        return {'enabled': self.enabled, 'collections': self.collections,
+                'collect_ms': round(self.collect_ms, 3)}
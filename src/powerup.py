@@ -1,69 +1,144 @@
 import pygame
 import math
+import os
+import json
 import random
+from collections import namedtuple
+from types import MappingProxyType
+from fonts import get_font, render_text
+
+POWERUPS_PATH = os.path.join(os.path.dirname(__file__), "../assets/powerups.json")
+
+# One immutable entry per power-up kind; duration is in seconds (0 = instant effect)
+PowerUpKind = namedtuple('PowerUpKind', ('name', 'duration', 'color', 'icon'))
+
+# built-in kinds, used when the data file is missing or unreadable
+DEFAULT_KINDS = (
+    PowerUpKind('health', 0, (80, 200, 120), '+'),
+    PowerUpKind('rapid_fire', 6, (255, 180, 50), 'R'),
+    PowerUpKind('shield', 6, (100, 200, 255), 'S'),
+    PowerUpKind('speed', 5, (200, 120, 255), 'V'),
+    PowerUpKind('damage', 6, (255, 100, 120), 'D'),
+)
+
+RADIUS = 14
+# ticks on the ground before a pickup vanishes (12 seconds)
+LIFETIME = 60 * 12
+# bob: 4 px amplitude, one radian per 240 ms at the 60 Hz simulation rate
+BOB_AMPLITUDE = 4
+BOB_RATE = (1000.0 / 60) / 240.0
+
+
+class PowerUpRegistry:
+    """Shared, read-only table of power-up kinds (flyweights). Pickups only
+    store their kind's name; duration, colour, icon and the pre-rendered
+    glow + icon sprite live here once per kind.
+    """
+    def __init__(self, kinds=DEFAULT_KINDS):
+        self._kinds = MappingProxyType({k.name: k for k in kinds})
+        self.names = tuple(self._kinds)
+        self._sprites = {}
+
+    @classmethod
+    def load(cls, path=POWERUPS_PATH):
+        """Registry from a JSON file of {name: {duration, color, icon}}; falls
+        back to the built-in kinds if the file is missing or malformed."""
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            kinds = [PowerUpKind(str(name), float(spec.get('duration', 0)),
+                                 tuple(int(c) for c in spec.get('color', (200, 200, 200))),
+                                 str(spec.get('icon', '?')))
+                     for name, spec in data.items()]
+            if kinds:
+                return cls(kinds)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print("⚠️ Power-up data issue:", e)
+        return cls()
+
+    def __getitem__(self, name):
+        return self._kinds[name]
+
+    def get(self, name, default=None):
+        return self._kinds.get(name, default)
+
+    def __iter__(self):
+        return iter(self._kinds.values())
+
+    def __len__(self):
+        return len(self._kinds)
+
+    def sprite(self, name):
+        """Glow, disc, ring and icon letter of `name`, composed once."""
+        sprite = self._sprites.get(name)
+        if sprite is not None:
+            return sprite
+        kind = self._kinds.get(name)
+        col = kind.color if kind is not None else (200, 200, 200)
+        r = RADIUS
+        sprite = pygame.Surface((r*4, r*4), pygame.SRCALPHA)
+        center = (r*2, r*2)
+        # glow
+        pygame.draw.circle(sprite, (*col, 24), center, r*2)
+        # main circle
+        pygame.draw.circle(sprite, col, center, r)
+        # inner ring
+        pygame.draw.circle(sprite, (255,255,255), center, r-4, width=2)
+        # a simple letter to indicate type
+        try:
+            txt = render_text(get_font(22), kind.icon if kind is not None else '?', True, (30,30,30))
+            sprite.blit(txt, txt.get_rect(center=center))
+        except Exception:
+            pass
+        try:
+            sprite = sprite.convert_alpha()
+        except pygame.error:
+            pass
+        self._sprites[name] = sprite
+        return sprite
+
+
+registry = PowerUpRegistry.load()
+
 
 class PowerUp:
     """Simple pickup that either grants an instant effect (health) or a timed buff.
-    Types: 'health', 'rapid_fire', 'shield', 'speed', 'damage'
+    Kinds come from the shared registry ('health', 'rapid_fire', 'shield',
+    'speed', 'damage' by default). Random kind and bob phase are drawn from
+    `rng` (a random.Random) or the global generator.
     """
-    def __init__(self, x, y, kind=None):
+    __slots__ = ('x', 'y', 'kind', 'life', 'bob_phase', 'rect')
+
+    radius = RADIUS
+
+    def __init__(self, x, y, kind=None, rng=None):
+        rng = rng or random
         self.x = int(x)
         self.y = int(y)
-        self.radius = 14
-        self.kind = kind if kind is not None else random.choice(['health','rapid_fire','shield','speed','damage'])
-        # durations in seconds for timed effects
-        self.durations = {
-            'rapid_fire': 6,
-            'shield': 6,
-            'speed': 5,
-            'damage': 6
-        }
-        self.duration = self.durations.get(self.kind, 0)
-        # life on ground in frames
-        self.life = 60 * 12  # 12 seconds
-        self.spawn_tick = pygame.time.get_ticks()
-        # visual mapping
-        self.colors = {
-            'health': (80, 200, 120),
-            'rapid_fire': (255, 180, 50),
-            'shield': (100, 200, 255),
-            'speed': (200, 120, 255),
-            'damage': (255, 100, 120)
-        }
-        self.icon_letters = {
-            'health': '+',
-            'rapid_fire': 'R',
-            'shield': 'S',
-            'speed': 'V',
-            'damage': 'D'
-        }
-        self.bob_phase = random.uniform(0, math.pi*2)
+        self.kind = kind if kind is not None else rng.choice(registry.names)
+        # life on ground in ticks
+        self.life = LIFETIME
+        self.bob_phase = rng.uniform(0, math.pi*2)
+        self.rect = pygame.Rect(self.x - RADIUS, self.y - RADIUS, RADIUS*2, RADIUS*2)
 
     @property
-    def rect(self):
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius*2, self.radius*2)
+    def duration(self):
+        kind = registry.get(self.kind)
+        return kind.duration if kind is not None else 0
+
+    @property
+    def bob(self):
+        """Vertical bobbing offset for drawing, driven by the ticks lived so far."""
+        return int(math.sin((LIFETIME - self.life) * BOB_RATE + self.bob_phase) * BOB_AMPLITUDE)
 
     def update(self):
         self.life -= 1
-        # bobbing motion for visual
-        t = (pygame.time.get_ticks() / 240.0) + self.bob_phase
-        self._bob = int(math.sin(t) * 4)
+
+    def bounds(self):
+        """Screen rect draw() touches."""
+        return pygame.Rect(self.x - RADIUS*2, self.y - RADIUS*2 + self.bob, RADIUS*4, RADIUS*4)
 
     def draw(self, surface):
-        col = self.colors.get(self.kind, (200,200,200))
-        # draw glow
-        glow = pygame.Surface((self.radius*4, self.radius*4), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*col, 24), (self.radius*2, self.radius*2), self.radius*2)
-        surface.blit(glow, (self.x - self.radius*2, self.y - self.radius*2 + getattr(self, '_bob', 0)))
-        # main circle
-        pygame.draw.circle(surface, col, (self.x, self.y + getattr(self, '_bob', 0)), self.radius)
-        # inner ring
-        pygame.draw.circle(surface, (255,255,255), (self.x, self.y + getattr(self, '_bob', 0)), self.radius-4, width=2)
-        # draw a simple letter to indicate type
-        try:
-            font = pygame.font.Font(None, 22)
-            txt = font.render(self.icon_letters.get(self.kind, '?'), True, (30,30,30))
-            rect = txt.get_rect(center=(self.x, self.y + getattr(self, '_bob', 0)))
-            surface.blit(txt, rect)
-        except Exception:
-            pass
+        surface.blit(registry.sprite(self.kind), (self.x - RADIUS*2, self.y - RADIUS*2 + self.bob))
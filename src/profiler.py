@@ -0,0 +1,164 @@
+"""Per-phase frame profiler with an on-screen overlay and CSV export.
+
+Code under measurement calls lap(phase) at the end of each phase: the time
+since the previous lap is charged to that phase, so a frame is fully covered
+without nesting. Laps of the same phase within one frame (several simulation
+ticks) add up. end_frame() closes the frame, keeps a rolling window for the
+overlay's mean / p95 / p99 and streams one CSV row per frame.
+
+Toggle with F3 in game, `--profile` on the command line, or the
+LIGHTRUNNER_PROFILE=1 environment variable (LIGHTRUNNER_PROFILE_CSV=path
+also writes the CSV). Disabled, lap() is an attribute check and a return.
+"""
+import os
+import csv
+import time
+from collections import deque
+import numpy as np
+import pygame
+from fonts import get_font
+
+PHASES = (
+    'events',       # event pump (main loop)
+    'input',        # input, movement, shooting, energy
+    'obstacles',    # spawning, bulk advance, off-screen culling
+    'projectiles',  # projectile update and collision loop
+    'collisions',   # orb and player collisions, score
+    'particles',    # particle emission and simulation
+    'powerups',     # pickups, buffs, timers, notifications
+    'world_draw',   # world layer (or menu screen)
+    'hud_draw',     # HUD, sound icon, this overlay
+    'present',      # display flip / update and clock.tick wait
+)
+COUNTS = ('obstacles', 'projectiles', 'particles', 'powerups')
+
+
+class FrameProfiler:
+    def __init__(self, window=240, csv_path=None, refresh_every=15):
+        self.enabled = False
+        self.window = window
+        self.csv_path = csv_path
+        self.refresh_every = refresh_every
+        self.frames = 0
+        self._index = {name: i for i, name in enumerate(PHASES)}
+        self._current = [0.0] * len(PHASES)
+        self._last = 0.0
+        self._history = deque(maxlen=window)
+        self._counts = {}
+        self._csv_file = None
+        self._csv = None
+        self._overlay = None
+        self.overlay_rect = pygame.Rect(0, 0, 0, 0)
+
+    @classmethod
+    def from_env(cls):
+        prof = cls(csv_path=os.environ.get('LIGHTRUNNER_PROFILE_CSV') or None)
+        if os.environ.get('LIGHTRUNNER_PROFILE', '') not in ('', '0') or prof.csv_path:
+            prof.enabled = True
+        return prof
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.begin_frame()
+        else:
+            self._overlay = None
+            self.flush()
+
+    def begin_frame(self):
+        self._current = [0.0] * len(PHASES)
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to `phase`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[self._index[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self, counts=None):
+        """Close the frame: record it, stream it to the CSV, start the next one."""
+        if not self.enabled:
+            return
+        ms = [t * 1000.0 for t in self._current]
+        self._history.append(ms)
+        self._counts = counts or {}
+        self.frames += 1
+        if self.csv_path:
+            self._write_row(ms)
+        if self.frames % self.refresh_every == 0:
+            self._overlay = None
+        self.begin_frame()
+
+    def stats(self):
+        """{phase: (mean, p95, p99)} in ms over the rolling window, plus 'total'."""
+        if not self._history:
+            return {}
+        data = np.array(self._history)
+        data = np.column_stack((data, data.sum(axis=1)))
+        mean = data.mean(axis=0)
+        p95, p99 = np.percentile(data, (95, 99), axis=0)
+        names = PHASES + ('total',)
+        return {name: (float(mean[i]), float(p95[i]), float(p99[i])) for i, name in enumerate(names)}
+
+    def _write_row(self, ms):
+        try:
+            if self._csv is None:
+                self._csv_file = open(self.csv_path, 'w', newline='')
+                self._csv = csv.writer(self._csv_file)
+                self._csv.writerow(('frame', 'total_ms') + tuple(f'{p}_ms' for p in PHASES) + COUNTS)
+            self._csv.writerow([self.frames, f'{sum(ms):.4f}'] + [f'{v:.4f}' for v in ms]
+                               + [self._counts.get(c, 0) for c in COUNTS])
+        except Exception as e:
+            print("⚠️ Profiler CSV issue:", e)
+            self.csv_path = None
+
+    def flush(self):
+        if self._csv_file is not None:
+            self._csv_file.flush()
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv = None
+
+    def _render_overlay(self):
+        font = get_font(18)
+        color = (220, 230, 220)
+        stats = self.stats()
+        rows = [('phase', 'mean', 'p95', 'p99')]
+        for name in PHASES + ('total',):
+            mean, p95, p99 = stats.get(name, (0.0, 0.0, 0.0))
+            rows.append((name, f"{mean:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+        # numbers change on every refresh: render directly instead of filling the shared text cache
+        cells = [[font.render(text, True, color) for text in row] for row in rows]
+        counts = font.render('  '.join(f"{c} {self._counts.get(c, 0)}" for c in COUNTS), True, color)
+        # first column left-aligned, number columns right-aligned
+        widths = [max(row[i].get_width() for row in cells) for i in range(4)]
+        gap = 12
+        line_h = font.get_linesize()
+        w = max(sum(widths) + gap * 3, counts.get_width()) + 16
+        h = line_h * (len(cells) + 1) + 12
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for r, row in enumerate(cells):
+            y = 6 + r * line_h
+            panel.blit(row[0], (8, y))
+            x = 8 + widths[0]
+            for i in range(1, 4):
+                x += gap + widths[i]
+                panel.blit(row[i], (x - row[i].get_width(), y))
+        panel.blit(counts, (8, 6 + len(cells) * line_h))
+        return panel
+
+    def draw(self, surface):
+        """Overlay in the bottom-right corner; its text refreshes every refresh_every frames."""
+        if not self.enabled:
+            return
+        if self._overlay is None:
+            self._overlay = self._render_overlay()
+        sw, sh = surface.get_size()
+        self.overlay_rect = self._overlay.get_rect(bottomright=(sw - 8, sh - 8))
+        surface.blit(self._overlay, self.overlay_rect)
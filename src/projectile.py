@@ -3,9 +3,19 @@ import pygame
 import math
 
 class Projectile:
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'radius', 'color', 'speed', 'life', 'damage',
+                 'vx', 'vy', 'rect')
+
     def __init__(self, x, y, target_x, target_y, speed=10, life=90, color=(255,220,100), radius=6, damage=1):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, target_x, target_y, speed, life, color, radius, damage)
+
+    def reset(self, x, y, target_x, target_y, speed=10, life=90, color=(255,220,100), radius=6, damage=1):
+        """(Re)initialise in place, reusing the Rect; lets ObjectPool recycle projectiles."""
         self.x = float(x)
         self.y = float(y)
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.radius = radius
         self.color = color
         self.speed = speed
@@ -16,20 +26,33 @@ class Projectile:
         dist = math.hypot(dx, dy) or 1.0
         self.vx = dx / dist * speed
         self.vy = dy / dist * speed
+        self.rect.size = (radius*2, radius*2)
+        self.sync_rect()
 
-    @property
-    def rect(self):
-        return pygame.Rect(int(self.x - self.radius), int(self.y - self.radius),
-                           self.radius*2, self.radius*2)
+    def sync_rect(self):
+        """Update the persistent rect after x / y change."""
+        self.rect.topleft = (int(self.x - self.radius), int(self.y - self.radius))
 
     def update(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.vx
         self.y += self.vy
         self.life -= 1
+        self.sync_rect()
+
+    def bounds(self, alpha=1.0):
+        """Screen rect draw() touches at this interpolation alpha."""
+        x = int(self.prev_x + (self.x - self.prev_x) * alpha)
+        y = int(self.prev_y + (self.y - self.prev_y) * alpha)
+        r = self.radius
+        return pygame.Rect(x - r - 1, y - r - 1, r*2 + 3, r*2 + 3)
 
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         try:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            y = self.prev_y + (self.y - self.prev_y) * alpha
+            pygame.draw.circle(surface, self.color, (int(x), int(y)), self.radius)
         except Exception:
             pass
 # ...new file...
\ No newline at end of file
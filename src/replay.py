@@ -0,0 +1,148 @@
+"""Input recording and deterministic playback.
+
+A run is fully determined by its seed, its difficulty and the InputState fed
+to each Game.step(), so that is all a replay stores. The file is a fixed
+header followed by one 5-byte record per tick:
+
+    header  magic 'LRRP', version, difficulty index, seed, ticks, final score, orbs
+    record  packed move / fire bits, mouse x, mouse y
+
+The final score and orb count in the header let playback check that it
+reproduced the run exactly. Played back headless with drawing off, a replay
+runs as fast as the simulation allows, which makes recorded sessions the most
+realistic workloads for profiling.
+"""
+import os
+import time
+import struct
+from inputs import InputState
+from game import STATE_PLAYING
+
+MAGIC = b'LRRP'
+# bumped whenever the simulation changes, since old inputs no longer reproduce old runs
+VERSION = 3
+HEADER = struct.Struct('<4sBBIIII')
+RECORD = struct.Struct('<BHH')
+
+
+def pack_inputs(inputs):
+    """InputState -> one record: bits 0-1 move_x + 1, bits 2-3 move_y + 1, bit 4 fire."""
+    bits = (inputs.move_x + 1) | ((inputs.move_y + 1) << 2) | (0x10 if inputs.fire else 0)
+    return RECORD.pack(bits, max(0, min(0xFFFF, int(inputs.mouse_x))),
+                       max(0, min(0xFFFF, int(inputs.mouse_y))))
+
+
+def unpack_inputs(bits, mouse_x, mouse_y):
+    return InputState((bits & 3) - 1, ((bits >> 2) & 3) - 1, bool(bits & 0x10), mouse_x, mouse_y)
+
+
+class Replay:
+    """One recorded run: seed, difficulty, per-tick inputs and its outcome."""
+    def __init__(self, seed, difficulty, records=b'', score=0, orbs=0):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.records = bytearray(records)
+        self.score = score
+        self.orbs = orbs
+
+    def __len__(self):
+        return len(self.records) // RECORD.size
+
+    def append(self, inputs):
+        self.records += pack_inputs(inputs)
+
+    def inputs(self):
+        """InputState per recorded tick, in order."""
+        for bits, mx, my in RECORD.iter_unpack(self.records):
+            yield unpack_inputs(bits, mx, my)
+
+    def to_bytes(self):
+        return HEADER.pack(MAGIC, VERSION, self.difficulty, self.seed, len(self), self.score,
+                           self.orbs) + bytes(self.records)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, difficulty, seed, ticks, score, orbs = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a LightRunner replay (or an unsupported version)")
+        records = data[HEADER.size:HEADER.size + ticks * RECORD.size]
+        if len(records) != ticks * RECORD.size:
+            raise ValueError("replay is truncated")
+        return cls(seed, difficulty, records, score, orbs)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Attach as game.recorder: Game.reset() starts a recording, every step()
+    appends its inputs and leaving the playing state writes the run to
+    `directory` as run-<date>-<time>-<pid>-<n>.lrr.
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.current = None
+        self.last_path = None
+        # runs saved so far; keeps two runs ending in the same second apart
+        self._seq = 0
+
+    def begin(self, seed, difficulty):
+        self.current = Replay(seed, difficulty)
+
+    def record(self, inputs):
+        if self.current is not None:
+            self.current.append(inputs)
+
+    def finish(self, game):
+        """Write the current recording (if any ticks were played) and stop."""
+        rep, self.current = self.current, None
+        if rep is None or not len(rep):
+            return None
+        rep.score = int(game.score)
+        rep.orbs = int(game.orbs_collected)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._seq += 1
+            name = f"run-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{self._seq:03d}.lrr"
+            path = os.path.join(self.directory, name)
+            rep.save(path)
+            self.last_path = path
+            return path
+        except Exception as e:
+            print("⚠️ Replay save issue:", e)
+            return None
+
+
+def play(game, replay, draw=False):
+    """Run `replay` through `game` as fast as possible. Returns (elapsed seconds,
+    ticks played, matched) where matched says whether the final score and orb
+    count equal the recorded ones. High scores are not saved during playback.
+    """
+    game.finish_loading()
+    game.scores.path = None
+    game.difficulty_index = replay.difficulty
+    game.apply_difficulty_settings()
+    game.reset(seed=replay.seed)
+    game.game_state = STATE_PLAYING
+    prof = game.profiler
+    ticks = 0
+    start = time.perf_counter()
+    prof.begin_frame()
+    for inputs in replay.inputs():
+        if game.game_state != STATE_PLAYING:
+            break
+        game.step(inputs)
+        if draw:
+            game.draw()
+        prof.end_frame(game.entity_counts())
+        ticks += 1
+    elapsed = time.perf_counter() - start
+    matched = (ticks == len(replay) and game.score == replay.score
+               and game.orbs_collected == replay.orbs)
+    return elapsed, ticks, matched
@@ -0,0 +1,57 @@
+"""Uniform-grid spatial hash used as a collision broadphase.
+
+Entities are bucketed by the grid cells their rect overlaps. A query returns
+every entity sharing a cell with the query rect (a superset of the real hits,
+so callers still run colliderect), in insertion order so results match a
+brute-force scan of the original lists.
+"""
+
+
+class SpatialHash:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+
+    def clear(self):
+        self._cells.clear()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, (rect.right - 1) // cs,
+                rect.top // cs, (rect.bottom - 1) // cs)
+
+    def insert(self, obj, rect, kind=None):
+        """Bucket obj under every cell rect touches; kind lets queries filter by layer."""
+        entry = (self._count, kind, obj)
+        self._count += 1
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def query(self, rect, kind=None):
+        """Candidates whose cells overlap rect (optionally only of `kind`), in insertion order."""
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self._cells
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for entry in bucket:
+                    if kind is None or entry[1] == kind:
+                        found[entry[0]] = entry[2]
+        if len(found) > 1:
+            return [found[k] for k in sorted(found)]
+        return list(found.values())
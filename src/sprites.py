@@ -0,0 +1,78 @@
+"""Lazily filled sprite atlas for obstacle / enemy bodies and health bars.
+
+Bodies come from a small range of sizes and a fixed palette, and a health bar
+only has as many looks as it has pixels of fill, so each (kind, w, h, colour)
+body and each (width, filled pixels, colour) bar strip is rasterised once and
+drawn afterwards with a single blit. Returned surfaces are shared: blit them,
+never draw onto them.
+"""
+import pygame
+
+HEALTH_BAR_H = 6
+# gap between the top of an entity and the bottom of its health bar
+HEALTH_BAR_GAP = 6
+HEALTH_BAR_BG = (30, 30, 30)
+
+
+def _finish(surface, alpha):
+    """Convert to the display format when a display mode is set."""
+    try:
+        return surface.convert_alpha() if alpha else surface.convert()
+    except pygame.error:
+        return surface
+
+
+class SpriteAtlas:
+    # body kind -> corner radius (0 = plain opaque rect)
+    RADII = {'obstacle': 0, 'enemy': 6}
+
+    def __init__(self):
+        self._bodies = {}
+        self._bars = {}
+        self.hits = 0
+        self.misses = 0
+
+    def body(self, kind, w, h, color):
+        """Sprite of a w x h body of `kind` in `color`."""
+        key = (kind, w, h, tuple(color))
+        sprite = self._bodies.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        radius = self.RADII.get(kind, 0)
+        if radius:
+            sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, key[3], (0, 0, w, h), border_radius=radius)
+        else:
+            sprite = pygame.Surface((w, h))
+            sprite.fill(key[3])
+        sprite = _finish(sprite, radius > 0)
+        self._bodies[key] = sprite
+        return sprite
+
+    def health_bar(self, width, fill_w, color):
+        """Strip of a `width` px health bar with `fill_w` px filled in `color`."""
+        fill_w = max(0, min(width, fill_w))
+        key = (width, fill_w, tuple(color))
+        sprite = self._bars.get(key)
+        if sprite is not None:
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = pygame.Surface((width, HEALTH_BAR_H), pygame.SRCALPHA)
+        pygame.draw.rect(sprite, HEALTH_BAR_BG, (0, 0, width, HEALTH_BAR_H), border_radius=3)
+        pygame.draw.rect(sprite, key[2], (0, 0, fill_w, HEALTH_BAR_H), border_radius=3)
+        sprite = _finish(sprite, True)
+        self._bars[key] = sprite
+        return sprite
+
+    def clear(self):
+        self._bodies.clear()
+        self._bars.clear()
+
+    def __len__(self):
+        return len(self._bodies) + len(self._bars)
+
+
+atlas = SpriteAtlas()
@@ -0,0 +1,57 @@
+"""Cold-start helpers: selective pygame initialisation and a startup timer.
+
+pygame.init() brings up every pygame module (joystick, camera, etc.); the
+game only needs the display (which covers events, keyboard and mouse), font
+and mixer, so those are the only ones initialised. StartupTimer splits the
+time from process start to first frame into phases for `--startup-report`.
+"""
+import time
+import pygame
+
+# cold-start target from launch to the first presented frame
+STARTUP_BUDGET_MS = 1000.0
+
+
+def init_subsystems():
+    """Initialise display, font and (when an audio device is available) mixer."""
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print("⚠️ Audio init issue:", e)
+
+
+class StartupTimer:
+    """Back-to-back phases since `start` (a time.perf_counter() value), plus
+    point-in-time milestones for work that overlaps them (background loading)."""
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.phases = []
+        self.marks = {}
+
+    def phase(self, name):
+        """Close phase `name`: charge it the time since the previous phase."""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    def mark(self, name):
+        """Record when `name` happened (ms since start); only the first call counts."""
+        self.marks.setdefault(name, (time.perf_counter() - self.start) * 1000.0)
+
+    @property
+    def total_ms(self):
+        return sum(ms for _, ms in self.phases)
+
+    def report(self, budget_ms=STARTUP_BUDGET_MS):
+        lines = ["startup (ms since main.py started)"]
+        for name, ms in self.phases:
+            lines.append(f"  {name:<16}{ms:9.1f}")
+        total = self.total_ms
+        verdict = "within" if total <= budget_ms else "OVER"
+        lines.append(f"  {'total':<16}{total:9.1f}   {verdict} budget of {budget_ms:.0f} ms")
+        for name, at in self.marks.items():
+            lines.append(f"  {name + ' at':<16}{at:9.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,127 @@
+"""Per-run gameplay and performance telemetry.
+
+RunStats holds one run's counters: spawns, pickups by kind, damage taken,
+an energy sample per second and a frame-time histogram. Game keeps them up
+to date whether or not telemetry is on; the counters cost a few dict
+increments per event.
+
+TelemetryWriter is optional (`--telemetry DIR`). emit() only timestamps the
+event and puts it on a queue, so the frame thread never touches a file. A
+background thread batches events, serialises them as JSON lines and appends
+each batch as a gzip member. Members are complete on their own, so a file cut
+short by a crash still decompresses up to the last batch. Files rotate at
+`max_bytes` and only the newest `max_files` are kept.
+tools/telemetry_summary.py aggregates them.
+"""
+import os
+import gzip
+import json
+import time
+import queue
+import bisect
+import platform
+import threading
+from collections import Counter
+
+# upper edges (ms) of the frame-time histogram buckets; the last bucket is open-ended
+FRAME_BUCKETS_MS = (4, 8, 12, 16.7, 20, 25, 33.3, 50, 100)
+
+
+class RunStats:
+    def __init__(self):
+        self.spawns = Counter()
+        self.pickups = Counter()
+        self.damage_taken = 0
+        # player energy once per simulated second
+        self.energy = []
+        self.frame_hist = [0] * (len(FRAME_BUCKETS_MS) + 1)
+
+    def add_frame(self, ms):
+        self.frame_hist[bisect.bisect_left(FRAME_BUCKETS_MS, ms)] += 1
+
+    def summary(self):
+        return {'spawns': dict(self.spawns), 'pickups': dict(self.pickups),
+                'damage_taken': self.damage_taken, 'energy': list(self.energy),
+                'frame_hist': list(self.frame_hist)}
+
+
+class TelemetryWriter:
+    _STOP = object()
+
+    def __init__(self, directory, max_bytes=1 << 20, max_files=50, batch_size=256, interval=2.0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.batch_size = batch_size
+        self.interval = interval
+        self.written = 0
+        self._queue = queue.SimpleQueue()
+        self._path = None
+        self._seq = 0
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+        self.emit('session', machine=platform.node(), platform=platform.platform(),
+                  python=platform.python_version(), pid=os.getpid())
+
+    def emit(self, kind, **fields):
+        """Queue one event (frame thread: no I/O, no serialisation)."""
+        self._queue.put((kind, time.time(), fields))
+
+    def close(self):
+        """Write everything queued so far and stop the worker."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is self._STOP:
+                self._write(batch)
+                return
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.interval
+
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            lines = [json.dumps(dict(fields, event=kind, ts=round(ts, 3)), separators=(',', ':'))
+                     for kind, ts, fields in batch]
+            data = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+            path = self._current_path(len(data))
+            with open(path, "ab") as f:
+                f.write(data)
+            self.written += len(batch)
+        except Exception as e:
+            print("⚠️ Telemetry write issue:", e)
+
+    def _current_path(self, incoming):
+        """File to append `incoming` bytes to, starting a new one past max_bytes."""
+        if (self._path is None or not os.path.exists(self._path)
+                or os.path.getsize(self._path) + incoming > self.max_bytes):
+            os.makedirs(self.directory, exist_ok=True)
+            self._seq += 1
+            name = f"telemetry-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{self._seq:03d}.jsonl.gz"
+            self._path = os.path.join(self.directory, name)
+            self._prune()
+        return self._path
+
+    def _prune(self):
+        """Drop the oldest files beyond max_files (names sort by creation time)."""
+        files = sorted(f for f in os.listdir(self.directory)
+                       if f.startswith("telemetry-") and f.endswith(".jsonl.gz"))
+        for name in files[:max(0, len(files) - self.max_files + 1)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
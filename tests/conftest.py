@@ -0,0 +1,31 @@
+"""Shared pytest setup: the game modules live flat in src/, and everything runs
+on SDL's dummy video / audio drivers so no window or sound device is needed."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture(scope="session")
+def screen():
+    import headless
+    return headless.init_headless()
+
+
+@pytest.fixture
+def make_game(screen):
+    """Factory for Games that never touch the real high-score file."""
+    from game import Game
+
+    def make():
+        game = Game(screen)
+        game.scores.path = None
+        game.finish_loading()
+        return game
+    return make
@@ -0,0 +1,102 @@
+import random
+
+import numpy as np
+import pygame
+
+from dirty import DirtyTiles
+from game import STATE_PLAYING
+
+WIDTH, HEIGHT, TILE = 800, 600, 32   # 600 isn't a multiple of 32: the last row is partial
+
+
+def expected_grid(tiles, rects):
+    """Brute force: a tile is marked if the on-screen part of any rect overlaps it."""
+    grid = np.zeros((tiles.rows, tiles.cols), dtype=np.bool_)
+    rects = [r.clip(0, 0, WIDTH, HEIGHT) for r in rects]
+    for row in range(tiles.rows):
+        for col in range(tiles.cols):
+            tile = pygame.Rect(col * TILE, row * TILE, TILE, TILE)
+            grid[row, col] = any(tile.colliderect(r) for r in rects)
+    return grid
+
+
+def random_rect(rng):
+    # snapped to tile edges half the time so boundaries get exercised
+    if rng.random() < 0.5:
+        return pygame.Rect(rng.randint(-3, 27) * TILE + rng.choice((-1, 0, 1)),
+                           rng.randint(-3, 21) * TILE + rng.choice((-1, 0, 1)),
+                           max(0, rng.randint(0, 4) * TILE + rng.choice((-1, 0, 1))),
+                           max(0, rng.randint(0, 4) * TILE + rng.choice((-1, 0, 1))))
+    return pygame.Rect(rng.randint(-200, 900), rng.randint(-200, 700), rng.randint(0, 150), rng.randint(0, 150))
+
+
+def test_tile_boundaries():
+    tiles = DirtyTiles(WIDTH, HEIGHT, TILE)
+    tiles.add(pygame.Rect(TILE, TILE, TILE, TILE))
+    assert np.count_nonzero(tiles.grid) == 1 and tiles.grid[1, 1]
+    assert tiles.touches(pygame.Rect(2 * TILE - 1, TILE, 1, 1))
+    assert not tiles.touches(pygame.Rect(2 * TILE, TILE, 5, 5))
+    assert not tiles.touches(pygame.Rect(0, 0, TILE, TILE))
+    tiles.clear()
+    # one pixel either side of a tile edge spans both tiles
+    tiles.add(pygame.Rect(TILE - 1, 0, 2, 1))
+    assert tiles.grid[0, :3].tolist() == [True, True, False]
+    tiles.clear()
+    tiles.add(pygame.Rect(10, 10, 0, 50))
+    assert not tiles.grid.any()
+
+
+def test_off_screen_rects():
+    tiles = DirtyTiles(WIDTH, HEIGHT, TILE)
+    off = [pygame.Rect(-50, 10, 50, 50), pygame.Rect(WIDTH, 10, 40, 40),
+           pygame.Rect(10, -40, 40, 40), pygame.Rect(10, HEIGHT + 5, 40, 40)]
+    for r in off:
+        tiles.add(r)
+        assert not tiles.touches(r)
+    tiles.add_all(off)
+    assert not tiles.grid.any() and tiles.rects() == []
+    # partly on screen: only the visible part counts, and rects() stays on screen
+    tiles.add(pygame.Rect(WIDTH - 10, HEIGHT - 10, 100, 100))
+    assert tiles.rects() == [pygame.Rect(WIDTH - TILE, (tiles.rows - 1) * TILE, TILE, HEIGHT % TILE)]
+
+
+def test_matches_brute_force():
+    rng = random.Random(5)
+    tiles = DirtyTiles(WIDTH, HEIGHT, TILE)
+    screen = pygame.Rect(0, 0, WIDTH, HEIGHT)
+    for _ in range(200):
+        rects = [random_rect(rng) for _ in range(rng.randint(0, 12))]
+        tiles.clear()
+        tiles.add_all(rects)
+        grid = expected_grid(tiles, rects)
+        assert (tiles.grid == grid).all()
+        tiles.clear()
+        for r in rects:
+            tiles.add(r)
+        assert (tiles.grid == grid).all()
+        assert tiles.coverage() == np.count_nonzero(grid) / grid.size
+        # rects(): on screen, disjoint, and covering exactly the marked tiles
+        out = tiles.rects()
+        assert all(screen.contains(r) for r in out)
+        assert all(not a.colliderect(b) for i, a in enumerate(out) for b in out[i + 1:])
+        covered = DirtyTiles(WIDTH, HEIGHT, TILE)
+        covered.add_all(out)
+        assert (covered.grid == grid).all()
+        probe = random_rect(rng)
+        assert tiles.touches(probe) == bool((grid & expected_grid(tiles, [probe])).any())
+
+
+def test_full_repaint_fallback(make_game):
+    game = make_game()
+    game.reset()
+    game.game_state = STATE_PLAYING
+    game.dirty_rects_enabled = True
+    # nothing to diff against on the first frame, then partial updates
+    assert game.draw_dirty() is None
+    assert isinstance(game.draw_dirty(), list)
+    game.invalidate_frame()
+    assert game.draw_dirty() is None
+    assert isinstance(game.draw_dirty(), list)
+    # more than DIRTY_FULL_FRACTION of the screen changed: repaint everything
+    game.draw_bounds = lambda alpha=1.0: [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+    assert game.draw_dirty() is None
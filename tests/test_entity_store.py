@@ -0,0 +1,137 @@
+import math
+import random
+
+import numpy as np
+import pygame
+
+from entity_store import (EntityStore, separation, crowd_push, PAIRWISE_MAX,
+                          SEPARATION_RADIUS, SEPARATION_WEIGHT)
+from obstacle import Obstacle, Enemy
+from player import Player
+
+
+def test_slot_reuse_and_size_shrink():
+    store = EntityStore(capacity=2)
+    a, b, c = (Obstacle(store=store) for _ in range(3))
+    assert store.capacity == 4 and store.size == 3 and len(store) == 3
+    b.detach()
+    # size is a high-water mark: a hole in the middle doesn't shrink it
+    assert store.size == 3 and len(store) == 2
+    d = Obstacle(store=store)
+    assert d.slot == 1
+    c.detach()
+    d.detach()
+    assert store.size == 1
+    a.detach()
+    assert store.size == 0 and len(store) == 0
+
+
+def run_sequence(seed, steps=300):
+    """Random spawns, removals and advances; yields (store, live views in spawn order, rng)."""
+    rng = random.Random(seed)
+    store = EntityStore(capacity=4)
+    player = Player(400, 300)
+    live = []
+    for _ in range(steps):
+        op = rng.random()
+        if op < 0.25:
+            live.append(Obstacle(speed=rng.choice((2, 3.5, 4)), store=store, rng=rng))
+        elif op < 0.45:
+            live.append(Enemy(speed=rng.uniform(0.3, 3.0), player=player, store=store, rng=rng))
+        elif op < 0.6 and live:
+            live.pop(rng.randrange(len(live))).detach()
+        else:
+            player.x, player.y = rng.randint(0, 750), rng.randint(0, 550)
+            store.advance((player.x + 25, player.y + 25) if rng.random() < 0.9 else None)
+        yield store, live, rng
+
+
+def test_rects_follow_floored_positions():
+    for store, live, _ in run_sequence(1):
+        for view in live:
+            x, y = view.position
+            assert view.rect.topleft == (math.floor(x), math.floor(y))
+
+
+def test_overlapping_matches_colliderect():
+    for store, live, rng in run_sequence(2):
+        assert len(store) == len(live)
+        queries = [pygame.Rect(rng.randint(-100, 800), rng.randint(-100, 600),
+                               rng.randint(1, 300), rng.randint(1, 300))]
+        if live:
+            # boxes just touching / just overlapping a view's edges, where sub-pixel
+            # positions would disagree with the floored Rect
+            r = rng.choice(live).rect
+            queries += [pygame.Rect(r.right, r.y, 5, 5), pygame.Rect(r.right - 1, r.y, 5, 5),
+                        pygame.Rect(r.x - 5, r.y, 5, 5), pygame.Rect(r.x, r.bottom, 5, 5),
+                        pygame.Rect(r.x, r.y - 5, 5, 5), pygame.Rect(r.x, r.bottom - 1, 5, 5)]
+        for query in queries:
+            assert store.overlapping(query) == [v for v in live if v.rect.colliderect(query)]
+
+
+def test_outside_matches_rects():
+    left, top, right, bottom = -50, -50, 850, 650
+    for store, live, _ in run_sequence(3):
+        expected = [v for v in live if v.rect.right < left or v.rect.x > right
+                    or v.rect.y > bottom or v.rect.bottom < top]
+        assert store.outside(left, top, right, bottom) == expected
+
+
+def test_caches_follow_add_and_remove():
+    store = EntityStore()
+    player = Player(400, 300)
+    target = (425, 325)
+    first = Enemy(player=player, store=store)
+    store.advance(target)
+    # added after the live / chaser lists were cached: must still be moved and synced
+    second = Enemy(player=player, store=store)
+    start = second.position
+    store.advance(target)
+    assert second.position != start
+    assert second.rect.topleft == tuple(math.floor(v) for v in second.position)
+    # a removed view's Rect is no longer written to
+    first.detach()
+    frozen = first.rect.copy()
+    store.advance(target)
+    assert first.rect == frozen
+    assert list(store._chasers) == [second.slot]
+
+
+def test_crowd_push_matches_pairwise_for_isolated_pairs():
+    rng = random.Random(4)
+    radius = SEPARATION_RADIUS
+    # PAIRWISE_MAX // 2 + 5 pairs, each well outside the others' 3x3 block of cells
+    cx, cy = [], []
+    for i in range(PAIRWISE_MAX // 2 + 5):
+        x, y = (i % 8) * 5 * radius + rng.uniform(0, radius), (i // 8) * 5 * radius + rng.uniform(0, radius)
+        angle, d = rng.uniform(0, 2 * math.pi), rng.uniform(1, radius - 1)
+        cx += [x, x + d * math.cos(angle)]
+        cy += [y, y + d * math.sin(angle)]
+    cx, cy = np.array(cx), np.array(cy)
+    assert len(cx) > PAIRWISE_MAX
+    crowd = crowd_push(cx, cy)
+    for i in range(0, len(cx), 2):
+        pair = separation(cx[i:i + 2], cy[i:i + 2])
+        assert np.allclose(crowd[:, i:i + 2], pair)
+    # and the pairwise result itself: equal and opposite, (1 - d/radius) * weight long
+    px, py = separation(np.array([0.0, 30.0]), np.array([0.0, 0.0]))
+    assert np.allclose(px, [-0.25 * SEPARATION_WEIGHT, 0.25 * SEPARATION_WEIGHT]) and np.allclose(py, 0)
+
+
+def test_push_recomputed_after_add_and_remove():
+    store = EntityStore()
+    player = Player(400, 300)
+    target = (425, 325)
+    first = Enemy(player=player, store=store)
+    first.position = (100.0, 100.0)
+    store.advance(target)
+    assert store._push is None
+    # mid-interval: a chaser arriving next to the first is pushed on its first tick
+    second = Enemy(player=player, store=store)
+    second.position = (110.0, 100.0)
+    store.advance(target)
+    assert store._push is not None and store._push[0][0] < 0 < store._push[0][1]
+    # and once it's gone, the remaining chaser is no longer pushed by it
+    second.detach()
+    store.advance(target)
+    assert store._push is None
@@ -0,0 +1,100 @@
+import os
+import json
+
+import pytest
+
+from game import Game
+from persistence import ScoreStore, FORMAT_VERSION
+
+
+def test_run_counters_exist_before_first_reset(screen):
+    game = Game(screen)
+    game.scores.path = None
+    game.finish_loading()
+    assert game.kills == 0
+    assert game.run_summary()['kills'] == 0
+    game.record_run()
+
+
+def written(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_ranking_and_trimming(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.json"), top_n=3)
+    assert store.record("Normal", 100) == 1
+    assert store.record("Normal", 300) == 1
+    assert store.record("Normal", 200) == 2
+    # a tie ranks below the run that got there first
+    assert store.record("Normal", 200) == 3
+    assert [e["score"] for e in store.leaderboard("Normal")] == [300, 200, 200]
+    # off the board once it's full
+    assert store.record("Normal", 150) is None
+    assert store.record("Normal", 250) == 2
+    assert [e["score"] for e in store.leaderboard("Normal")] == [300, 250, 200]
+    # boards are per difficulty; the high score is the best of any
+    assert store.record("Hard", 500, orbs=3, kills=2, duration=12.345) == 1
+    assert [e["score"] for e in store.leaderboard("Normal")] == [300, 250, 200]
+    assert store.high_score == 500
+    hard = store.leaderboard("Hard")[0]
+    assert (hard["orbs"], hard["kills"], hard["duration"]) == (3, 2, 12.35)
+    # leaderboard() hands out copies
+    store.leaderboard("Hard")[0]["score"] = 0
+    assert store.high_score == 500
+    store.flush()
+
+
+def test_flush_writes_atomically(tmp_path):
+    path = str(tmp_path / "scores.json")
+    store = ScoreStore(path)
+    for score in range(1, 31):
+        store.record("Easy", score)
+    store.flush()
+    data = written(path)
+    assert data["version"] == FORMAT_VERSION and data["high_score"] == 30
+    assert [e["score"] for e in data["leaderboards"]["Easy"]] == list(range(30, 20, -1))
+    # no temporary files left behind, and a fresh store reads the same board back
+    assert os.listdir(tmp_path) == ["scores.json"]
+    assert ScoreStore(path).leaderboard("Easy") == store.leaderboard("Easy")
+
+
+def test_in_memory_store_never_writes(tmp_path):
+    store = ScoreStore(None)
+    assert store.record("Normal", 10) == 1
+    store.flush()
+    assert store.high_score == 10 and store._worker is None
+
+
+def test_legacy_file(tmp_path):
+    path = tmp_path / "scores.json"
+    path.write_text('{"high_score": 450}', encoding="utf-8")
+    store = ScoreStore(str(path))
+    assert store.high_score == 450 and store.leaderboard("Normal") == []
+    store.record("Normal", 100)
+    store.flush()
+    # older versions keep seeing the best score
+    assert written(path)["high_score"] == 450
+
+
+@pytest.mark.parametrize("text", ["", "not json", '{"high_score": 120, "leaderboards": {"Normal": [{"sco',
+                                  '{"high_score": "lots"}', "[1, 2, 3]"])
+def test_corrupt_or_partial_file(tmp_path, capsys, text):
+    path = tmp_path / "scores.json"
+    path.write_text(text, encoding="utf-8")
+    store = ScoreStore(str(path))
+    assert store.high_score == 0 and store.leaderboard("Normal") == []
+    assert "High score load issue" in capsys.readouterr().out
+    # the next run replaces it with a valid file
+    assert store.record("Normal", 70) == 1
+    store.flush()
+    assert written(path)["leaderboards"]["Normal"][0]["score"] == 70
+
+
+def test_malformed_entries_are_skipped(tmp_path):
+    path = tmp_path / "scores.json"
+    path.write_text(json.dumps({"version": 2, "high_score": 90, "leaderboards": {
+        "Normal": [{"score": 40}, "junk", {"orbs": 3}, {"score": "90", "kills": 1}]}}), encoding="utf-8")
+    store = ScoreStore(str(path))
+    assert [e["score"] for e in store.leaderboard("Normal")] == [90, 40]
+    assert store.high_score == 90
@@ -0,0 +1,124 @@
+import random
+import struct
+
+import pytest
+
+import replay
+from game import STATE_PLAYING
+from inputs import InputState
+from replay import Replay, ReplayRecorder, play, pack_inputs, HEADER, RECORD
+
+
+def random_inputs(rng):
+    return InputState(rng.choice((-1, 0, 1)), rng.choice((-1, 0, 1)), rng.random() < 0.7,
+                      rng.randint(0, 799), rng.randint(0, 599))
+
+
+def record_runs(game, directory, runs, ticks, seed=7):
+    """Play `runs` runs back to back on one Game, each cut short after `ticks` ticks
+    (with shots still in flight) or ended by death; returns the saved replay paths."""
+    game.recorder = ReplayRecorder(directory)
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(runs):
+        game.reset()
+        game.game_state = STATE_PLAYING
+        for _ in range(ticks):
+            if game.game_state != STATE_PLAYING:
+                break
+            game.step(random_inputs(rng))
+        game.recorder.finish(game)
+        paths.append(game.recorder.last_path)
+    game.recorder = None
+    return paths
+
+
+def test_back_to_back_runs_replay_identically(make_game, tmp_path):
+    paths = record_runs(make_game(), tmp_path, runs=3, ticks=400)
+    assert len(set(paths)) == 3
+    shared = make_game()
+    for path in paths:
+        rep = Replay.load(path)
+        # on a fresh Game and on one that has already played the earlier replays
+        for replayer in (make_game(), shared):
+            _, ticks, matched = play(replayer, rep)
+            assert matched, f"{path}: diverged after {ticks}/{len(rep)} ticks"
+
+
+def digest(game):
+    return (game.score, game.orbs_collected, game.shoot_cooldown,
+            [(p.x, p.y) for p in game.projectiles],
+            [tuple(ob.rect) for ob in game.obstacles], (game.player.x, game.player.y))
+
+
+def test_second_run_matches_a_fresh_game(make_game, tmp_path):
+    """A run started on a Game that already played one evolves exactly like the
+    same seed and inputs on a brand-new Game."""
+    used, fresh = make_game(), make_game()
+    record_runs(used, tmp_path, runs=1, ticks=200)
+    rng = random.Random(3)
+    for game in (used, fresh):
+        game.reset(seed=1234)
+        game.game_state = STATE_PLAYING
+    for tick in range(300):
+        inputs = random_inputs(rng)
+        used.step(inputs)
+        fresh.step(inputs)
+        assert digest(used) == digest(fresh), f"diverged at tick {tick}"
+
+
+def test_reset_clears_shots_and_cooldown(make_game):
+    game = make_game()
+    game.reset()
+    game.game_state = STATE_PLAYING
+    for _ in range(30):
+        game.step(InputState(0, 0, True, 0, 0))
+    assert game.projectiles
+    game.reset()
+    assert game.projectiles == []
+    assert game.shoot_cooldown == 0
+
+
+def test_record_layout():
+    assert HEADER.size == 22
+    assert RECORD.size == 5
+    assert pack_inputs(InputState(1, -1, True, 799, 0)) == struct.pack('<BHH', 2 | 0 | 0x10, 799, 0)
+
+
+def test_inputs_round_trip():
+    rng = random.Random(1)
+    states = [random_inputs(rng) for _ in range(200)]
+    states.append(InputState(0, 0, False, -5, 70000))
+    rep = Replay(seed=0xDEADBEEF, difficulty=2, score=12345, orbs=6)
+    for inputs in states:
+        rep.append(inputs)
+    back = Replay.from_bytes(rep.to_bytes())
+    assert (back.seed, back.difficulty, back.score, back.orbs) == (0xDEADBEEF, 2, 12345, 6)
+    assert len(back) == len(states)
+    got = list(back.inputs())
+    for want, have in zip(states[:-1], got):
+        assert (have.move_x, have.move_y, have.fire, have.mouse_x, have.mouse_y) == \
+            (want.move_x, want.move_y, want.fire, want.mouse_x, want.mouse_y)
+    # mouse coordinates are clamped to the 16-bit record fields
+    assert (got[-1].mouse_x, got[-1].mouse_y) == (0, 0xFFFF)
+
+
+def test_save_and_load(tmp_path):
+    rep = Replay(seed=5, difficulty=1, score=9, orbs=1)
+    rep.append(InputState(-1, 1, False, 10, 20))
+    path = tmp_path / "run.lrr"
+    rep.save(path)
+    assert Replay.load(path).to_bytes() == rep.to_bytes()
+
+
+def test_rejects_other_versions_and_bad_data():
+    data = bytearray(Replay(seed=1, difficulty=0).to_bytes())
+    data[4] = replay.VERSION - 1
+    with pytest.raises(ValueError):
+        Replay.from_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b'XXXX' + bytes(data[4:]))
+    rep = Replay(seed=1, difficulty=0)
+    rep.append(InputState(0, 0, True, 1, 1))
+    with pytest.raises(ValueError, match="truncated"):
+        Replay.from_bytes(rep.to_bytes()[:-1])
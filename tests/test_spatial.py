@@ -0,0 +1,50 @@
+import random
+
+import pygame
+
+from spatial import SpatialHash
+
+
+def random_rect(rng):
+    # negative coordinates and sizes that span several 64 px cells
+    return pygame.Rect(rng.randint(-300, 900), rng.randint(-300, 700),
+                       rng.randint(1, 200), rng.randint(1, 200))
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(42)
+    grid = SpatialHash(cell_size=64)
+    entries = []
+    for i in range(300):
+        rect = random_rect(rng)
+        kind = rng.choice(('obstacle', 'powerup'))
+        grid.insert(i, rect, kind)
+        entries.append((i, rect, kind))
+    assert len(grid) == 300
+    for _ in range(300):
+        query = random_rect(rng)
+        for kind in (None, 'obstacle', 'powerup'):
+            candidates = grid.query(query, kind)
+            # insertion order, no duplicates even when an entry spans many cells
+            assert candidates == sorted(set(candidates))
+            hits = [i for i in candidates if entries[i][1].colliderect(query)]
+            expected = [i for i, rect, k in entries
+                        if (kind is None or k == kind) and rect.colliderect(query)]
+            assert hits == expected
+
+
+def test_cell_edges_are_exclusive():
+    grid = SpatialHash(cell_size=64)
+    grid.insert('a', pygame.Rect(0, 0, 64, 64))
+    # starts exactly where 'a' ends: a different cell
+    assert grid.query(pygame.Rect(64, 0, 10, 10)) == []
+    assert grid.query(pygame.Rect(63, 63, 1, 1)) == ['a']
+    assert grid.query(pygame.Rect(-1, -1, 1, 1)) == []
+
+
+def test_clear():
+    grid = SpatialHash()
+    grid.insert('a', pygame.Rect(-100, -100, 300, 300))
+    grid.clear()
+    assert len(grid) == 0
+    assert grid.query(pygame.Rect(0, 0, 10, 10)) == []
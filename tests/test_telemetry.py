@@ -0,0 +1,24 @@
+from game import STATE_PLAYING
+from inputs import InputState
+from telemetry import RunStats, FRAME_BUCKETS_MS
+
+
+def test_frame_histogram_buckets():
+    stats = RunStats()
+    for ms in (1, 4, 4.1, 16.7, 17, 1000):
+        stats.add_frame(ms)
+    hist = stats.summary()['frame_hist']
+    assert len(hist) == len(FRAME_BUCKETS_MS) + 1
+    # bucket edges are inclusive upper bounds; the last bucket is open-ended
+    assert hist[0] == 2 and hist[1] == 1 and hist[3] == 1 and hist[4] == 1 and hist[-1] == 1
+
+
+def test_abandoned_run_summary_has_no_stale_rank(make_game):
+    game = make_game()
+    game.reset()
+    game.game_state = STATE_PLAYING
+    game.step(InputState(0, 0, False, 0, 0))
+    assert game.record_run() == 1
+    assert game.run_summary()['rank'] == 1
+    game.reset()
+    assert game.run_summary()['rank'] is None
@@ -0,0 +1,141 @@
+"""Aggregate LightRunner telemetry files into summary tables.
+
+    python tools/telemetry_summary.py DIR_OR_FILE [...]
+
+Reads every telemetry-*.jsonl.gz under the given directories (or the files
+named), tolerating files cut short by a crash, and prints per-difficulty run
+statistics, pickups by kind, the mean energy curve and the combined
+frame-time histogram. Only needs the standard library.
+"""
+import os
+import sys
+import gzip
+import json
+import zlib
+import argparse
+from collections import Counter, defaultdict
+
+# must match telemetry.FRAME_BUCKETS_MS
+FRAME_BUCKETS_MS = (4, 8, 12, 16.7, 20, 25, 33.3, 50, 100)
+
+
+def telemetry_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.startswith("telemetry-") and name.endswith(".jsonl.gz"):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def read_events(path):
+    """Events of one file; a truncated last batch is skipped with a warning."""
+    events = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    events.append(json.loads(line))
+    except (EOFError, OSError, zlib.error, ValueError) as e:
+        print(f"warning: {path}: stopped early ({e})", file=sys.stderr)
+    return events
+
+
+def summarise(events):
+    runs = defaultdict(list)
+    machines = set()
+    for ev in events:
+        if ev.get('event') == 'session':
+            machines.add(ev.get('machine'))
+        elif ev.get('event') == 'run_end':
+            runs[ev.get('difficulty', '?')].append(ev)
+    return runs, machines
+
+
+def mean(values):
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+def print_table(title, header, rows):
+    print(f"\n{title}")
+    widths = [max(len(str(x)) for x in col) for col in zip(header, *rows)]
+    for row in [header] + rows:
+        print("  " + "  ".join(str(x).rjust(w) if i else str(x).ljust(w)
+                               for i, (x, w) in enumerate(zip(row, widths))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise LightRunner telemetry")
+    parser.add_argument("paths", nargs="+", help="telemetry directories or .jsonl.gz files")
+    parser.add_argument("--energy-seconds", type=int, default=60,
+                        help="length of the mean energy curve to print (default 60)")
+    args = parser.parse_args(argv)
+
+    files = list(telemetry_files(args.paths))
+    events = [ev for path in files for ev in read_events(path)]
+    runs, machines = summarise(events)
+    total = sum(len(r) for r in runs.values())
+    print(f"{len(files)} files, {len(events)} events, {len(machines)} machines, {total} runs")
+    if not total:
+        return 0
+
+    rows = []
+    for difficulty, rs in sorted(runs.items()):
+        spawns = Counter()
+        for r in rs:
+            spawns.update(r.get('spawns', {}))
+        rows.append((difficulty, len(rs),
+                     f"{mean(r.get('score', 0) for r in rs):.0f}",
+                     max(r.get('score', 0) for r in rs),
+                     f"{mean(r.get('ticks', 0) for r in rs) / 60:.1f}",
+                     f"{mean(r.get('kills', 0) for r in rs):.1f}",
+                     f"{mean(r.get('orbs', 0) for r in rs):.1f}",
+                     f"{mean(r.get('damage_taken', 0) for r in rs):.0f}",
+                     f"{spawns['obstacle'] / len(rs):.1f}",
+                     f"{spawns['enemy'] / len(rs):.1f}",
+                     sum(1 for r in rs if r.get('abandoned'))))
+    print_table("runs by difficulty (means per run)",
+                ("difficulty", "runs", "score", "best", "secs", "kills", "orbs", "damage",
+                 "obstacles", "enemies", "abandoned"), rows)
+
+    pickups = Counter()
+    for rs in runs.values():
+        for r in rs:
+            pickups.update(r.get('pickups', {}))
+    if pickups:
+        print_table("pickups by kind", ("kind", "count", "per run"),
+                    [(k, n, f"{n / total:.2f}") for k, n in pickups.most_common()])
+
+    # mean energy at each second, over the runs still alive at that second
+    curve = defaultdict(list)
+    for rs in runs.values():
+        for r in rs:
+            for sec, energy in enumerate(r.get('energy', [])[:args.energy_seconds]):
+                curve[sec + 1].append(energy)
+    if curve:
+        print_table("energy curve", ("second", "runs alive", "mean energy"),
+                    [(sec, len(v), f"{mean(v):.1f}") for sec, v in sorted(curve.items())
+                     if sec == 1 or sec % 5 == 0])
+
+    hist = [0] * (len(FRAME_BUCKETS_MS) + 1)
+    for rs in runs.values():
+        for r in rs:
+            for i, n in enumerate(r.get('frame_hist', [])[:len(hist)]):
+                hist[i] += n
+    frames = sum(hist)
+    if frames:
+        labels = [f"<= {e} ms" for e in FRAME_BUCKETS_MS] + [f"> {FRAME_BUCKETS_MS[-1]} ms"]
+        cumulative = 0
+        rows = []
+        for label, n in zip(labels, hist):
+            cumulative += n
+            rows.append((label, n, f"{100 * n / frames:.1f}%", f"{100 * cumulative / frames:.1f}%"))
+        print_table("frame times (playing)", ("bucket", "frames", "share", "cumulative"), rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())